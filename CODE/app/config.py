@@ -1,15 +1,17 @@
 """Configuration management for the application."""
 
+import os
 from pydantic_settings import BaseSettings, SettingsConfigDict
-from functools import lru_cache
-from typing import Optional
+from typing import List, Optional, Tuple
 
 
 class Settings(BaseSettings):
     """Application settings loaded from environment variables."""
     
+    # Containers with injected environment variables can set LOAD_DOTENV=0
+    # to skip reading and parsing the .env file entirely
     model_config = SettingsConfigDict(
-        env_file=".env",
+        env_file=".env" if os.environ.get("LOAD_DOTENV", "1") == "1" else None,
         env_file_encoding="utf-8",
         case_sensitive=False,
         extra="ignore",
@@ -30,20 +32,37 @@ class Settings(BaseSettings):
     # API Configuration
     api_host: str = "0.0.0.0"
     api_port: int = 8000
-    api_reload: bool = True
+    api_reload: bool = False  # set DEV=1 to force auto-reload
     log_level: str = "INFO"
+    enable_docs: bool = False  # serve /docs, /redoc and /openapi.json
     
     # Cache Configuration
     cache_dir: str = "./cache"
     cache_expiry_hours: int = 6
+    redis_url: str = ""  # e.g. redis://localhost:6379/0; empty disables the response cache
+    granule_cache_max_mb: int = 2048  # downloaded granules kept in cache_dir, least recently used evicted first
     
     # Data Processing
     max_radius_meters: int = 50000
     min_radius_meters: int = 100
     default_radius_meters: int = 5000
+    # (lat, lon) points whose Earthdata products are fetched in the background
+    # at startup, as JSON, e.g. [[-23.55, -46.63], [40.71, -74.01]]
+    warmup_locations: List[Tuple[float, float]] = []
     
     # Rate Limiting
     rate_limit_per_minute: int = 100
+    # Outbound Earthdata request rates (per process), kept under NASA's
+    # per-user limits so bursts do not turn into 429s and retries
+    cmr_requests_per_second: float = 10.0
+    earthdata_downloads_per_second: float = 5.0
+    # Read point values over OPeNDAP instead of downloading whole granules.
+    # netCDF4's DAP client authenticates with ~/.netrc (see ~/.dodsrc)
+    earthdata_opendap: bool = False
+    # Read point values through earthaccess.open (HTTP range requests)
+    # instead of downloading whole granules; requires h5netcdf. Cloud-hosted
+    # granules are always read this way (from S3) when running in us-west-2
+    earthdata_stream: bool = False
     
     # Application Info
     app_name: str = "NASA SafeOut API"
@@ -51,7 +70,19 @@ class Settings(BaseSettings):
     app_description: str = "API para consulta de dados ambientais da NASA e outras fontes"
 
 
-@lru_cache()
+# Per-source upstream timeouts in seconds, set slightly above each source's
+# typical p95 response time
+HTTP_TIMEOUTS = {
+    "firms": 8.0,
+    "openaq": 5.0,
+    "gibs": 3.0,
+}
+
+
+# Settings are loaded once at import time and shared by the whole application
+SETTINGS: Settings = Settings()
+
+
 def get_settings() -> Settings:
-    """Get cached settings instance."""
-    return Settings()
+    """Get the shared settings instance."""
+    return SETTINGS
@@ -0,0 +1,53 @@
+"""Shared HTTP client for outbound requests to upstream data sources."""
+
+import importlib.util
+from typing import Optional
+
+import httpx
+
+# Optional: HTTP/2 lets concurrent requests to one upstream host (e.g. the
+# FIRMS sources) share a single multiplexed connection
+HAS_H2 = importlib.util.find_spec("h2") is not None
+
+# Connection pool sizing for the shared client. Keep-alive connections are
+# reused across requests so the hot path skips TCP/TLS handshakes.
+HTTP_LIMITS = httpx.Limits(
+    max_connections=100,
+    max_keepalive_connections=40,
+    keepalive_expiry=30
+)
+HTTP_TIMEOUT = 30.0
+
+_client: Optional[httpx.AsyncClient] = None
+
+
+def create_http_client() -> httpx.AsyncClient:
+    """
+    Create a pooled async HTTP client.
+
+    Returns:
+        New httpx.AsyncClient configured with the shared limits, speaking
+        HTTP/2 when the h2 package is installed
+    """
+    return httpx.AsyncClient(timeout=HTTP_TIMEOUT, limits=HTTP_LIMITS, http2=HAS_H2)
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """
+    Get the process-wide HTTP client, creating it on first use.
+
+    Returns:
+        Shared httpx.AsyncClient
+    """
+    global _client
+    if _client is None or _client.is_closed:
+        _client = create_http_client()
+    return _client
+
+
+async def close_http_client() -> None:
+    """Close the process-wide HTTP client if it was created."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
@@ -1,54 +1,142 @@
 """Main FastAPI application entry point."""
 
 from fastapi import FastAPI, Request
+from fastapi.encoders import jsonable_encoder
+from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse, HTMLResponse
-from datetime import datetime
+from fastapi.responses import ORJSONResponse, HTMLResponse, Response
+from starlette.exceptions import HTTPException as StarletteHTTPException
+import asyncio
+import atexit
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+import gzip
+import importlib.util
 import logging
+from logging.handlers import QueueHandler, QueueListener
+import os
+import queue
+import threading
 import time
+from typing import Dict, Optional
+import orjson
 
 from app.config import get_settings
+from app.http_client import close_http_client, get_http_client
+from app.middleware import ProcessTimeMiddleware
 from app.routers import environmental
+from app.services.cache import close_cache
+from app.utils.time_utils import utc_now_iso
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+# Configure logging. Records are handed to a queue and written to stderr by
+# a listener thread, so slow log I/O never blocks the event loop
+_log_handler = logging.StreamHandler()
+_log_handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
+_log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+_log_listener = QueueListener(_log_queue, _log_handler)
+_log_listener.start()
+atexit.register(_log_listener.stop)
+_queue_handler = QueueHandler(_log_queue)
+_queue_handler.setFormatter(logging.Formatter('%(message)s'))
+logging.basicConfig(level=logging.INFO, handlers=[_queue_handler])
 logger = logging.getLogger(__name__)
 
 settings = get_settings()
 
+# flock is POSIX-only; elsewhere every worker runs its own warm-up
+HAS_FCNTL = importlib.util.find_spec("fcntl") is not None
+
+
+# Worker threads for blocking upstream calls (earthaccess) run via
+# asyncio.to_thread; the default pool is only min(32, cpu_count + 4)
+THREAD_POOL_WORKERS = 32
+
+# Lock file in cache_dir claimed by the worker that runs the warm-up
+WARMUP_LOCK_FILE = "warmup.lock"
+
+
+def _claim_warmup() -> Optional[int]:
+    """
+    Claim the startup cache warm-up for this worker process.
+
+    With several uvicorn workers only the one holding an exclusive lock on
+    the warm-up lock file fetches warmup_locations, so Earthdata sees one
+    login and one set of searches and downloads rather than one per worker.
+    The lock is held until shutdown, so workers restarted in the meantime
+    do not repeat the warm-up either.
+
+    Returns:
+        File descriptor holding the lock, or None if another worker has it
+    """
+    os.makedirs(settings.cache_dir, exist_ok=True)
+    fd = os.open(os.path.join(settings.cache_dir, WARMUP_LOCK_FILE), os.O_RDWR | os.O_CREAT, 0o644)
+    if HAS_FCNTL:
+        import fcntl
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            os.close(fd)
+            return None
+    return fd
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Create shared clients on startup and close them on shutdown."""
+    asyncio.get_running_loop().set_default_executor(
+        ThreadPoolExecutor(max_workers=THREAD_POOL_WORKERS, thread_name_prefix="upstream")
+    )
+    app.state.http_client = get_http_client()
+    # Prefetch configured locations in the background, in one worker only,
+    # with the Earthdata service the requests use; requests are served
+    # while it runs
+    warmup = None
+    warmup_lock = _claim_warmup() if settings.warmup_locations else None
+    warmup_stop = threading.Event()
+    if warmup_lock is not None:
+        earthdata_service = environmental.shared_processor(app).earthdata_service
+        warmup = asyncio.create_task(
+            asyncio.to_thread(earthdata_service.warm_up, settings.warmup_locations, warmup_stop)
+        )
+    elif settings.warmup_locations:
+        logger.info("Cache warm-up is run by another worker")
+    yield
+    if warmup is not None:
+        # Cancelling the task does not stop its thread, so skip the fetches
+        # not yet started; the default executor only waits for running ones
+        warmup_stop.set()
+        warmup.cancel()
+    if warmup_lock is not None:
+        os.close(warmup_lock)
+    await close_http_client()
+    await close_cache()
+
+
 # Create FastAPI app
 app = FastAPI(
     title=settings.app_name,
     version=settings.app_version,
     description=settings.app_description,
-    docs_url="/docs",
-    redoc_url="/redoc",
-    openapi_url="/openapi.json"
+    # Interactive docs and the OpenAPI schema are opt-in so production
+    # instances never build the schema for the nested response models
+    docs_url="/docs" if settings.enable_docs else None,
+    redoc_url="/redoc" if settings.enable_docs else None,
+    openapi_url="/openapi.json" if settings.enable_docs else None,
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
 )
 
 # Add CORS middleware
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],  # Configure appropriately for production
-    allow_credentials=True,
+    allow_credentials=False,  # Public API without cookies; keeps the static "*" origin header
     allow_methods=["*"],
     allow_headers=["*"],
 )
 
-
-# Middleware for request timing
-@app.middleware("http")
-async def add_process_time_header(request: Request, call_next):
-    """Add processing time to response headers."""
-    start_time = time.time()
-    response = await call_next(request)
-    process_time = (time.time() - start_time) * 1000  # Convert to milliseconds
-    response.headers["X-Process-Time-Ms"] = str(int(process_time))
-    return response
-
+# Add request timing middleware
+app.add_middleware(ProcessTimeMiddleware)
 
 # Include routers
 app.include_router(
@@ -58,34 +146,50 @@ app.include_router(
 )
 
 
+# Root endpoint payload, serialized once at import time
+_ROOT_BYTES = orjson.dumps({
+    "name": settings.app_name,
+    "version": settings.app_version,
+    "description": settings.app_description,
+    "docs": "/docs" if settings.enable_docs else None,
+    "test": "/test",
+    "health": "/health",
+    "info": "/api/v1/info"
+})
+
+
 @app.get("/", tags=["Root"])
 async def root():
     """Root endpoint with API information."""
-    return {
-        "name": settings.app_name,
-        "version": settings.app_version,
-        "description": settings.app_description,
-        "docs": "/docs",
-        "test": "/test",
-        "health": "/health",
-        "info": "/api/v1/info"
-    }
+    return Response(content=_ROOT_BYTES, media_type="application/json")
+
+
+# [epoch_second, body_bytes, etag] - the health payload is rebuilt at most
+# once per second so frequent liveness probes reuse the same bytes
+_health_cache = [0, b"", ""]
 
 
 @app.get("/health", tags=["Health"])
-async def health_check():
+async def health_check(request: Request):
     """Health check endpoint."""
-    return {
-        "status": "healthy",
-        "timestamp": datetime.utcnow().isoformat() + "Z",
-        "version": settings.app_version
-    }
+    now = int(time.time())
+    if now != _health_cache[0]:
+        _health_cache[1] = orjson.dumps({
+            "status": "healthy",
+            "timestamp": utc_now_iso(),
+            "version": settings.app_version
+        })
+        _health_cache[2] = f'"{now}"'
+        _health_cache[0] = now
 
+    headers = {"Cache-Control": "public, max-age=1", "ETag": _health_cache[2]}
+    if request.headers.get("if-none-match") == _health_cache[2]:
+        return Response(status_code=304, headers=headers)
+    return Response(content=_health_cache[1], media_type="application/json", headers=headers)
 
-@app.get("/test", response_class=HTMLResponse, tags=["Testing"])
-async def test_page():
-    """Interactive test page for the API."""
-    html_content = """
+
+# Interactive test page, encoded once at import time
+_TEST_HTML = """
 <!DOCTYPE html>
 <html lang="pt-BR">
 <head>
@@ -492,29 +596,87 @@ Dica: Clique em um dos botões acima para testar a API!
     </script>
 </body>
 </html>
-    """
-    return HTMLResponse(content=html_content)
+"""
+_TEST_HTML_BYTES = _TEST_HTML.encode("utf-8")
+_TEST_HTML_GZIP = gzip.compress(_TEST_HTML_BYTES, compresslevel=9)
+
+
+@app.get("/test", response_class=HTMLResponse, tags=["Testing"])
+async def test_page(request: Request):
+    """Interactive test page for the API."""
+    headers = {"Cache-Control": "public, max-age=3600", "Vary": "Accept-Encoding"}
+    if "gzip" in request.headers.get("accept-encoding", ""):
+        headers["Content-Encoding"] = "gzip"
+        return Response(
+            content=_TEST_HTML_GZIP,
+            media_type="text/html",
+            headers=headers
+        )
+    return Response(
+        content=_TEST_HTML_BYTES,
+        media_type="text/html",
+        headers=headers
+    )
+
+
+# Last time a full traceback was logged, per exception type
+TRACEBACK_LOG_INTERVAL_SECONDS = 60.0
+_traceback_logged_at: Dict[type, float] = {}
+
+
+# HTTP and validation errors are rendered with orjson like every other
+# response, instead of FastAPI's default stdlib-json handlers
+@app.exception_handler(StarletteHTTPException)
+async def http_exception_handler(request: Request, exc: StarletteHTTPException):
+    """Render HTTP errors with orjson."""
+    return ORJSONResponse(
+        status_code=exc.status_code,
+        content={"detail": exc.detail},
+        headers=getattr(exc, "headers", None)
+    )
+
+
+@app.exception_handler(RequestValidationError)
+async def validation_exception_handler(request: Request, exc: RequestValidationError):
+    """Render request validation errors with orjson."""
+    return ORJSONResponse(
+        status_code=422,
+        content={"detail": jsonable_encoder(exc.errors())}
+    )
 
 
 @app.exception_handler(Exception)
 async def global_exception_handler(request: Request, exc: Exception):
     """Global exception handler."""
-    logger.error(f"Unhandled exception: {exc}", exc_info=True)
-    return JSONResponse(
+    # Format full tracebacks at most once per interval per exception type so
+    # a failing upstream cannot turn logging into the bottleneck
+    now = time.monotonic()
+    exc_type = type(exc)
+    last_logged = _traceback_logged_at.get(exc_type)
+    if last_logged is None or now - last_logged > TRACEBACK_LOG_INTERVAL_SECONDS:
+        _traceback_logged_at[exc_type] = now
+        logger.error(f"Unhandled exception: {exc}", exc_info=True)
+    else:
+        logger.error(f"Unhandled exception: {exc_type.__name__}: {exc} (traceback suppressed)")
+    return ORJSONResponse(
         status_code=500,
         content={
             "detail": "Internal server error",
-            "timestamp": datetime.utcnow().isoformat() + "Z"
+            "timestamp": utc_now_iso()
         }
     )
 
 
 if __name__ == "__main__":
     import uvicorn
+    # The reload watcher only runs in development; otherwise serve with one
+    # worker per CPU (uvicorn cannot combine reload with multiple workers)
+    reload = os.environ.get("DEV") == "1" or settings.api_reload
     uvicorn.run(
         "app.main:app",
         host=settings.api_host,
         port=settings.api_port,
-        reload=settings.api_reload,
+        reload=reload,
+        workers=None if reload else os.cpu_count(),
         log_level=settings.log_level.lower()
     )
@@ -0,0 +1,38 @@
+"""ASGI middleware for the application."""
+
+from time import perf_counter_ns
+
+# Raw (lowercase, latin-1) header name as sent over ASGI
+PROCESS_TIME_HEADER = b"x-process-time-ms"
+
+
+class ProcessTimeMiddleware:
+    """Add the request processing time (ms) to the X-Process-Time-Ms header.
+
+    Implemented as a plain ASGI middleware to avoid the extra task and
+    streaming wrapper that ``@app.middleware("http")`` adds to every request.
+    """
+
+    def __init__(self, app):
+        """Wrap an ASGI application."""
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start_ns = perf_counter_ns()
+
+        async def send_with_process_time(message):
+            if message["type"] == "http.response.start":
+                elapsed_ms = (perf_counter_ns() - start_ns) // 1_000_000
+                # Append to the raw header list as bytes, bypassing the
+                # MutableHeaders key normalization and str encoding
+                headers = message.setdefault("headers", [])
+                if not isinstance(headers, list):
+                    headers = message["headers"] = list(headers)
+                headers.append((PROCESS_TIME_HEADER, b"%d" % elapsed_ms))
+            await send(message)
+
+        await self.app(scope, receive, send_with_process_time)
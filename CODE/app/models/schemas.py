@@ -1,11 +1,40 @@
 """Pydantic models for request/response validation."""
 
-from pydantic import BaseModel, Field, field_validator
-from typing import Optional, List, Dict, Any
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, computed_field
+from typing import Optional, List, Dict, Any, Literal, Tuple
 from datetime import datetime
 
 
-class LocationRequest(BaseModel):
+# Closed sets of category values used across the schemas
+ConfidenceLevel = Literal["low", "medium", "high"]
+FireConfidence = Literal["low", "medium", "high", "unknown"]
+AQICategory = Literal[
+    "good",
+    "moderate",
+    "unhealthy_sensitive",
+    "unhealthy",
+    "very_unhealthy",
+    "hazardous",
+    "unknown",
+]
+UVCategory = Literal["low", "moderate", "high", "very_high", "extreme", "unknown"]
+QualityFlag = Literal["good", "poor", "unknown", "unavailable"]
+
+# Collection fields are typed as variable-length tuples so the empty default
+# is one shared immutable object instead of a list copied per instance
+
+
+class SchemaModel(BaseModel):
+    """Base model with the configuration shared by all API schemas."""
+    
+    model_config = ConfigDict(
+        extra="ignore",
+        validate_assignment=False,
+        populate_by_name=True,
+    )
+
+
+class LocationRequest(SchemaModel):
     """Request model for location-based queries."""
     
     latitude: float = Field(
@@ -26,23 +55,9 @@ class LocationRequest(BaseModel):
         le=50000,
         description="Search radius in meters"
     )
-    
-    @field_validator('latitude')
-    @classmethod
-    def validate_latitude(cls, v):
-        if not -90 <= v <= 90:
-            raise ValueError('Latitude must be between -90 and 90')
-        return v
-    
-    @field_validator('longitude')
-    @classmethod
-    def validate_longitude(cls, v):
-        if not -180 <= v <= 180:
-            raise ValueError('Longitude must be between -180 and 180')
-        return v
 
 
-class LocationInfo(BaseModel):
+class LocationInfo(SchemaModel):
     """Location information in the response."""
     
     latitude: float
@@ -50,122 +65,157 @@ class LocationInfo(BaseModel):
     radius_meters: int
 
 
-class HourlyForecast(BaseModel):
+class HourlyForecast(SchemaModel):
     """Hourly precipitation forecast."""
     
     hour: int
     rate_mm_h: float
-    confidence: str = "medium"
+    confidence: ConfidenceLevel = "medium"
 
 
-class PrecipitationData(BaseModel):
+class PrecipitationData(SchemaModel):
     """Precipitation data from IMERG."""
     
     source: str = "GPM_3IMERGHHE"
     last_update: Optional[str] = None
-    forecast_hours: List[HourlyForecast] = []
+    forecast_hours: Tuple[HourlyForecast, ...] = ()
     daily_accumulation_mm: Optional[float] = None
 
 
-class SatelliteAirQuality(BaseModel):
+class SatelliteAirQuality(SchemaModel):
     """Satellite-based air quality data."""
     
     source: str = "TROPOMI/Sentinel-5P"
     last_update: Optional[str] = None
     aerosol_index: Optional[float] = None
     no2_mol_m2: Optional[float] = None
-    quality_flag: str = "unknown"
+    quality_flag: QualityFlag = "unknown"
 
 
-class Measurement(BaseModel):
+class Measurement(SchemaModel):
     """Individual air quality measurement."""
     
     value: float
     unit: str
-    aqi: str = "unknown"
+    aqi: AQICategory = "unknown"
 
 
-class GroundStation(BaseModel):
+class Measurements(SchemaModel):
+    """Latest measurements per pollutant at a ground station."""
+    
+    pm25: Optional[Measurement] = None
+    pm10: Optional[Measurement] = None
+    o3: Optional[Measurement] = None
+    no2: Optional[Measurement] = None
+    so2: Optional[Measurement] = None
+    co: Optional[Measurement] = None
+
+
+class AirQualityAverage(SchemaModel):
+    """Average pollutant values across nearby ground stations."""
+    
+    pm25: Optional[float] = None
+    pm10: Optional[float] = None
+    o3: Optional[float] = None
+    no2: Optional[float] = None
+    so2: Optional[float] = None
+    co: Optional[float] = None
+    overall_aqi: Optional[AQICategory] = None
+
+
+class GroundStation(SchemaModel):
     """Ground station air quality data."""
     
     location: str
     distance_km: float
-    measurements: Dict[str, Measurement]
+    measurements: Measurements
     last_update: str
 
 
-class GroundAirQuality(BaseModel):
+class GroundAirQuality(SchemaModel):
     """Ground-based air quality data from OpenAQ."""
     
     source: str = "OpenAQ"
     last_update: Optional[str] = None
     stations_count: int = 0
-    stations: List[GroundStation] = []
-    average: Optional[Dict[str, float]] = None
+    stations: Tuple[GroundStation, ...] = ()
+    average: Optional[AirQualityAverage] = None
 
 
-class AirQualityData(BaseModel):
+class AirQualityData(SchemaModel):
     """Combined air quality data."""
     
     satellite: Optional[SatelliteAirQuality] = None
     ground_stations: Optional[GroundAirQuality] = None
 
 
-class WindData(BaseModel):
+class WindData(SchemaModel):
     """Wind information."""
     
     speed_m_s: float
-    speed_km_h: float
     direction_degrees: int
     direction_cardinal: str
 
+    @computed_field
+    @property
+    def speed_km_h(self) -> float:
+        """Wind speed in km/h, derived from speed_m_s on serialization."""
+        return round(self.speed_m_s * 3.6, 2)
 
-class WeatherData(BaseModel):
+
+class WeatherData(SchemaModel):
     """Weather data from MERRA-2."""
     
     source: str = "MERRA-2"
     last_update: Optional[str] = None
     temperature_celsius: Optional[float] = None
-    temperature_fahrenheit: Optional[float] = None
     humidity_percent: Optional[float] = None
     wind: Optional[WindData] = None
     pressure_hpa: Optional[float] = None
 
+    @computed_field
+    @property
+    def temperature_fahrenheit(self) -> Optional[float]:
+        """Temperature in Fahrenheit, derived from temperature_celsius."""
+        if self.temperature_celsius is None:
+            return None
+        return round(self.temperature_celsius * 9 / 5 + 32, 2)
+
 
-class UVIndexData(BaseModel):
+class UVIndexData(SchemaModel):
     """UV index data."""
     
     source: str = "TROPOMI"
     last_update: Optional[str] = None
     value: Optional[float] = None
-    category: str = "unknown"
+    category: UVCategory = "unknown"
     recommendation: str = ""
 
 
-class FireEvent(BaseModel):
+class FireEvent(SchemaModel):
     """Individual fire detection event."""
     
     latitude: float
     longitude: float
     distance_km: float
     brightness_kelvin: float
-    confidence: str
+    confidence: FireConfidence
     confidence_percent: int
     date: str
     satellite: str
 
 
-class FireHistoryData(BaseModel):
+class FireHistoryData(SchemaModel):
     """Fire detection history."""
     
     source: str = "NASA FIRMS"
     period_days: int = 7
     last_update: Optional[str] = None
     active_fires_count: int = 0
-    fires: List[FireEvent] = []
+    fires: Tuple[FireEvent, ...] = ()
 
 
-class EnvironmentalData(BaseModel):
+class EnvironmentalData(SchemaModel):
     """All environmental data combined."""
     
     precipitation: Optional[PrecipitationData] = None
@@ -176,16 +226,16 @@ class EnvironmentalData(BaseModel):
     satellite_imagery: Optional[Dict[str, Any]] = None
 
 
-class ResponseMetadata(BaseModel):
+class ResponseMetadata(SchemaModel):
     """Response metadata."""
     
     processing_time_ms: int
     data_sources_queried: int
     data_sources_successful: int
-    warnings: List[str] = []
+    warnings: Tuple[str, ...] = ()
 
 
-class EnvironmentalDataResponse(BaseModel):
+class EnvironmentalDataResponse(SchemaModel):
     """Complete response model."""
     
     location: LocationInfo
@@ -194,7 +244,11 @@ class EnvironmentalDataResponse(BaseModel):
     metadata: ResponseMetadata
 
 
-class APIInfo(BaseModel):
+# Serializes already-built responses straight to JSON bytes in pydantic-core
+ENV_DATA_RESPONSE_ADAPTER = TypeAdapter(EnvironmentalDataResponse)
+
+
+class APIInfo(SchemaModel):
     """API information response."""
     
     name: str
@@ -204,7 +258,7 @@ class APIInfo(BaseModel):
     limits: Dict[str, Any]
 
 
-class HealthResponse(BaseModel):
+class HealthResponse(SchemaModel):
     """Health check response."""
     
     status: str
@@ -1,7 +1,8 @@
 """Environmental data endpoints."""
 
-from fastapi import APIRouter, HTTPException, status
-from datetime import datetime
+from fastapi import APIRouter, Depends, FastAPI, HTTPException, Request, status
+from fastapi.responses import Response
+from typing import NamedTuple, Optional
 import logging
 import time
 
@@ -11,23 +12,83 @@ from app.models.schemas import (
     APIInfo,
     LocationInfo,
     EnvironmentalData,
-    ResponseMetadata
+    ResponseMetadata,
+    ENV_DATA_RESPONSE_ADAPTER
 )
 from app.config import get_settings
+from app.http_client import get_http_client
+from app.services.cache import get_cache
 from app.services.data_processor import DataProcessor
+from app.utils.resilience import SourceUnavailableError
+from app.utils.time_utils import utc_now_iso
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
 settings = get_settings()
 
 
+class DataSource(NamedTuple):
+    """One environmental data source fetched by get_environmental_data."""
+    
+    field: str          # EnvironmentalData field the result is stored in
+    method: str         # DataProcessor coroutine method that fetches it
+    label: str          # Name used in logs and warnings
+    unavailable: str    # Warning when the source returns nothing
+
+
+# Adding a source only requires a new row here and a processor method
+SOURCES = (
+    DataSource("air_quality", "get_air_quality_data", "Air quality", "Air quality data unavailable"),
+    DataSource("fire_history", "get_fire_history_data", "Fire history", "Fire history data unavailable"),
+    DataSource("precipitation", "get_precipitation_data", "Precipitation", "Precipitation data unavailable (requires NASA Earthdata credentials)"),
+    DataSource("weather", "get_weather_data", "Weather", "Weather data unavailable (requires NASA Earthdata credentials)"),
+    DataSource("uv_index", "get_uv_index_data", "UV index", "UV index data unavailable (requires NASA Earthdata credentials)"),
+    DataSource("satellite_imagery", "get_gibs_imagery", "GIBS imagery", "GIBS satellite imagery unavailable"),
+)
+_SOURCE_FIELDS = tuple(source.field for source in SOURCES)
+
+_processor: Optional[DataProcessor] = None
+
+
+def shared_processor(app: FastAPI) -> DataProcessor:
+    """
+    Get the DataProcessor shared by every request of this process.
+    
+    The processor is created once and reuses the app-scoped HTTP client
+    (app.state.http_client, or the process-wide client when the lifespan
+    has not run). Construction makes no network calls (services are
+    created on first use), so this is safe to call on the event loop.
+    
+    Args:
+        app: Application whose HTTP client the processor uses
+        
+    Returns:
+        The shared DataProcessor
+    """
+    global _processor
+    if _processor is None or _processor.http.is_closed:
+        client = getattr(app.state, "http_client", None)
+        if client is None or client.is_closed:
+            client = get_http_client()
+        _processor = DataProcessor(http_client=client)
+    return _processor
+
+
+async def get_processor(http_request: Request) -> DataProcessor:
+    """Dependency returning the shared DataProcessor (see shared_processor)."""
+    return shared_processor(http_request.app)
+
+
 @router.post(
     "/environmental-data",
     response_model=EnvironmentalDataResponse,
     summary="Get environmental data for a location",
     description="Returns aggregated environmental data from multiple sources for a specific location"
 )
-async def get_environmental_data(request: LocationRequest):
+async def get_environmental_data(
+    request: LocationRequest,
+    processor: DataProcessor = Depends(get_processor)
+):
     """
     Get environmental data for a specific location.
     
@@ -35,137 +96,61 @@ async def get_environmental_data(request: LocationRequest):
     - **longitude**: Longitude in decimal degrees (-180 to 180)
     - **radius_meters**: Search radius in meters (100 to 50000)
     """
-    start_time = time.time()
+    start_time = time.perf_counter()
     
     try:
         logger.info(
-            f"Processing request for location: ({request.latitude}, {request.longitude}), "
-            f"radius: {request.radius_meters}m"
+            "Processing request for location: (%s, %s), radius: %sm",
+            request.latitude, request.longitude, request.radius_meters
         )
         
-        # Initialize data processor
-        processor = DataProcessor()
+        args = (request.latitude, request.longitude, request.radius_meters)
         
-        # Collect data from all sources
-        data_sources_queried = 0
-        data_sources_successful = 0
-        warnings = []
+        # Serve sources with a fresh cache entry for this grid cell from
+        # Redis and only fetch the misses upstream
+        cache = get_cache()
+        fields = await cache.get_many(_SOURCE_FIELDS, *args) if cache else {}
+        pending = [source for source in SOURCES if source.field not in fields]
         
-        # Initialize environmental data
-        env_data = EnvironmentalData()
+        # Fetch the remaining sources concurrently
+        results = await processor.get_all(*args, methods=[source.method for source in pending])
         
-        # Fetch air quality data
-        try:
-            data_sources_queried += 1
-            air_quality = await processor.get_air_quality_data(
-                request.latitude, request.longitude, request.radius_meters
-            )
-            if air_quality:
-                env_data.air_quality = air_quality
-                data_sources_successful += 1
-                logger.info("Air quality data fetched successfully")
-            else:
-                warnings.append("Air quality data unavailable")
-        except Exception as e:
-            logger.error(f"Error fetching air quality data: {e}")
-            warnings.append(f"Air quality data error: {str(e)}")
-        
-        # Fetch fire history data
-        try:
-            data_sources_queried += 1
-            fire_history = await processor.get_fire_history_data(
-                request.latitude, request.longitude, request.radius_meters
-            )
-            if fire_history:
-                env_data.fire_history = fire_history
-                data_sources_successful += 1
-                logger.info("Fire history data fetched successfully")
-            else:
-                warnings.append("Fire history data unavailable")
-        except Exception as e:
-            logger.error(f"Error fetching fire history data: {e}")
-            warnings.append(f"Fire history data error: {str(e)}")
+        data_sources_queried = len(SOURCES)
+        data_sources_successful = len(fields)
+        warnings = []
+        fetched = {}
         
-        # Precipitation data (placeholder - requires earthaccess)
-        try:
-            data_sources_queried += 1
-            precipitation = await processor.get_precipitation_data(
-                request.latitude, request.longitude, request.radius_meters
-            )
-            if precipitation:
-                env_data.precipitation = precipitation
+        for source, result in zip(pending, results):
+            if isinstance(result, SourceUnavailableError):
+                # Rejected locally (circuit open or bulkhead full) without a request
+                warnings.append(f"{source.label} data unavailable ({result.reason})")
+            elif isinstance(result, Exception):
+                logger.error("Error fetching %s data: %s", source.label, result)
+                warnings.append(f"{source.label} data error: {str(result)}")
+            elif result:
+                fetched[source.field] = result
                 data_sources_successful += 1
+                logger.info("%s data fetched successfully", source.label)
             else:
-                warnings.append("Precipitation data unavailable (requires NASA Earthdata credentials)")
-        except Exception as e:
-            logger.error(f"Error fetching precipitation data: {e}")
-            warnings.append(f"Precipitation data error: {str(e)}")
+                warnings.append(source.unavailable)
         
-        # Weather data (placeholder - requires earthaccess)
-        try:
-            data_sources_queried += 1
-            weather = await processor.get_weather_data(
-                request.latitude, request.longitude, request.radius_meters
-            )
-            if weather:
-                env_data.weather = weather
-                data_sources_successful += 1
-            else:
-                warnings.append("Weather data unavailable (requires NASA Earthdata credentials)")
-        except Exception as e:
-            logger.error(f"Error fetching weather data: {e}")
-            warnings.append(f"Weather data error: {str(e)}")
+        if cache:
+            await cache.set_many(fetched, *args)
         
-        # UV index data (placeholder - requires earthaccess)
-        try:
-            data_sources_queried += 1
-            uv_index = await processor.get_uv_index_data(
-                request.latitude, request.longitude, request.radius_meters
-            )
-            if uv_index:
-                env_data.uv_index = uv_index
-                data_sources_successful += 1
-            else:
-                warnings.append("UV index data unavailable (requires NASA Earthdata credentials)")
-        except Exception as e:
-            logger.error(f"Error fetching UV index data: {e}")
-            warnings.append(f"UV index data error: {str(e)}")
-        
-        # Fetch GIBS imagery data
-        try:
-            data_sources_queried += 1
-            gibs_imagery = processor.get_gibs_imagery(
-                request.latitude, request.longitude, request.radius_meters
-            )
-            if gibs_imagery:
-                # Add GIBS data to response (will be added to metadata or separate field)
-                if not hasattr(env_data, 'satellite_imagery'):
-                    env_data.satellite_imagery = gibs_imagery
-                data_sources_successful += 1
-                logger.info("GIBS imagery data fetched successfully")
-            else:
-                warnings.append("GIBS satellite imagery unavailable")
-        except Exception as e:
-            logger.error(f"Error fetching GIBS imagery: {e}")
-            warnings.append(f"GIBS imagery error: {str(e)}")
-        
-        # Close processor connections
-        try:
-            await processor.close()
-        except Exception as e:
-            logger.error(f"Error closing processor: {e}")
+        env_data = EnvironmentalData(**fields, **fetched)
         
         # Calculate processing time
-        processing_time = int((time.time() - start_time) * 1000)
+        processing_time = int((time.perf_counter() - start_time) * 1000)
         
         # Build response
         response = EnvironmentalDataResponse(
-            location=LocationInfo(
+            # Coordinates were already validated by LocationRequest
+            location=LocationInfo.model_construct(
                 latitude=request.latitude,
                 longitude=request.longitude,
                 radius_meters=request.radius_meters
             ),
-            timestamp=datetime.utcnow().isoformat() + "Z",
+            timestamp=utc_now_iso(),
             data=env_data,
             metadata=ResponseMetadata(
                 processing_time_ms=processing_time,
@@ -175,23 +160,74 @@ async def get_environmental_data(request: LocationRequest):
             )
         )
         
-        logger.info(f"Request processed successfully in {processing_time}ms")
-        return response
+        logger.info("Request processed successfully in %dms", processing_time)
+        # The response is already a validated model, so skip FastAPI's
+        # response_model re-validation and serialize it directly
+        return Response(
+            content=ENV_DATA_RESPONSE_ADAPTER.dump_json(response),
+            media_type="application/json"
+        )
         
     except ValueError as e:
-        logger.error(f"Validation error: {e}")
+        logger.error("Validation error: %s", e)
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e)
         )
     except Exception as e:
-        logger.error(f"Error processing request: {e}", exc_info=True)
+        logger.error("Error processing request: %s", e, exc_info=True)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Error processing request: {str(e)}"
         )
 
 
+# Static API description, built and serialized once at import time
+_API_INFO = APIInfo(
+    name=settings.app_name,
+    version=settings.app_version,
+    description=settings.app_description,
+    data_sources=[
+        {
+            "name": "GPM IMERG",
+            "type": "precipitation",
+            "provider": "NASA",
+            "update_frequency": "30 minutes"
+        },
+        {
+            "name": "TROPOMI/Sentinel-5P",
+            "type": "air_quality",
+            "provider": "ESA/NASA",
+            "update_frequency": "daily"
+        },
+        {
+            "name": "OpenAQ",
+            "type": "air_quality_ground",
+            "provider": "OpenAQ",
+            "update_frequency": "hourly"
+        },
+        {
+            "name": "MERRA-2",
+            "type": "weather",
+            "provider": "NASA",
+            "update_frequency": "hourly"
+        },
+        {
+            "name": "NASA FIRMS",
+            "type": "fire_detection",
+            "provider": "NASA",
+            "update_frequency": "near real-time"
+        }
+    ],
+    limits={
+        "max_radius_meters": settings.max_radius_meters,
+        "min_radius_meters": settings.min_radius_meters,
+        "rate_limit": f"{settings.rate_limit_per_minute} requests per minute"
+    }
+)
+_API_INFO_JSON = _API_INFO.model_dump_json()
+
+
 @router.get(
     "/info",
     response_model=APIInfo,
@@ -200,45 +236,4 @@ async def get_environmental_data(request: LocationRequest):
 )
 async def get_api_info():
     """Get API information and capabilities."""
-    return APIInfo(
-        name=settings.app_name,
-        version=settings.app_version,
-        description=settings.app_description,
-        data_sources=[
-            {
-                "name": "GPM IMERG",
-                "type": "precipitation",
-                "provider": "NASA",
-                "update_frequency": "30 minutes"
-            },
-            {
-                "name": "TROPOMI/Sentinel-5P",
-                "type": "air_quality",
-                "provider": "ESA/NASA",
-                "update_frequency": "daily"
-            },
-            {
-                "name": "OpenAQ",
-                "type": "air_quality_ground",
-                "provider": "OpenAQ",
-                "update_frequency": "hourly"
-            },
-            {
-                "name": "MERRA-2",
-                "type": "weather",
-                "provider": "NASA",
-                "update_frequency": "hourly"
-            },
-            {
-                "name": "NASA FIRMS",
-                "type": "fire_detection",
-                "provider": "NASA",
-                "update_frequency": "near real-time"
-            }
-        ],
-        limits={
-            "max_radius_meters": settings.max_radius_meters,
-            "min_radius_meters": settings.min_radius_meters,
-            "rate_limit": f"{settings.rate_limit_per_minute} requests per minute"
-        }
-    )
+    return Response(content=_API_INFO_JSON, media_type="application/json")
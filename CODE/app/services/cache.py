@@ -0,0 +1,349 @@
+"""Caches for environmental data (in-process, on-disk and Redis)."""
+
+import logging
+import os
+import pickle
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Iterable, Optional, Tuple
+
+import orjson
+from pydantic_core import to_json
+
+from app.config import get_settings
+from app.utils.time_utils import seconds_until_utc_midnight
+
+try:
+    import redis.asyncio as aioredis
+    HAS_REDIS = True
+except ImportError:
+    HAS_REDIS = False
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+if settings.redis_url and not HAS_REDIS:
+    logger.warning("REDIS_URL is set but the redis package is not installed; caching disabled")
+
+# Cache lifetime per EnvironmentalData field, matched to each feed's update
+# cadence (see the update_frequency values in /api/v1/info)
+SOURCE_TTL_SECONDS: Dict[str, int] = {
+    "precipitation": 30 * 60,           # GPM IMERG, 30 minutes
+    "air_quality": 60 * 60,             # OpenAQ, hourly
+    "weather": 60 * 60,                 # MERRA-2, hourly
+    "uv_index": 60 * 60,
+    "fire_history": 15 * 60,            # FIRMS, near real-time
+    "satellite_imagery": 6 * 60 * 60,   # GIBS daily layers
+}
+
+
+def quantize_location(
+    latitude: float,
+    longitude: float,
+    radius_meters: int
+) -> Tuple[float, float, int]:
+    """
+    Snap a query to a ~1 km grid so nearby requests share cache entries.
+
+    Args:
+        latitude: Latitude in decimal degrees
+        longitude: Longitude in decimal degrees
+        radius_meters: Search radius in meters
+
+    Returns:
+        Tuple of (latitude, longitude, radius) rounded to the cache grid
+    """
+    return round(latitude, 2), round(longitude, 2), (radius_meters // 1000) * 1000
+
+
+def cache_key(source: str, latitude: float, longitude: float, radius_meters: int) -> str:
+    """
+    Build the cache key for one data source at a location.
+
+    Args:
+        source: EnvironmentalData field name
+        latitude: Latitude in decimal degrees
+        longitude: Longitude in decimal degrees
+        radius_meters: Search radius in meters
+
+    Returns:
+        Key of the form envdata:{lat_q}:{lon_q}:{radius_q}:{source}
+    """
+    lat_q, lon_q, radius_q = quantize_location(latitude, longitude, radius_meters)
+    return f"envdata:{lat_q}:{lon_q}:{radius_q}:{source}"
+
+
+class TTLCache:
+    """
+    Small in-process LRU cache whose entries expire after a per-entry TTL.
+
+    When full, the least recently used entry is evicted. Not thread-safe;
+    use it from the event loop, or guard it with a lock when it is shared
+    by worker threads.
+    """
+
+    def __init__(self, max_entries: int = 1024):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of entries kept
+        """
+        self.max_entries = max_entries
+        self._entries: OrderedDict[Hashable, Tuple[float, Any]] = OrderedDict()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """
+        Get a value if present and not expired.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached value or None
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry[0] <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return entry[1]
+
+    def set(self, key: Hashable, value: Any, ttl: float) -> None:
+        """
+        Store a value for ttl seconds.
+
+        Args:
+            key: Cache key
+            value: Value to store
+            ttl: Lifetime in seconds
+        """
+        self._entries.pop(key, None)
+        if len(self._entries) >= self.max_entries:
+            self._entries.popitem(last=False)
+        self._entries[key] = (time.monotonic() + ttl, value)
+
+
+class DiskCache:
+    """
+    Persistent cache stored in a SQLite file, shared across processes.
+    
+    Values are pickled and expire after a per-entry TTL. Thread-safe, so
+    it can be used from the worker threads running blocking upstream calls.
+    """
+    
+    def __init__(self, path: str):
+        """
+        Open (or create) the cache file.
+        
+        Args:
+            path: Path of the SQLite database file
+        """
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS cache "
+            "(key TEXT PRIMARY KEY, expires_at REAL NOT NULL, value BLOB NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS cache_expires_at ON cache (expires_at)")
+    
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Get a value if present and not expired.
+        
+        Args:
+            key: Cache key
+            
+        Returns:
+            Cached value or None
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT expires_at, value FROM cache WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None or row[0] <= time.time():
+            return None
+        return pickle.loads(row[1])
+    
+    def set(self, key: str, value: Any, ttl: float) -> None:
+        """
+        Store a value for ttl seconds, dropping expired entries.
+        
+        Args:
+            key: Cache key
+            value: Picklable value to store
+            ttl: Lifetime in seconds
+        """
+        data = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        now = time.time()
+        with self._lock:
+            self._conn.execute("DELETE FROM cache WHERE expires_at <= ?", (now,))
+            self._conn.execute(
+                "INSERT OR REPLACE INTO cache (key, expires_at, value) VALUES (?, ?, ?)",
+                (key, now + ttl, data)
+            )
+    
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+
+class ResponseCache:
+    """Per-source cache of environmental data stored in Redis as JSON."""
+
+    def __init__(self, url: str):
+        """
+        Initialize the cache.
+
+        Args:
+            url: Redis connection URL (e.g., redis://localhost:6379/0)
+        """
+        self.redis = aioredis.from_url(url)
+
+    async def get_many(
+        self,
+        sources: Iterable[str],
+        latitude: float,
+        longitude: float,
+        radius_meters: int
+    ) -> Dict[str, Any]:
+        """
+        Fetch cached values for several sources in one round trip.
+
+        Args:
+            sources: EnvironmentalData field names to look up
+            latitude: Latitude in decimal degrees
+            longitude: Longitude in decimal degrees
+            radius_meters: Search radius in meters
+
+        Returns:
+            Dictionary of source -> decoded JSON value for cache hits only
+        """
+        sources = list(sources)
+        keys = [cache_key(s, latitude, longitude, radius_meters) for s in sources]
+        try:
+            values = await self.redis.mget(keys)
+        except Exception as e:
+            logger.warning(f"Cache read failed: {e}")
+            return {}
+        return {
+            source: orjson.loads(value)
+            for source, value in zip(sources, values)
+            if value is not None
+        }
+
+    async def set_many(
+        self,
+        values: Dict[str, Any],
+        latitude: float,
+        longitude: float,
+        radius_meters: int
+    ) -> None:
+        """
+        Store freshly fetched values, each with its source's TTL (ending no
+        later than 00:00 UTC).
+
+        Args:
+            values: Dictionary of source -> model or JSON-compatible value
+            latitude: Latitude in decimal degrees
+            longitude: Longitude in decimal degrees
+            radius_meters: Search radius in meters
+        """
+        if not values:
+            return
+        # Date-based queries change at 00:00 UTC, so entries expire then too
+        until_midnight = max(1, int(seconds_until_utc_midnight()))
+        try:
+            async with self.redis.pipeline(transaction=False) as pipe:
+                for source, value in values.items():
+                    pipe.set(
+                        cache_key(source, latitude, longitude, radius_meters),
+                        to_json(value),
+                        ex=min(SOURCE_TTL_SECONDS[source], until_midnight)
+                    )
+                await pipe.execute()
+        except Exception as e:
+            logger.warning(f"Cache write failed: {e}")
+
+    async def close(self) -> None:
+        """Close the Redis connection pool."""
+        await self.redis.aclose()
+
+
+_cache: Optional[ResponseCache] = None
+
+
+def get_cache() -> Optional[ResponseCache]:
+    """
+    Get the shared response cache.
+
+    Returns:
+        ResponseCache, or None when REDIS_URL is unset or redis is not installed
+    """
+    global _cache
+    if _cache is None and settings.redis_url and HAS_REDIS:
+        _cache = ResponseCache(settings.redis_url)
+    return _cache
+
+
+_disk_caches: Dict[str, DiskCache] = {}
+_disk_caches_lock = threading.Lock()
+
+
+def _get_disk_cache(file_name: str) -> Optional[DiskCache]:
+    """
+    Get (opening on first use) a shared DiskCache under CACHE_DIR.
+    
+    Args:
+        file_name: SQLite file name inside CACHE_DIR
+        
+    Returns:
+        DiskCache, or None if the file cannot be opened
+    """
+    cache = _disk_caches.get(file_name)
+    if cache is None:
+        with _disk_caches_lock:
+            cache = _disk_caches.get(file_name)
+            if cache is None:
+                try:
+                    cache = DiskCache(os.path.join(settings.cache_dir, file_name))
+                except (OSError, sqlite3.Error) as e:
+                    logger.warning(f"Disk cache {file_name} unavailable: {e}")
+                    return None
+                _disk_caches[file_name] = cache
+    return cache
+
+
+def get_search_cache() -> Optional[DiskCache]:
+    """
+    Get the shared on-disk cache for Earthdata (CMR) search results.
+    
+    Returns:
+        DiskCache under CACHE_DIR, or None if the file cannot be opened
+    """
+    return _get_disk_cache("cmr_search.sqlite")
+
+
+def get_value_cache() -> Optional[DiskCache]:
+    """
+    Get the shared on-disk cache of values extracted from granules.
+    
+    Returns:
+        DiskCache under CACHE_DIR, or None if the file cannot be opened
+    """
+    return _get_disk_cache("granule_values.sqlite")
+
+
+async def close_cache() -> None:
+    """Close the shared response cache if it was created."""
+    global _cache
+    if _cache is not None:
+        await _cache.close()
+        _cache = None
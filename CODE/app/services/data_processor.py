@@ -1,8 +1,12 @@
 """Main data processor that orchestrates data fetching from all sources."""
 
+import asyncio
+import heapq
 import logging
-from typing import Optional, Tuple
-from datetime import datetime
+from functools import cached_property
+from typing import Any, List, Optional, Sequence, Tuple
+import httpx
+import numpy as np
 
 from app.models.schemas import (
     PrecipitationData,
@@ -14,35 +18,183 @@ from app.models.schemas import (
     GroundAirQuality,
     GroundStation,
     Measurement,
+    Measurements,
     WindData,
     FireEvent
 )
+from app.http_client import get_http_client
+from app.services.cache import TTLCache, cache_key
 from app.services.openaq import OpenAQService
-from app.services.firms import FIRMSService
+from app.services.firms import SATELLITE_BY_SOURCE, FIRMSService
 from app.services.earthdata import EarthdataService
 from app.services.gibs import GIBSService
 from app.utils.geo_utils import (
-    haversine_distance,
+    haversine_vector,
     categorize_uv_index,
-    celsius_to_fahrenheit,
     meters_per_second_to_kmh,
     wind_components_to_speed_direction,
     direction_to_cardinal
 )
+from app.utils.resilience import Bulkhead, CircuitBreaker, SingleFlight, is_upstream_failure
+from app.utils.time_utils import seconds_until_utc_midnight, utc_now_iso
 
 logger = logging.getLogger(__name__)
 
+# In-process cache lifetime (seconds) per source method, shorter than the
+# Redis TTLs so co-located requests on this worker skip even the Redis trip.
+# Entries also expire at 00:00 UTC, when date-based queries (FIRMS day
+# ranges, GIBS layer dates) change.
+MEMORY_CACHE_TTL_SECONDS = {
+    "get_precipitation_data": 900,      # IMERG
+    "get_air_quality_data": 300,        # OpenAQ
+    "get_fire_history_data": 600,       # FIRMS
+    "get_weather_data": 900,            # MERRA-2
+    "get_uv_index_data": 3600,          # TROPOMI
+    "get_gibs_imagery": 3600,           # URLs built locally from bbox and date
+}
+
+# Closest fires returned in FireHistoryData.fires
+MAX_FIRE_EVENTS = 20
+
+# Pollutants with a field on the Measurements schema
+MEASUREMENT_PARAMETERS = frozenset(Measurements.model_fields)
+
+# Pollutants averaged across ground stations, mapped to their column in
+# the per-station value matrix
+AVERAGED_POLLUTANTS = {"pm25": 0, "pm10": 1, "no2": 2}
+
+# Coroutine methods fetching each independent data source, in the order
+# get_all returns their results by default
+SOURCE_METHODS = (
+    "get_air_quality_data",
+    "get_fire_history_data",
+    "get_precipitation_data",
+    "get_weather_data",
+    "get_uv_index_data",
+    "get_gibs_imagery",
+)
+
 
 class DataProcessor:
     """Orchestrates data fetching and processing from multiple sources."""
     
-    def __init__(self):
-        """Initialize the data processor."""
+    def __init__(self, http_client: Optional[httpx.AsyncClient] = None):
+        """
+        Initialize the data processor.
+        
+        Args:
+            http_client: Shared HTTP client (defaults to the process-wide client)
+        """
         self.logger = logging.getLogger(__name__)
-        self.openaq_service = OpenAQService()
-        self.firms_service = FIRMSService()
-        self.earthdata_service = EarthdataService()
-        self.gibs_service = GIBSService()
+        self.http = http_client if http_client is not None else get_http_client()
+        
+        # One breaker per upstream-backed source; upstream failures propagate
+        # through the breaker and everything else is still reported as None
+        self._breakers = {
+            source: CircuitBreaker(source, fail_max=5, reset_timeout=10.0)
+            for source in ("precipitation", "air_quality", "weather", "uv_index", "fire_history")
+        }
+        
+        # Concurrency cap per upstream so one slow service cannot exhaust the
+        # shared connection pool (max_connections=100) and starve the others
+        self._bulkheads = {
+            "openaq": Bulkhead("openaq", 20),
+            "firms": Bulkhead("firms", 20),
+            "earthdata": Bulkhead("earthdata", 10),
+        }
+        
+        self._single_flight = SingleFlight()
+        self._memory_cache = TTLCache(max_entries=1024)
+    
+    @cached_property
+    def openaq_service(self) -> OpenAQService:
+        """OpenAQ client, created on first use."""
+        return OpenAQService(self.http)
+    
+    @cached_property
+    def firms_service(self) -> FIRMSService:
+        """FIRMS client, created on first use."""
+        return FIRMSService(self.http)
+    
+    @cached_property
+    def gibs_service(self) -> GIBSService:
+        """GIBS client, created on first use."""
+        return GIBSService()
+    
+    @cached_property
+    def earthdata_service(self) -> EarthdataService:
+        """Earthdata client, created on first use."""
+        return EarthdataService()
+    
+    async def fetch_coalesced(
+        self,
+        method: str,
+        latitude: float,
+        longitude: float,
+        radius_meters: int
+    ) -> Any:
+        """
+        Call a source method through the in-process cache, sharing the call
+        with identical in-flight ones.
+        
+        Requests for the same source and cache grid cell (see
+        app.services.cache.cache_key) reuse a recent result or await a
+        single upstream call. Only non-empty results are cached.
+        
+        Args:
+            method: Name of the DataProcessor source method (e.g., 'get_weather_data')
+            latitude: Latitude in decimal degrees
+            longitude: Longitude in decimal degrees
+            radius_meters: Search radius in meters
+            
+        Returns:
+            Result of the source method
+        """
+        key = cache_key(method, latitude, longitude, radius_meters)
+        result = self._memory_cache.get(key)
+        if result is not None:
+            return result
+        
+        result = await self._single_flight.do(
+            key,
+            getattr(self, method),
+            latitude,
+            longitude,
+            radius_meters
+        )
+        if result:
+            ttl = min(MEMORY_CACHE_TTL_SECONDS[method], seconds_until_utc_midnight())
+            self._memory_cache.set(key, result, ttl)
+        return result
+    
+    async def get_all(
+        self,
+        latitude: float,
+        longitude: float,
+        radius_meters: int,
+        methods: Sequence[str] = SOURCE_METHODS
+    ) -> List[Any]:
+        """
+        Fetch several data sources concurrently.
+        
+        The sources are independent, so they are gathered and total latency
+        is that of the slowest one rather than their sum. Identical fetches
+        already in flight are shared (see fetch_coalesced).
+        
+        Args:
+            latitude: Latitude in decimal degrees
+            longitude: Longitude in decimal degrees
+            radius_meters: Search radius in meters
+            methods: Source method names to call (defaults to all sources)
+            
+        Returns:
+            Results in the order of methods; a source that raised has its
+            exception in place of a result
+        """
+        return await asyncio.gather(
+            *(self.fetch_coalesced(method, latitude, longitude, radius_meters) for method in methods),
+            return_exceptions=True
+        )
     
     async def get_precipitation_data(
         self,
@@ -61,32 +213,36 @@ class DataProcessor:
         Returns:
             PrecipitationData or None if unavailable
         """
-        try:
-            self.logger.info("Fetching precipitation data from IMERG")
-            
-            # Convert radius to km
-            radius_km = radius_meters / 1000.0
-            
-            # Get IMERG data
-            imerg_data = self.earthdata_service.get_imerg_data(
-                latitude, longitude, radius_km, hours_back=24
-            )
-            
-            if not imerg_data:
+        async with self._bulkheads["earthdata"], self._breakers["precipitation"]:
+            try:
+                self.logger.info("Fetching precipitation data from IMERG")
+                
+                # Convert radius to km
+                radius_km = radius_meters / 1000.0
+                
+                # Get IMERG data
+                # earthaccess calls block, so run them off the event loop
+                imerg_data = await asyncio.to_thread(
+                    self.earthdata_service.get_imerg_data,
+                    latitude, longitude, radius_km, hours_back=24
+                )
+                
+                if not imerg_data:
+                    return None
+                
+                # Convert to PrecipitationData schema
+                return PrecipitationData(
+                    source="GPM IMERG",
+                    last_update=imerg_data.get("timestamp"),
+                    precipitation_rate_mm_hr=imerg_data.get("precipitation_rate_mm_hr"),
+                    confidence="high"
+                )
+                
+            except Exception as e:
+                if is_upstream_failure(e):
+                    raise
+                self.logger.error("Error fetching precipitation data: %s", e, exc_info=self.logger.isEnabledFor(logging.DEBUG))
                 return None
-            
-            # Convert to PrecipitationData schema
-            return PrecipitationData(
-                source="GPM IMERG",
-                last_update=imerg_data.get("timestamp"),
-                precipitation_rate_mm_hr=imerg_data.get("precipitation_rate_mm_hr"),
-                forecast_hours=None,
-                confidence="high"
-            )
-            
-        except Exception as e:
-            self.logger.error(f"Error fetching precipitation data: {e}", exc_info=True)
-            return None
     
     async def get_air_quality_data(
         self,
@@ -105,134 +261,146 @@ class DataProcessor:
         Returns:
             AirQualityData or None if unavailable
         """
-        try:
-            self.logger.info("Fetching air quality data from OpenAQ")
-            
-            # Convert radius to km
-            radius_km = radius_meters / 1000.0
-            
-            # Fetch data from OpenAQ
-            measurements = await self.openaq_service.get_latest_measurements(
-                latitude, longitude, radius_km
-            )
-            
-            ground_stations = None
-            if measurements:
-                # Group by location
-                stations_dict = {}
-                for measurement in measurements:
-                    location_id = measurement.get("location", "Unknown")
+        async with self._bulkheads["openaq"], self._breakers["air_quality"]:
+            try:
+                self.logger.info("Fetching air quality data from OpenAQ")
+                
+                # Convert radius to km
+                radius_km = radius_meters / 1000.0
+                
+                # Ground stations (OpenAQ) and satellite (TROPOMI) data are
+                # independent, so fetch them concurrently
+                measurements, tropomi_data = await asyncio.gather(
+                    self.openaq_service.get_latest_measurements(
+                        latitude, longitude, radius_km
+                    ),
+                    asyncio.to_thread(
+                        self.earthdata_service.get_tropomi_data,
+                        latitude, longitude, radius_km, days_back=3
+                    )
+                )
+                
+                ground_stations = None
+                if measurements:
+                    # Group raw results by location, keeping the first-seen
+                    # coordinates and update time of each station
+                    stations_raw = {}
+                    station_lats = []
+                    station_lons = []
+                    for measurement in measurements:
+                        location_id = measurement.get("location", "Unknown")
+                        station = stations_raw.get(location_id)
+                        if station is None:
+                            coords = measurement.get("coordinates", {})
+                            station_lats.append(coords.get("latitude", latitude))
+                            station_lons.append(coords.get("longitude", longitude))
+                            station = stations_raw[location_id] = (
+                                location_id,
+                                measurement.get("date", {}).get("utc", ""),
+                                []
+                            )
+                        station[2].extend(measurement.get("measurements", []))
                     
-                    if location_id not in stations_dict:
-                        coords = measurement.get("coordinates", {})
-                        lat = coords.get("latitude", latitude)
-                        lon = coords.get("longitude", longitude)
-                        
-                        # Calculate distance
-                        distance = haversine_distance(latitude, longitude, lat, lon)
-                        
-                        stations_dict[location_id] = {
-                            "location": location_id,
-                            "distance_km": round(distance, 2),
-                            "measurements": {},
-                            "last_update": measurement.get("date", {}).get("utc", "")
-                        }
+                    # Distances to all stations in one vectorized call
+                    distances = np.round(haversine_vector(
+                        latitude,
+                        longitude,
+                        np.array(station_lats, dtype=np.float32),
+                        np.array(station_lons, dtype=np.float32)
+                    ), 2).tolist()
                     
-                    # Add measurements
-                    for m in measurement.get("measurements", []):
-                        param = m.get("parameter")
-                        value = m.get("value")
-                        unit = m.get("unit")
+                    # Top 5 nearest without sorting every station
+                    nearest = heapq.nsmallest(
+                        5,
+                        zip(distances, stations_raw.values()),
+                        key=lambda t: t[0]
+                    )
+                    
+                    # Build models only for the survivors, filling one row
+                    # of averaged pollutant values per station on the way
+                    # (NaN where a station does not report a pollutant)
+                    pollutant_values = np.full((len(nearest), len(AVERAGED_POLLUTANTS)), np.nan)
+                    ground_stations_list = []
+                    for row, (distance, (location_id, last_update, raw)) in enumerate(nearest):
+                        station_measurements = {}
+                        for m in raw:
+                            param = m.get("parameter")
+                            value = m.get("value")
+                            
+                            if param in MEASUREMENT_PARAMETERS and value is not None:
+                                value = float(value)
+                                entry = Measurement.model_construct(
+                                    value=value,
+                                    unit=m.get("unit") or "",
+                                    aqi=self.openaq_service.calculate_aqi(param, value)
+                                )
+                                station_measurements[param] = entry
+                                
+                                # A repeated parameter replaces the station's
+                                # earlier value, as in its Measurements
+                                column = AVERAGED_POLLUTANTS.get(param)
+                                if column is not None:
+                                    pollutant_values[row, column] = value
                         
-                        if param and value is not None:
-                            aqi = self.openaq_service.calculate_aqi(param, value)
-                            stations_dict[location_id]["measurements"][param] = Measurement(
-                                value=value,
-                                unit=unit,
-                                aqi=aqi
-                            )
+                        # Every field was coerced above, so skip validation
+                        ground_stations_list.append(GroundStation.model_construct(
+                            location=location_id,
+                            distance_km=distance,
+                            measurements=Measurements.model_construct(**station_measurements),
+                            last_update=last_update
+                        ))
+                    
+                    # Per-pollutant means over the stations reporting it
+                    reported = ~np.isnan(pollutant_values)
+                    counts = reported.sum(axis=0).tolist()
+                    sums = np.nansum(pollutant_values, axis=0).tolist()
+                    average = {
+                        param: round(sums[column] / counts[column], 2)
+                        for param, column in AVERAGED_POLLUTANTS.items()
+                        if counts[column]
+                    }
+                    
+                    # Overall AQI follows the average PM2.5 category
+                    if average:
+                        average["overall_aqi"] = self.openaq_service.calculate_aqi(
+                            "pm25", average.get("pm25", 0)
+                        )
+                    
+                    ground_stations = GroundAirQuality(
+                        source="OpenAQ",
+                        last_update=utc_now_iso(),
+                        stations_count=len(ground_stations_list),
+                        stations=ground_stations_list,
+                        average=average if average else None
+                    )
                 
-                # Convert to list and sort by distance
-                stations_list = sorted(
-                    stations_dict.values(),
-                    key=lambda x: x["distance_km"]
-                )[:5]  # Top 5 nearest
-                
-                # Calculate averages
-                all_pm25 = []
-                all_pm10 = []
-                all_no2 = []
-                
-                for station in stations_list:
-                    if "pm25" in station["measurements"]:
-                        all_pm25.append(station["measurements"]["pm25"].value)
-                    if "pm10" in station["measurements"]:
-                        all_pm10.append(station["measurements"]["pm10"].value)
-                    if "no2" in station["measurements"]:
-                        all_no2.append(station["measurements"]["no2"].value)
-                
-                average = {}
-                if all_pm25:
-                    average["pm25"] = round(sum(all_pm25) / len(all_pm25), 2)
-                if all_pm10:
-                    average["pm10"] = round(sum(all_pm10) / len(all_pm10), 2)
-                if all_no2:
-                    average["no2"] = round(sum(all_no2) / len(all_no2), 2)
-                
-                # Determine overall AQI
-                overall_aqi = "good"
-                if average.get("pm25", 0) > 35.4:
-                    overall_aqi = "unhealthy_sensitive"
-                elif average.get("pm25", 0) > 12:
-                    overall_aqi = "moderate"
-                
-                if average:
-                    average["overall_aqi"] = overall_aqi
-                
-                # Convert to GroundStation objects
-                ground_stations_list = [
-                    GroundStation(**station) for station in stations_list
-                ]
-                
-                ground_stations = GroundAirQuality(
-                    source="OpenAQ",
-                    last_update=datetime.utcnow().isoformat() + "Z",
-                    stations_count=len(ground_stations_list),
-                    stations=ground_stations_list,
-                    average=average if average else None
-                )
-            
-            # Get satellite data from TROPOMI
-            radius_km = radius_meters / 1000.0
-            tropomi_data = self.earthdata_service.get_tropomi_data(
-                latitude, longitude, radius_km, days_back=3
-            )
-            
-            if tropomi_data:
-                satellite = SatelliteAirQuality(
-                    source=tropomi_data.get("source", "TROPOMI/Sentinel-5P"),
-                    last_update=tropomi_data.get("timestamp"),
-                    aerosol_index=tropomi_data.get("aerosol_index"),
-                    no2_mol_m2=tropomi_data.get("no2_column_mol_m2"),
-                    quality_flag=tropomi_data.get("quality_flag", "unknown")
-                )
-            else:
-                satellite = SatelliteAirQuality(
-                    source="TROPOMI/Sentinel-5P",
-                    last_update=None,
-                    aerosol_index=None,
-                    no2_mol_m2=None,
-                    quality_flag="unavailable"
+                if tropomi_data:
+                    satellite = SatelliteAirQuality(
+                        source=tropomi_data.get("source", "TROPOMI/Sentinel-5P"),
+                        last_update=tropomi_data.get("timestamp"),
+                        aerosol_index=tropomi_data.get("aerosol_index"),
+                        no2_mol_m2=tropomi_data.get("no2_column_mol_m2"),
+                        quality_flag=tropomi_data.get("quality_flag", "unknown")
+                    )
+                else:
+                    satellite = SatelliteAirQuality(
+                        source="TROPOMI/Sentinel-5P",
+                        last_update=None,
+                        aerosol_index=None,
+                        no2_mol_m2=None,
+                        quality_flag="unavailable"
+                    )
+                
+                return AirQualityData(
+                    satellite=satellite,
+                    ground_stations=ground_stations
                 )
-            
-            return AirQualityData(
-                satellite=satellite,
-                ground_stations=ground_stations
-            )
-            
-        except Exception as e:
-            self.logger.error(f"Error fetching air quality data: {e}", exc_info=True)
-            return None
+                
+            except Exception as e:
+                if is_upstream_failure(e):
+                    raise
+                self.logger.error("Error fetching air quality data: %s", e, exc_info=self.logger.isEnabledFor(logging.DEBUG))
+                return None
     
     async def get_weather_data(
         self,
@@ -251,44 +419,49 @@ class DataProcessor:
         Returns:
             WeatherData or None if unavailable
         """
-        try:
-            self.logger.info("Fetching weather data from MERRA-2")
-            
-            # Convert radius to km
-            radius_km = radius_meters / 1000.0
-            
-            # Get MERRA-2 data
-            merra2_data = self.earthdata_service.get_merra2_data(
-                latitude, longitude, radius_km, hours_back=24
-            )
-            
-            if not merra2_data:
-                return None
-            
-            # Create wind data if available
-            wind = None
-            if merra2_data.get("wind_speed_ms") is not None:
-                wind = WindData(
-                    speed_ms=merra2_data.get("wind_speed_ms"),
-                    speed_kmh=merra2_data.get("wind_speed_kmh"),
-                    direction_degrees=merra2_data.get("wind_direction_deg"),
-                    direction_cardinal=direction_to_cardinal(merra2_data.get("wind_direction_deg")) if merra2_data.get("wind_direction_deg") else None
+        async with self._bulkheads["earthdata"], self._breakers["weather"]:
+            try:
+                self.logger.info("Fetching weather data from MERRA-2")
+                
+                # Convert radius to km
+                radius_km = radius_meters / 1000.0
+                
+                # Get MERRA-2 data
+                merra2_data = await asyncio.to_thread(
+                    self.earthdata_service.get_merra2_data,
+                    latitude, longitude, radius_km, hours_back=24
                 )
-            
-            # Convert to WeatherData schema
-            return WeatherData(
-                source="MERRA-2",
-                last_update=merra2_data.get("timestamp"),
-                temperature_celsius=merra2_data.get("temperature_celsius"),
-                temperature_fahrenheit=celsius_to_fahrenheit(merra2_data.get("temperature_celsius")) if merra2_data.get("temperature_celsius") else None,
-                humidity_percent=merra2_data.get("humidity_percent"),
-                pressure_hpa=merra2_data.get("pressure_pa") / 100 if merra2_data.get("pressure_pa") else None,
-                wind=wind
-            )
-            
-        except Exception as e:
-            self.logger.error(f"Error fetching weather data: {e}", exc_info=True)
-            return None
+                
+                if not merra2_data:
+                    return None
+                
+                # Create wind data if available
+                wind = None
+                wind_direction = merra2_data.get("wind_direction_deg")
+                if merra2_data.get("wind_speed_ms") is not None and wind_direction is not None:
+                    wind = WindData(
+                        speed_m_s=merra2_data.get("wind_speed_ms"),
+                        direction_degrees=round(wind_direction) % 360,
+                        direction_cardinal=direction_to_cardinal(wind_direction)
+                    )
+                
+                pressure_pa = merra2_data.get("pressure_pa")
+                
+                # Convert to WeatherData schema
+                return WeatherData(
+                    source="MERRA-2",
+                    last_update=merra2_data.get("timestamp"),
+                    temperature_celsius=merra2_data.get("temperature_celsius"),
+                    humidity_percent=merra2_data.get("humidity_percent"),
+                    pressure_hpa=pressure_pa / 100 if pressure_pa is not None else None,
+                    wind=wind
+                )
+                
+            except Exception as e:
+                if is_upstream_failure(e):
+                    raise
+                self.logger.error("Error fetching weather data: %s", e, exc_info=self.logger.isEnabledFor(logging.DEBUG))
+                return None
     
     async def get_uv_index_data(
         self,
@@ -307,32 +480,36 @@ class DataProcessor:
         Returns:
             UVIndexData or None if unavailable
         """
-        try:
-            self.logger.info("Fetching UV index data from TROPOMI")
-            
-            # Convert radius to km
-            radius_km = radius_meters / 1000.0
-            
-            # Get UV index data
-            uv_data = self.earthdata_service.get_uv_index_data(
-                latitude, longitude, radius_km
-            )
-            
-            if not uv_data:
+        async with self._bulkheads["earthdata"], self._breakers["uv_index"]:
+            try:
+                self.logger.info("Fetching UV index data from TROPOMI")
+                
+                # Convert radius to km
+                radius_km = radius_meters / 1000.0
+                
+                # Get UV index data
+                uv_data = await asyncio.to_thread(
+                    self.earthdata_service.get_uv_index_data,
+                    latitude, longitude, radius_km
+                )
+                
+                if not uv_data:
+                    return None
+                
+                # Convert to UVIndexData schema
+                return UVIndexData(
+                    source=uv_data.get("source", "TROPOMI"),
+                    last_update=uv_data.get("timestamp"),
+                    uv_index=uv_data.get("uv_index"),
+                    category=uv_data.get("category"),
+                    risk_level=uv_data.get("risk_level")
+                )
+                
+            except Exception as e:
+                if is_upstream_failure(e):
+                    raise
+                self.logger.error("Error fetching UV index data: %s", e, exc_info=self.logger.isEnabledFor(logging.DEBUG))
                 return None
-            
-            # Convert to UVIndexData schema
-            return UVIndexData(
-                source=uv_data.get("source", "TROPOMI"),
-                last_update=uv_data.get("timestamp"),
-                uv_index=uv_data.get("uv_index"),
-                category=uv_data.get("category"),
-                risk_level=uv_data.get("risk_level")
-            )
-            
-        except Exception as e:
-            self.logger.error(f"Error fetching UV index data: {e}", exc_info=True)
-            return None
     
     async def get_fire_history_data(
         self,
@@ -351,70 +528,85 @@ class DataProcessor:
         Returns:
             FireHistoryData or None if unavailable
         """
-        try:
-            self.logger.info("Fetching fire history data from FIRMS")
-            
-            # Convert radius to km
-            radius_km = radius_meters / 1000.0
-            
-            # Fetch fires from multiple sources
-            result = await self.firms_service.get_fires_multiple_sources(
-                latitude, longitude, radius_km, days_back=7
-            )
-            
-            if not result or not result.get("fires"):
+        async with self._bulkheads["firms"], self._breakers["fire_history"]:
+            try:
+                self.logger.info("Fetching fire history data from FIRMS")
+                
+                # Convert radius to km
+                radius_km = radius_meters / 1000.0
+                
+                # Fetch fires from multiple sources
+                result = await self.firms_service.get_fires_multiple_sources(
+                    latitude, longitude, radius_km, days_back=7
+                )
+                
+                if not result or not result.get("fires"):
+                    return FireHistoryData(
+                        source="NASA FIRMS",
+                        period_days=7,
+                        last_update=utc_now_iso(),
+                        active_fires_count=0,
+                        fires=[]
+                    )
+                
+                fires = result["fires"]
+                
+                # Distances to all fires in one vectorized call
+                fire_lats = np.fromiter((f.get("latitude", 0) for f in fires), dtype=np.float32, count=len(fires))
+                fire_lons = np.fromiter((f.get("longitude", 0) for f in fires), dtype=np.float32, count=len(fires))
+                distances = np.round(haversine_vector(latitude, longitude, fire_lats, fire_lons), 2)
+                
+                # Select the closest fires in O(N), then order just those
+                nearest = np.arange(len(fires))
+                if len(fires) > MAX_FIRE_EVENTS:
+                    nearest = np.argpartition(distances, MAX_FIRE_EVENTS - 1)[:MAX_FIRE_EVENTS]
+                nearest = nearest[np.lexsort((nearest, distances[nearest]))]
+                
+                # Convert only the selected fires to FireEvent objects
+                now_iso = utc_now_iso()
+                today = now_iso[:10]
+                fire_events = []
+                for i in nearest.tolist():
+                    fire = fires[i]
+                    fire_lat = float(fire.get("latitude", 0))
+                    fire_lon = float(fire.get("longitude", 0))
+                    
+                    # Categorize confidence
+                    confidence_cat, confidence_pct = self.firms_service.categorize_confidence(
+                        fire.get("confidence", "unknown")
+                    )
+                    
+                    # Determine satellite
+                    satellite = SATELLITE_BY_SOURCE.get(fire.get("satellite_source"), "MODIS")
+                    
+                    # Numeric fields were parsed by FirmsService, so skip validation
+                    fire_event = FireEvent.model_construct(
+                        latitude=fire_lat,
+                        longitude=fire_lon,
+                        distance_km=float(distances[i]),
+                        brightness_kelvin=float(fire.get("brightness", 0)),
+                        confidence=confidence_cat,
+                        confidence_percent=confidence_pct,
+                        date=fire.get("acq_date", today),
+                        satellite=satellite
+                    )
+                    fire_events.append(fire_event)
+                
                 return FireHistoryData(
                     source="NASA FIRMS",
                     period_days=7,
-                    last_update=datetime.utcnow().isoformat() + "Z",
-                    active_fires_count=0,
-                    fires=[]
-                )
-            
-            # Convert to FireEvent objects
-            fire_events = []
-            for fire in result["fires"]:
-                # Calculate distance
-                fire_lat = fire.get("latitude", 0)
-                fire_lon = fire.get("longitude", 0)
-                distance = haversine_distance(latitude, longitude, fire_lat, fire_lon)
-                
-                # Categorize confidence
-                confidence_cat, confidence_pct = self.firms_service.categorize_confidence(
-                    fire.get("confidence", "unknown")
+                    last_update=now_iso,
+                    active_fires_count=len(fires),
+                    fires=fire_events
                 )
                 
-                # Determine satellite
-                satellite = "VIIRS" if "VIIRS" in fire.get("satellite_source", "") else "MODIS"
-                
-                fire_event = FireEvent(
-                    latitude=fire_lat,
-                    longitude=fire_lon,
-                    distance_km=round(distance, 2),
-                    brightness_kelvin=fire.get("brightness", 0),
-                    confidence=confidence_cat,
-                    confidence_percent=confidence_pct,
-                    date=fire.get("acq_date", datetime.utcnow().strftime("%Y-%m-%d")),
-                    satellite=satellite
-                )
-                fire_events.append(fire_event)
-            
-            # Sort by distance
-            fire_events.sort(key=lambda x: x.distance_km)
-            
-            return FireHistoryData(
-                source="NASA FIRMS",
-                period_days=7,
-                last_update=datetime.utcnow().isoformat() + "Z",
-                active_fires_count=len(fire_events),
-                fires=fire_events[:20]  # Limit to 20 closest
-            )
-            
-        except Exception as e:
-            self.logger.error(f"Error fetching fire history data: {e}", exc_info=True)
-            return None
+            except Exception as e:
+                if is_upstream_failure(e):
+                    raise
+                self.logger.error("Error fetching fire history data: %s", e, exc_info=self.logger.isEnabledFor(logging.DEBUG))
+                return None
     
-    def get_gibs_imagery(
+    async def get_gibs_imagery(
         self,
         latitude: float,
         longitude: float,
@@ -423,6 +615,11 @@ class DataProcessor:
         """
         Get GIBS satellite imagery URLs for a location.
         
+        Image URLs are built locally from the bounding box and date, so this
+        runs directly on the event loop. The WMS server is only contacted by
+        GIBSService.get_available_layers and get_layer_info, which this
+        does not use.
+        
         Args:
             latitude: Latitude in decimal degrees
             longitude: Longitude in decimal degrees
@@ -432,7 +629,7 @@ class DataProcessor:
             Dictionary with imagery URLs or None
         """
         try:
-            self.logger.info(f"Fetching GIBS imagery for ({latitude}, {longitude})")
+            self.logger.info("Fetching GIBS imagery for (%s, %s)", latitude, longitude)
             
             radius_km = radius_meters / 1000.0
             
@@ -444,20 +641,12 @@ class DataProcessor:
             )
             
             if imagery_data:
-                self.logger.info(f"Successfully fetched GIBS imagery: {len(imagery_data.get('imagery', {}))} layers")
+                self.logger.info("Successfully fetched GIBS imagery: %d layers", len(imagery_data.get("imagery", {})))
                 return imagery_data
             else:
                 self.logger.warning("No GIBS imagery data available")
                 return None
                 
         except Exception as e:
-            self.logger.error(f"Error fetching GIBS imagery: {e}", exc_info=True)
+            self.logger.error("Error fetching GIBS imagery: %s", e, exc_info=self.logger.isEnabledFor(logging.DEBUG))
             return None
-    
-    async def close(self):
-        """Close all service connections."""
-        try:
-            await self.openaq_service.close()
-            await self.firms_service.close()
-        except Exception as e:
-            self.logger.error(f"Error closing services: {e}")
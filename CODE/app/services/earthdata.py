@@ -1,26 +1,488 @@
 """Service for interacting with NASA Earthdata using earthaccess."""
 
 import logging
-from typing import Optional, List, Any, Dict
+from typing import Callable, NamedTuple, Optional, List, Any, Dict, Tuple
 from datetime import datetime, timedelta
 import os
 import math
+import hashlib
+import importlib.util
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 
-try:
-    import earthaccess
-except ImportError:
-    earthaccess = None
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from app.config import get_settings
-from app.utils.netcdf_processor import NetCDFProcessor, HDF5Processor
+from app.services.cache import TTLCache, get_search_cache, get_value_cache
+from app.utils.netcdf_processor import HAS_H5NETCDF, NetCDFProcessor, HDF5Processor
+from app.utils.resilience import TokenBucket, is_upstream_failure
+from app.utils.time_utils import utc_now_iso
 
 logger = logging.getLogger(__name__)
 settings = get_settings()
 
+# earthaccess pulls in a large dependency tree (s3fs, aiobotocore, pandas),
+# so it is only imported on first use instead of at application startup.
+HAS_EARTHACCESS = importlib.util.find_spec("earthaccess") is not None
+
+
+# How long CMR search results are reused, per dataset, matched to how often
+# new granules appear
+SEARCH_TTL_SECONDS: Dict[str, int] = {
+    "GPM_3IMERGHHE": 30 * 60,       # half-hourly
+    "M2I1NXASM": 6 * 60 * 60,       # MERRA-2, published with a lag
+}
+DEFAULT_SEARCH_TTL_SECONDS = 60 * 60
+
+# Grid (degrees) that search locations are snapped to in cache keys; the
+# gridded granules searched here cover far more than one cell
+SEARCH_GRID_DEGREES = 0.25
+
+# Searches also kept in memory in front of the disk cache, so repeats skip
+# the SQLite read and unpickling of the granule metadata. Searches with the
+# same key are serialized through one of the striped locks.
+RECENT_SEARCH_TTL_SECONDS = 5 * 60
+_recent_searches = TTLCache(max_entries=256)
+_recent_searches_lock = threading.Lock()
+_search_locks = [threading.Lock() for _ in range(64)]
+
+# IMERG precipitation variable names across product versions, in order of
+# preference (calibrated first)
+IMERG_PRECIP_VARIABLES = ("precipitationCal", "precipitation", "precip", "HQprecipitation")
+
+# MERRA-2 single-level variables read for weather data
+MERRA2_VARIABLES = (
+    "T2M",      # Temperature at 2m
+    "U2M",      # U wind component at 2m
+    "V2M",      # V wind component at 2m
+    "QV2M",     # Specific humidity at 2m
+    "PS",       # Surface pressure
+)
+
+
+class ProductSpec(NamedTuple):
+    """One gridded Earthdata product read by EarthdataService._fetch_product."""
+    
+    label: str                          # Name used in logs
+    source: str                         # Source reported in results
+    short_name: str                     # CMR collection short name
+    days_back: int                      # Days searched back from today
+    count: int                          # Granules requested per search
+    grid: Tuple[float, float]           # Cell size (lat, lon) in degrees
+    grid_origin: Tuple[float, float]    # Corner (lat, lon) of cell (0, 0)
+    variables: Tuple[str, ...]          # Variable names read from granules
+
+
+# Cells are centred on MERRA-2 grid points, so a cell holds every location
+# whose nearest grid point is the same
+PRODUCTS: Dict[str, ProductSpec] = {
+    "imerg": ProductSpec(
+        "IMERG", "GPM IMERG", "GPM_3IMERGHHE", 7, 5, (0.1, 0.1), (-90.0, -180.0),
+        IMERG_PRECIP_VARIABLES
+    ),
+    "merra2": ProductSpec(
+        "MERRA-2", "MERRA-2", "M2I1NXASM", 3, 3, (0.5, 0.625), (-0.25, -0.3125),
+        MERRA2_VARIABLES
+    ),
+}
+
+# Earthdata Login (URS) attempts allowed per process, and the backoff after
+# failed logins: doubling per consecutive failure up to the cap, and at least
+# the locked-account wait when URS reports the account locked
+LOGINS_PER_MINUTE = 5
+AUTH_BACKOFF_SECONDS = 2 * 60
+AUTH_BACKOFF_MAX_SECONDS = 60 * 60
+AUTH_LOCKED_BACKOFF_SECONDS = 10 * 60
+
+# Locations fetched at once by warm_up
+WARMUP_WORKERS = 4
+
+
+def _search_cache_key(count: int, kwargs: Dict[str, Any]) -> str:
+    """
+    Build the on-disk cache key for an earthaccess.search_data call.
+    
+    Args:
+        count: Maximum number of results
+        kwargs: Remaining search_data keyword arguments
+        
+    Returns:
+        Hex digest identifying the search
+    """
+    parts = [f"count={count}"]
+    for name, value in sorted(kwargs.items()):
+        if name == "circle":
+            lon, lat, radius_m = value
+            value = (_snap(lon), _snap(lat), radius_m)
+        elif name == "bounding_box":
+            value = tuple(_snap(v) for v in value)
+        parts.append(f"{name}={value}")
+    return hashlib.blake2b("|".join(parts).encode(), digest_size=16).hexdigest()
+
+
+def _search_circle(latitude: float, longitude: float, radius_km: float) -> Tuple[float, float, int]:
+    """
+    Build the CMR spatial filter for a point search.
+    
+    Args:
+        latitude: Latitude in decimal degrees
+        longitude: Longitude in decimal degrees
+        radius_km: Search radius in kilometers (at least 1 km is used)
+        
+    Returns:
+        Circle as (lon, lat, radius_m), as earthaccess expects
+    """
+    return (longitude, latitude, int(max(radius_km, 1.0) * 1000))
+
+
+def _search_temporal(days_back: int) -> Tuple[str, str]:
+    """
+    Build the CMR temporal filter covering the last days_back days.
+    
+    Args:
+        days_back: Number of days before today to include
+        
+    Returns:
+        Tuple of (start_date, end_date) as YYYY-MM-DD strings
+    """
+    return _temporal_window(int(time.time() // 86400), days_back)
+
+
+@lru_cache(maxsize=8)
+def _temporal_window(day: int, days_back: int) -> Tuple[str, str]:
+    """
+    Format the temporal filter once per UTC day.
+    
+    Args:
+        day: Days since the Unix epoch (UTC) of the window's end date
+        days_back: Number of days before the end date to include
+        
+    Returns:
+        Tuple of (start_date, end_date) as YYYY-MM-DD strings
+    """
+    end_time = datetime.utcfromtimestamp(day * 86400)
+    start_time = end_time - timedelta(days=days_back)
+    return start_time.strftime("%Y-%m-%d"), end_time.strftime("%Y-%m-%d")
+
+
+def _round2(value: Optional[float]) -> Optional[float]:
+    """Round a value to 2 decimals as a plain float, keeping None."""
+    return None if value is None else round(float(value), 2)
+
+
+def _granule_value_key(granule: Any, latitude: float, longitude: float) -> Optional[str]:
+    """
+    Build the value cache key for a point in a granule.
+    
+    Args:
+        granule: DataGranule from search_data
+        latitude: Latitude in decimal degrees
+        longitude: Longitude in decimal degrees
+        
+    Returns:
+        Key of the form {granule_id}:{lat}:{lon}, or None if the granule has no id
+    """
+    if not isinstance(granule, dict):
+        return None
+    granule_id = granule.get("umm", {}).get("GranuleUR") or granule.get("meta", {}).get("native-id")
+    if not granule_id:
+        return None
+    return f"{granule_id}:{round(latitude, 3)}:{round(longitude, 3)}"
+
+
+def _opendap_url(granule: Any) -> Optional[str]:
+    """
+    Get the OPeNDAP data URL from a granule's UMM related URLs.
+    
+    Args:
+        granule: DataGranule from search_data
+        
+    Returns:
+        HTTPS OPeNDAP URL without any .html/.dmr form suffix, or None
+    """
+    if not isinstance(granule, dict):
+        return None
+    for link in granule.get("umm", {}).get("RelatedUrls", []):
+        url = link.get("URL", "")
+        if link.get("Subtype") == "OPENDAP DATA" and url.startswith("https://"):
+            for suffix in (".html", ".dmr"):
+                url = url.removesuffix(suffix)
+            return url
+    return None
+
+
+def _snap(degrees: float) -> float:
+    """Snap a coordinate to the search cache grid."""
+    return round(degrees / SEARCH_GRID_DEGREES) * SEARCH_GRID_DEGREES
+
+
+def _merra2_weather(variables: Dict[str, Optional[float]]) -> Dict[str, Any]:
+    """
+    Derive the weather result fields from MERRA-2 variables.
+    
+    Args:
+        variables: MERRA2_VARIABLES values, with at least T2M set
+        
+    Returns:
+        Dictionary of temperature, wind, humidity and pressure fields
+    """
+    # Calculate wind speed and direction if we have components
+    wind_speed_ms = None
+    wind_direction_deg = None
+    
+    if variables["U2M"] is not None and variables["V2M"] is not None:
+        u = variables["U2M"]
+        v = variables["V2M"]
+        wind_speed_ms = math.hypot(u, v)
+        wind_direction_deg = (math.degrees(math.atan2(u, v)) + 180) % 360
+    
+    # Convert temperature from Kelvin to Celsius
+    temp_celsius = variables["T2M"] - 273.15
+    
+    # Calculate relative humidity if we have specific humidity and temperature
+    relative_humidity = None
+    if variables["QV2M"] is not None and variables["T2M"] is not None:
+        # Simplified calculation
+        relative_humidity = min(100, variables["QV2M"] * 1000)  # Rough approximation
+    
+    return {
+        "temperature_celsius": _round2(temp_celsius),
+        "temperature_kelvin": _round2(variables["T2M"]),
+        "wind_speed_ms": _round2(wind_speed_ms),
+        "wind_speed_kmh": _round2(wind_speed_ms * 3.6 if wind_speed_ms is not None else None),
+        "wind_direction_deg": _round2(wind_direction_deg),
+        "humidity_percent": _round2(relative_humidity),
+        "pressure_pa": _round2(variables["PS"]),
+    }
+
+
+# Values extracted from a granule at a point. Published granules do not
+# change, so the TTL only bounds the size of the cache file.
+GRANULE_VALUE_TTL_SECONDS = 24 * 60 * 60
+
+# Processed per-point results, shared by every instance and worker thread.
+# Keys identify the product grid cell that nearest-neighbour extraction
+# reads, so points in the same cell share an entry.
+RESULT_TTL_SECONDS = 30 * 60
+_result_cache = TTLCache(max_entries=1024)
+_result_cache_lock = threading.Lock()
+
+
+def _get_cached_result(key: tuple, latitude: float, longitude: float) -> Optional[Dict[str, Any]]:
+    """
+    Get a cached product result, relabelled with the requested point.
+    
+    Args:
+        key: Result cache key
+        latitude: Requested latitude in decimal degrees
+        longitude: Requested longitude in decimal degrees
+        
+    Returns:
+        Copy of the cached result dictionary, or None
+    """
+    with _result_cache_lock:
+        result = _result_cache.get(key)
+    if result is None:
+        return None
+    return {**result, "latitude": latitude, "longitude": longitude}
+
+
+def _store_result(key: tuple, result: Dict[str, Any]) -> None:
+    """Cache a processed product result for RESULT_TTL_SECONDS."""
+    with _result_cache_lock:
+        _result_cache.set(key, result, RESULT_TTL_SECONDS)
+
+
+# Granule files downloaded at once across all requests, and the
+# (connect, read) timeout in seconds for each file
+DOWNLOAD_WORKERS = 8
+DOWNLOAD_TIMEOUT = (10, 60)
+
+# Shared by every download_granules call, so concurrent requests queue for
+# the same bounded set of transfers instead of each starting its own threads
+_download_pool = ThreadPoolExecutor(max_workers=DOWNLOAD_WORKERS, thread_name_prefix="earthdata-download")
+
+# Files at least this large are fetched as parallel HTTP range requests
+MULTIPART_MIN_BYTES = 32 * 1024 * 1024
+MULTIPART_PART_BYTES = 8 * 1024 * 1024
+MULTIPART_WORKERS = 4
+
+# Attempts per file; later attempts resume from the bytes already received.
+# Only dropped connections and timeouts are retried.
+DOWNLOAD_ATTEMPTS = 3
+RESUMABLE_ERRORS = (
+    requests.exceptions.ConnectionError,
+    requests.exceptions.ChunkedEncodingError,
+    requests.exceptions.Timeout,
+)
+
+# Files in the download directory that are not granules (see
+# _prune_download_dir)
+_NOT_GRANULE_SUFFIXES = (".partial", ".partial.meta", ".sqlite", ".sqlite-wal", ".sqlite-shm", ".lock")
+
+# Extensions of the NetCDF/HDF5 granule files the processors can read
+_NETCDF_SUFFIXES = frozenset({".nc", ".nc4", ".hdf", ".h5", ".he5"})
+
+_download_locks: Dict[str, threading.Lock] = {}
+_download_locks_guard = threading.Lock()
+
+
+def _download_lock(path: str) -> threading.Lock:
+    """Get the lock serializing downloads of one local file."""
+    with _download_locks_guard:
+        return _download_locks.setdefault(path, threading.Lock())
+
+
+def _read_validator(meta_path: str) -> str:
+    """Read the ETag/Last-Modified recorded for a partial download."""
+    try:
+        with open(meta_path) as f:
+            return f.read().strip()
+    except OSError:
+        return ""
+
+
+def _write_validator(meta_path: str, validator: str) -> None:
+    """Record the validator of a partial download, or clear it if unknown."""
+    if validator:
+        with open(meta_path, "w") as f:
+            f.write(validator)
+    else:
+        _remove_if_exists(meta_path)
+
+
+def _expected_files(granule: Any) -> Dict[str, Dict[str, Any]]:
+    """
+    Read expected file sizes and checksums from a granule's UMM metadata.
+    
+    Args:
+        granule: DataGranule (a dict of CMR UMM-JSON)
+        
+    Returns:
+        Dictionary of file name -> {"size": bytes, "algorithm", "checksum"}
+        with whichever fields CMR provides
+    """
+    if not isinstance(granule, dict):
+        return {}
+    info = granule.get("umm", {}).get("DataGranule", {}).get("ArchiveAndDistributionInformation", [])
+    expected = {}
+    for item in info:
+        name = item.get("Name")
+        if not name:
+            continue
+        entry: Dict[str, Any] = {}
+        # Sizes are only exact when reported in bytes
+        if item.get("SizeInBytes"):
+            entry["size"] = int(item["SizeInBytes"])
+        checksum = item.get("Checksum") or {}
+        algorithm = str(checksum.get("Algorithm", "")).lower().replace("-", "")
+        if checksum.get("Value") and algorithm in hashlib.algorithms_guaranteed:
+            entry["algorithm"] = algorithm
+            entry["checksum"] = checksum["Value"].lower()
+        expected[name] = entry
+    return expected
+
+
+def _verify_file(path: str, expected: Optional[Dict[str, Any]]) -> Optional[str]:
+    """
+    Check a downloaded file against its expected size and checksum.
+    
+    Args:
+        path: File to check
+        expected: Entry from _expected_files, or None to skip the checks
+        
+    Returns:
+        Description of the mismatch, or None if the file is valid
+    """
+    if not expected:
+        return None
+    if "size" in expected and os.path.getsize(path) != expected["size"]:
+        return f"size {os.path.getsize(path)} != expected {expected['size']}"
+    if "checksum" in expected:
+        digest = hashlib.new(expected["algorithm"])
+        with open(path, "rb") as f:
+            for block in iter(lambda: f.read(1024 * 1024), b""):
+                digest.update(block)
+        if digest.hexdigest() != expected["checksum"]:
+            return f"{expected['algorithm']} checksum mismatch"
+    return None
+
+
+def _prune_download_dir(download_dir: str, max_bytes: int) -> None:
+    """
+    Delete the least recently used granule files beyond a size budget.
+    
+    Reused files have their mtime refreshed by _download_file, so mtime
+    order is use order. Cache databases and partial downloads are kept.
+    
+    Args:
+        download_dir: Directory granules are downloaded to
+        max_bytes: Total size of granule files to keep
+    """
+    try:
+        entries = [
+            entry for entry in os.scandir(download_dir)
+            if entry.is_file() and not entry.name.endswith(_NOT_GRANULE_SUFFIXES)
+        ]
+        stats = sorted(((entry.stat(), entry.path) for entry in entries), key=lambda item: item[0].st_mtime)
+    except OSError as e:
+        logger.warning(f"Could not scan {download_dir} for pruning: {e}")
+        return
+    
+    total = sum(stat.st_size for stat, _ in stats)
+    for stat, path in stats:
+        if total <= max_bytes:
+            break
+        with _download_lock(path):
+            _remove_if_exists(path)
+        total -= stat.st_size
+        logger.info(f"Pruned cached granule {os.path.basename(path)}")
+
+
+def _remove_if_exists(path: str) -> None:
+    """Delete a file, ignoring a missing one."""
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+def _earthaccess():
+    """Import and return the earthaccess module on first use."""
+    import earthaccess
+    return earthaccess
+
+
+def _s3_direct_access(granule: Any) -> bool:
+    """
+    Check whether earthaccess.open would read a granule straight from S3.
+    
+    Args:
+        granule: DataGranule from search_data
+        
+    Returns:
+        True for cloud-hosted granules when running in AWS us-west-2
+    """
+    if not getattr(granule, "cloud_hosted", False):
+        return False
+    store = getattr(_earthaccess(), "__store__", None)
+    return bool(getattr(store, "in_region", False))
+
 
 class EarthdataService:
-    """Service for accessing NASA Earthdata using earthaccess library."""
+    """
+    Service for accessing NASA Earthdata using earthaccess library.
+    
+    All methods block on network and file I/O. Async callers run them with
+    asyncio.to_thread and gather independent products (IMERG, MERRA-2)
+    rather than awaiting them one after the other, as DataProcessor.get_all
+    does.
+    """
     
     # Class-level authentication state to prevent multiple attempts
     _auth_attempted = False
@@ -28,6 +490,18 @@ class EarthdataService:
     _shared_auth = None
     _attempted_methods: set[str] = set()  # {"token", "env", "netrc"}
     _backoff_until: Optional[datetime] = None  # skip auth attempts until this time
+    _auth_lock = threading.Lock()  # one login at a time; others wait for its result
+    _auth_failures = 0  # consecutive failed logins, for exponential backoff
+    
+    # Outbound request rates shared by all instances (see Settings)
+    _login_limiter = TokenBucket(LOGINS_PER_MINUTE / 60.0, capacity=LOGINS_PER_MINUTE)
+    _cmr_limiter = TokenBucket(settings.cmr_requests_per_second)
+    _download_limiter = TokenBucket(settings.earthdata_downloads_per_second)
+    
+    # Download session shared by all instances, tied to the auth it came from
+    _session: Optional[requests.Session] = None
+    _session_auth = None
+    _session_lock = threading.Lock()
     
     def __init__(self):
         """
@@ -42,7 +516,7 @@ class EarthdataService:
         self.netcdf_processor = NetCDFProcessor()
         self.hdf5_processor = HDF5Processor()
         
-        if earthaccess is None:
+        if not HAS_EARTHACCESS:
             logger.error("earthaccess library not installed. Install with: pip install earthaccess")
             self.authenticated = False
             self.auth = None
@@ -90,7 +564,7 @@ class EarthdataService:
                 os.environ.pop("EARTHDATA_PASSWORD", None)
                 logger.info("🔑 Using EARTHDATA_TOKEN for authentication")
                 logger.info("🔐 Attempting NASA Earthdata authentication (token, single attempt)...")
-                self.auth = earthaccess.login(strategy="environment", persist=False)
+                self.auth = _earthaccess().login(strategy="environment", persist=False)
             elif method == "env":
                 # Ensure user/pass are in environment and remove token to force user/pass
                 if settings.earthdata_username:
@@ -100,11 +574,11 @@ class EarthdataService:
                 os.environ.pop("EARTHDATA_TOKEN", None)
                 logger.info("👤 Using EARTHDATA_USERNAME/PASSWORD for authentication")
                 logger.info("🔐 Attempting NASA Earthdata authentication (user/pass, single attempt)...")
-                self.auth = earthaccess.login(strategy="environment", persist=False)
+                self.auth = _earthaccess().login(strategy="environment", persist=False)
             elif method == "netrc":
                 logger.info("📄 Using .netrc for authentication")
                 logger.info("🔐 Attempting NASA Earthdata authentication (.netrc, single attempt)...")
-                self.auth = earthaccess.login(strategy="netrc", persist=False)
+                self.auth = _earthaccess().login(strategy="netrc", persist=False)
             else:
                 logger.error(f"Unknown authentication method: {method}")
                 self.auth = None
@@ -124,13 +598,14 @@ class EarthdataService:
             EarthdataService._shared_auth = self.auth if success else None
 
             if success:
+                EarthdataService._auth_failures = 0
                 logger.info("✅ Successfully authenticated with NASA Earthdata")
             else:
                 logger.error("❌ Authentication failed for method '%s'", method)
                 logger.warning("⚠️ Not retrying other methods in the same request to prevent lockout")
                 self._log_auth_help()
-                # Set short backoff to avoid repeated attempts causing lockout (2 minutes)
-                EarthdataService._backoff_until = datetime.utcnow() + timedelta(minutes=2)
+                # Back off to avoid repeated attempts causing lockout
+                self._record_auth_failure(locked=False)
         except Exception as e:
             EarthdataService._attempted_methods.add(method)
             logger.error(f"❌ Authentication error using method '{method}': {e}")
@@ -140,10 +615,25 @@ class EarthdataService:
             EarthdataService._auth_successful = False
             EarthdataService._shared_auth = None
             msg = str(e).lower()
-            if "locked" in msg or "invalid_account_status" in msg:
-                EarthdataService._backoff_until = datetime.utcnow() + timedelta(minutes=10)
-            else:
-                EarthdataService._backoff_until = datetime.utcnow() + timedelta(minutes=2)
+            self._record_auth_failure(locked="locked" in msg or "invalid_account_status" in msg)
+    
+    @classmethod
+    def _record_auth_failure(cls, locked: bool) -> None:
+        """
+        Start the backoff window after a failed login.
+        
+        The window doubles with each consecutive failure, from
+        AUTH_BACKOFF_SECONDS up to AUTH_BACKOFF_MAX_SECONDS, and is at least
+        AUTH_LOCKED_BACKOFF_SECONDS when URS reports the account locked.
+        
+        Args:
+            locked: Whether the failure says the account is locked
+        """
+        cls._auth_failures += 1
+        seconds = min(AUTH_BACKOFF_SECONDS * 2 ** (cls._auth_failures - 1), AUTH_BACKOFF_MAX_SECONDS)
+        if locked:
+            seconds = max(seconds, AUTH_LOCKED_BACKOFF_SECONDS)
+        cls._backoff_until = datetime.utcnow() + timedelta(seconds=seconds)
         
     @classmethod
     def reset_authentication(cls):
@@ -159,6 +649,9 @@ class EarthdataService:
         cls._shared_auth = None
         cls._attempted_methods = set()
         cls._backoff_until = None
+        cls._auth_failures = 0
+        cls._session = None
+        cls._session_auth = None
 
     def ensure_authenticated(self) -> bool:
         """Ensure there is an authenticated session, attempting at most one method now.
@@ -171,21 +664,34 @@ class EarthdataService:
             self.auth = EarthdataService._shared_auth
             return True
 
-        # Respect backoff window
-        if EarthdataService._backoff_until and datetime.utcnow() < EarthdataService._backoff_until:
-            wait_s = int((EarthdataService._backoff_until - datetime.utcnow()).total_seconds())
-            logger.warning(f"⏳ Skipping authentication due to backoff window ({wait_s}s remaining)")
-            self.authenticated = False
-            return False
+        # Concurrent callers (IMERG and MERRA-2 run in parallel worker
+        # threads) wait here for a single login instead of each starting one
+        with EarthdataService._auth_lock:
+            # Another thread may have logged in while this one waited
+            if EarthdataService._auth_successful:
+                self.authenticated = True
+                self.auth = EarthdataService._shared_auth
+                return True
 
-        # Pick and attempt exactly one method
-        method = self._choose_next_auth_method()
-        if not method:
-            # No methods left to try this run
-            self.authenticated = False
-            return False
-        self._authenticate_once(method)
-        return bool(self.authenticated)
+            # Respect backoff window
+            if EarthdataService._backoff_until and datetime.utcnow() < EarthdataService._backoff_until:
+                wait_s = int((EarthdataService._backoff_until - datetime.utcnow()).total_seconds())
+                logger.warning(f"⏳ Skipping authentication due to backoff window ({wait_s}s remaining)")
+                self.authenticated = False
+                return False
+
+            # Pick and attempt exactly one method
+            method = self._choose_next_auth_method()
+            if not method:
+                # No methods left to try this run
+                self.authenticated = False
+                return False
+            if not EarthdataService._login_limiter.try_acquire():
+                logger.warning(f"⏳ Skipping authentication: over {LOGINS_PER_MINUTE} logins per minute")
+                self.authenticated = False
+                return False
+            self._authenticate_once(method)
+            return bool(self.authenticated)
     
     def _log_auth_help(self):
         """Log helpful information for authentication issues."""
@@ -225,6 +731,11 @@ class EarthdataService:
             
         Returns:
             List of granules
+            
+        Raises:
+            Exception: Connection errors, timeouts and 5xx responses from
+                CMR (see is_upstream_failure), so callers' circuit breakers
+                see the outage; other errors return an empty list
         """
         if not self.ensure_authenticated():
             logger.warning("Not authenticated with NASA Earthdata (skipping search)")
@@ -249,14 +760,55 @@ class EarthdataService:
             if cloud_hosted is not None:
                 kwargs["cloud_hosted"] = cloud_hosted
 
-            results = earthaccess.search_data(
-                count=count,
-                **kwargs
-            )
-            logger.info(f"Found {len(results)} granules for {short_name}")
-            return results
+            # Nearby and repeated requests reuse a recent CMR search, from
+            # memory first and then from the disk cache shared by workers
+            key = _search_cache_key(count, kwargs)
+            ttl = SEARCH_TTL_SECONDS.get(short_name, DEFAULT_SEARCH_TTL_SECONDS)
+            with _recent_searches_lock:
+                cached = _recent_searches.get(key)
+            if cached is not None:
+                return cached
+            
+            # Identical concurrent searches wait for the first one's result
+            with _search_locks[hash(key) % len(_search_locks)]:
+                with _recent_searches_lock:
+                    cached = _recent_searches.get(key)
+                if cached is not None:
+                    return cached
+                
+                search_cache = get_search_cache()
+                if search_cache is not None:
+                    try:
+                        cached = search_cache.get(key)
+                    except Exception as e:
+                        logger.warning(f"Search cache read failed: {e}")
+                        cached = None
+                    if cached is not None:
+                        logger.info(f"Using {len(cached)} cached granules for {short_name}")
+                        with _recent_searches_lock:
+                            _recent_searches.set(key, cached, min(ttl, RECENT_SEARCH_TTL_SECONDS))
+                        return cached
+
+                self._cmr_limiter.acquire()
+                results = _earthaccess().search_data(
+                    count=count,
+                    **kwargs
+                )
+                logger.info(f"Found {len(results)} granules for {short_name}")
+                
+                if results:
+                    with _recent_searches_lock:
+                        _recent_searches.set(key, results, min(ttl, RECENT_SEARCH_TTL_SECONDS))
+                    if search_cache is not None:
+                        try:
+                            search_cache.set(key, list(results), ttl)
+                        except Exception as e:
+                            logger.warning(f"Search cache write failed: {e}")
+                return results
         except Exception as e:
             logger.error(f"Error searching for {short_name}: {e}")
+            if is_upstream_failure(e):
+                raise
             return []
     
     def download_granules(
@@ -273,6 +825,10 @@ class EarthdataService:
             
         Returns:
             List of downloaded file paths as strings
+            
+        Raises:
+            Exception: Upstream failures (see is_upstream_failure); other
+                failed files are skipped
         """
         if not self.ensure_authenticated():
             logger.warning("❌ Not authenticated with NASA Earthdata (skipping download)")
@@ -288,30 +844,28 @@ class EarthdataService:
         # Create download directory if it doesn't exist
         os.makedirs(download_dir, exist_ok=True)
         
+        # Everything reachable over HTTPS goes through the shared bearer-token
+        # session; earthaccess.download (and its own credential handshakes) is
+        # only used for anything else
+        if self.auth is not None and all(isinstance(g, str) or hasattr(g, "data_links") for g in granules):
+            return self._download_parallel(granules, download_dir)
+        
         try:
             logger.info(f"Downloading {len(granules)} granule(s) to {download_dir}")
             
             # earthaccess.download() returns a list of file paths
             # It handles authentication automatically using the auth object
-            files = earthaccess.download(
+            files = _earthaccess().download(
                 granules,
                 local_path=download_dir
             )
             
-            # Ensure we have string paths
-            file_paths = []
-            for f in files:
-                if isinstance(f, (str, Path)):
-                    file_paths.append(str(f))
-                elif hasattr(f, '__fspath__'):
-                    file_paths.append(os.fspath(f))
-                else:
-                    logger.warning(f"Unexpected file type: {type(f)}, value: {f}")
-                    # Try to convert to string anyway
-                    try:
-                        file_paths.append(str(f))
-                    except:
-                        pass
+            # earthaccess returns str/Path entries (None for failed files)
+            if logger.isEnabledFor(logging.DEBUG):
+                for f in files:
+                    if f is not None and not isinstance(f, (str, Path)):
+                        logger.debug(f"Unexpected file type: {type(f)}, value: {f}")
+            file_paths = [str(f) for f in files if f is not None]
             
             logger.info(f"✅ Successfully downloaded {len(file_paths)} file(s)")
             return file_paths
@@ -319,123 +873,586 @@ class EarthdataService:
         except Exception as e:
             logger.error(f"❌ Error downloading granules: {e}")
             logger.info("Check your NASA Earthdata credentials and network connection")
+            if is_upstream_failure(e):
+                raise
             return []
     
-    def get_imerg_data(
+    def _download_parallel(self, granules: List[Any], download_dir: str) -> List[str]:
+        """
+        Download the files of search results concurrently.
+        
+        All files share the long-lived authenticated session (see
+        _get_session).
+        
+        Args:
+            granules: DataGranule results from search_data(), or HTTPS URLs
+            download_dir: Directory to download to
+            
+        Returns:
+            List of downloaded file paths, in granule order, without failures
+        """
+        downloads = []
+        for granule in granules:
+            expected = _expected_files(granule)
+            links = [granule] if isinstance(granule, str) else granule.data_links(access="external")
+            for url in links:
+                downloads.append((url, expected.get(url.rsplit("/", 1)[-1])))
+        if not downloads:
+            logger.warning("Granules have no download links")
+            return []
+        
+        logger.info(f"Downloading {len(downloads)} file(s) to {download_dir}")
+        session = self._get_session()
+        paths = list(_download_pool.map(
+            lambda download: self._download_file(session, *download, download_dir=download_dir),
+            downloads
+        ))
+        
+        file_paths = [path for path in paths if path is not None]
+        logger.info(f"✅ Successfully downloaded {len(file_paths)} file(s)")
+        _prune_download_dir(download_dir, settings.granule_cache_max_mb * 1024 * 1024)
+        return file_paths
+    
+    def _get_session(self) -> requests.Session:
+        """
+        Get the long-lived authenticated session used for downloads.
+        
+        One session (and its keep-alive connection pool) is shared by all
+        downloads until authentication changes, so DAAC hosts are not
+        handshaken again for every file. Transient 5xx responses and
+        connection failures are retried by the transport with backoff.
+        
+        Returns:
+            requests.Session carrying the Earthdata bearer token
+        """
+        with EarthdataService._session_lock:
+            if EarthdataService._session is None or EarthdataService._session_auth is not self.auth:
+                session = self.auth.get_session()
+                retry = Retry(
+                    total=3,
+                    backoff_factor=0.5,
+                    status_forcelist=(500, 502, 503, 504),
+                    allowed_methods=frozenset({"GET", "HEAD"}),
+                    raise_on_status=False,
+                )
+                adapter = HTTPAdapter(pool_connections=32, pool_maxsize=32, max_retries=retry)
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                EarthdataService._session = session
+                EarthdataService._session_auth = self.auth
+            return EarthdataService._session
+    
+    def _download_file(
+        self,
+        session: Any,
+        url: str,
+        expected: Optional[Dict[str, Any]] = None,
+        download_dir: str = ""
+    ) -> Optional[str]:
+        """
+        Download one file unless it is already present.
+        
+        The body is written to ``<file>.partial`` and moved into place when
+        complete, so an interrupted transfer never looks like a cached file.
+        A ``.meta`` sidecar records the server's validator (ETag or
+        Last-Modified) so an interrupted transfer resumes where it stopped,
+        both on the next attempt here and on later calls. Completed files
+        are checked against the size and checksum from the granule metadata
+        before they are moved into place, so files found in the download
+        directory can be reused as is.
+        
+        Args:
+            session: Authenticated requests session
+            url: File URL
+            expected: Expected size/checksum (see _expected_files), if known
+            download_dir: Directory to download to
+            
+        Returns:
+            Local file path, or None if the download failed
+            
+        Raises:
+            Exception: Upstream failures (see is_upstream_failure) once the
+                resume attempts are used up
+        """
+        if "opendap" in url and url.endswith(".html"):
+            url = url[:-len(".html")]
+        path = os.path.join(download_dir, url.rsplit("/", 1)[-1])
+        
+        with _download_lock(path):
+            if os.path.exists(path):
+                # Mark as recently used so pruning evicts it last
+                os.utime(path)
+                return path
+            
+            for attempt in range(DOWNLOAD_ATTEMPTS):
+                try:
+                    self._fetch_to_partial(session, url, path + ".partial")
+                    break
+                except Exception as e:
+                    if not isinstance(e, RESUMABLE_ERRORS) or attempt == DOWNLOAD_ATTEMPTS - 1:
+                        logger.error(f"❌ Error downloading {url}: {e}")
+                        if is_upstream_failure(e):
+                            raise
+                        return None
+                    logger.warning(f"Download of {url} interrupted ({e}); resuming")
+            
+            problem = _verify_file(path + ".partial", expected)
+            if problem:
+                logger.error(f"❌ Discarding download of {url}: {problem}")
+                _remove_if_exists(path + ".partial")
+                _remove_if_exists(path + ".partial.meta")
+                return None
+            
+            os.replace(path + ".partial", path)
+            _remove_if_exists(path + ".partial.meta")
+            return path
+    
+    def _fetch_to_partial(self, session: Any, url: str, partial: str) -> None:
+        """
+        Fetch a file into its .partial file, resuming a previous transfer.
+        
+        An existing .partial with a recorded validator is continued with
+        ``Range: bytes=<size>-`` and ``If-Range``; if the file changed on the
+        server it answers 200 with the full body and the download restarts.
+        Large files on servers accepting byte ranges are fetched in parts
+        (see _download_ranges), falling back to a single stream.
+        
+        Args:
+            session: Authenticated requests session
+            url: File URL
+            partial: Path of the .partial file
+        """
+        meta = partial + ".meta"
+        offset = 0
+        headers = {}
+        validator = _read_validator(meta)
+        if validator and os.path.exists(partial):
+            offset = os.path.getsize(partial)
+            if offset:
+                headers = {"Range": f"bytes={offset}-", "If-Range": validator}
+        
+        self._download_limiter.acquire()
+        with session.get(url, headers=headers, stream=True, timeout=DOWNLOAD_TIMEOUT) as response:
+            if response.status_code == 416:
+                # Stale or already complete partial file; start over next time
+                _remove_if_exists(meta)
+            response.raise_for_status()
+            if response.status_code != 206:
+                offset = 0
+            
+            size = int(response.headers.get("Content-Length") or 0)
+            validator = response.headers.get("ETag", "")
+            if not validator or validator.startswith("W/"):
+                validator = response.headers.get("Last-Modified", "")
+            
+            with open(partial, "ab" if offset else "wb") as f:
+                if (
+                    offset == 0
+                    and size >= MULTIPART_MIN_BYTES
+                    and response.headers.get("Accept-Ranges") == "bytes"
+                    and hasattr(os, "pwrite")
+                ):
+                    # Ranged parts land out of order, so the file is only
+                    # resumable once it is written as one stream again
+                    _remove_if_exists(meta)
+                    response.close()
+                    try:
+                        # Ranges go to the final URL, after any auth redirects
+                        self._download_ranges(session, response.url, f, size)
+                        return
+                    except Exception as e:
+                        logger.warning(f"Ranged download of {url} failed ({e}); retrying as one stream")
+                        f.seek(0)
+                        f.truncate()
+                    self._download_limiter.acquire()
+                    with session.get(url, stream=True, timeout=DOWNLOAD_TIMEOUT) as retry:
+                        retry.raise_for_status()
+                        _write_validator(meta, validator)
+                        self._write_stream(retry, f)
+                else:
+                    _write_validator(meta, validator)
+                    self._write_stream(response, f)
+    
+    @staticmethod
+    def _write_stream(response: Any, f: Any) -> None:
+        """Copy a streaming response body into an open file."""
+        for chunk in response.iter_content(chunk_size=1024 * 1024):
+            f.write(chunk)
+    
+    def _download_ranges(self, session: Any, url: str, f: Any, size: int) -> None:
+        """
+        Download a file as concurrent byte-range requests into an open file.
+        
+        Each part is written at its own offset, so parts can complete in
+        any order and a slow or failed connection only costs its own part.
+        
+        Args:
+            session: Authenticated requests session
+            url: File URL (already redirected to the serving host)
+            f: Open temporary file to fill
+            size: Total file size in bytes
+            
+        Raises:
+            IOError: If the server ignores a range or a part is incomplete
+        """
+        f.truncate(size)
+        fd = f.fileno()
+        
+        def fetch_part(lo: int) -> None:
+            hi = min(lo + MULTIPART_PART_BYTES, size) - 1
+            headers = {"Range": f"bytes={lo}-{hi}"}
+            self._download_limiter.acquire()
+            with session.get(url, headers=headers, stream=True, timeout=DOWNLOAD_TIMEOUT) as response:
+                if response.status_code != 206:
+                    raise IOError(f"expected 206 for range {lo}-{hi}, got {response.status_code}")
+                offset = lo
+                for chunk in response.iter_content(chunk_size=1024 * 1024):
+                    os.pwrite(fd, chunk, offset)
+                    offset += len(chunk)
+            if offset != hi + 1:
+                raise IOError(f"incomplete range {lo}-{hi}")
+        
+        with ThreadPoolExecutor(max_workers=MULTIPART_WORKERS) as pool:
+            # list() re-raises the first failed part
+            list(pool.map(fetch_part, range(0, size, MULTIPART_PART_BYTES)))
+    
+    def _extract_latest(
         self,
+        granules: List[Any],
+        label: str,
         latitude: float,
         longitude: float,
-        radius_km: float = 5.0,
-        hours_back: int = 24
+        extract: Callable[[Any], Any]
+    ) -> Optional[Tuple[str, Any]]:
+        """
+        Extract values at a point from the most recent granule.
+        
+        Values are cached on disk per granule and point, so a granule that
+        was already read for this point is neither downloaded nor opened
+        again.
+        
+        Args:
+            granules: Granules from search_data, oldest first
+            label: Product name used in logs
+            latitude: Latitude in decimal degrees
+            longitude: Longitude in decimal degrees
+            extract: Reads the values from a downloaded file path, an
+                OPeNDAP URL or a remote file object, returning None when they
+                are unavailable
+            
+        Returns:
+            Tuple of (file name, extracted values) or None
+        """
+        value_key = _granule_value_key(granules[-1], latitude, longitude)
+        value_cache = get_value_cache() if value_key else None
+        if value_cache is not None:
+            cached = value_cache.get(value_key)
+            if cached is not None:
+                logger.info(f"Using cached {label} values for {value_key}")
+                return cached
+        
+        # Read only the bytes around the point over OPeNDAP or range
+        # requests when enabled, falling back to downloading the granule.
+        # In-region S3 range reads are cheap, so cloud-hosted granules are
+        # always streamed there.
+        extracted = None
+        if settings.earthdata_opendap:
+            extracted = self._extract_opendap(granules[-1], label, extract)
+        if (
+            extracted is None
+            and HAS_H5NETCDF
+            and (settings.earthdata_stream or _s3_direct_access(granules[-1]))
+        ):
+            extracted = self._extract_streamed(granules[-1], label, extract)
+        if extracted is None:
+            extracted = self._extract_downloaded(granules[-1], label, extract)
+        
+        if extracted is not None and value_cache is not None:
+            value_cache.set(value_key, extracted, GRANULE_VALUE_TTL_SECONDS)
+        return extracted
+    
+    def _extract_opendap(
+        self,
+        granule: Any,
+        label: str,
+        extract: Callable[[str], Any]
+    ) -> Optional[Tuple[str, Any]]:
+        """
+        Extract values from a granule through its OPeNDAP endpoint.
+        
+        xarray opens the URL lazily, so only the coordinates and the
+        selected cells are transferred.
+        
+        Args:
+            granule: DataGranule from search_data
+            label: Product name used in logs
+            extract: Reads the values from a path or URL
+            
+        Returns:
+            Tuple of (granule file name, extracted values), or None if the
+            granule has no OPeNDAP link or the read failed
+        """
+        url = _opendap_url(granule)
+        if url is None:
+            return None
+        
+        logger.info(f"Reading {label} over OPeNDAP: {url}")
+        values = extract(url)
+        if values is None:
+            logger.warning(f"OPeNDAP read failed for {url}, downloading the granule instead")
+            return None
+        return url.rsplit("/", 1)[-1], values
+    
+    def _extract_streamed(
+        self,
+        granule: Any,
+        label: str,
+        extract: Callable[[Any], Any]
+    ) -> Optional[Tuple[str, Any]]:
+        """
+        Extract values from a granule opened remotely with earthaccess.open.
+        
+        The fsspec file object fetches byte ranges on demand, so h5netcdf
+        only reads the HDF5 metadata and chunks around the point.
+        
+        Args:
+            granule: DataGranule from search_data
+            label: Product name used in logs
+            extract: Reads the values from a file object
+            
+        Returns:
+            Tuple of (granule file name, extracted values), or None if the
+            granule could not be opened or read
+        """
+        try:
+            files = _earthaccess().open([granule])
+        except Exception as e:
+            logger.warning(f"Could not open {label} granule remotely: {e}")
+            return None
+        if not files:
+            return None
+        
+        fileobj = files[0]
+        logger.info(f"Streaming {label} granule: {getattr(fileobj, 'path', fileobj)}")
+        try:
+            values = extract(fileobj)
+        finally:
+            fileobj.close()
+        
+        if values is None:
+            logger.warning(f"Streaming read of {label} granule failed, downloading it instead")
+            return None
+        return os.path.basename(getattr(fileobj, "path", "")) or label, values
+    
+    def _extract_downloaded(
+        self,
+        granule: Any,
+        label: str,
+        extract: Callable[[str], Any]
+    ) -> Optional[Tuple[str, Any]]:
+        """
+        Download a granule and extract values from the local file.
+        
+        Args:
+            granule: DataGranule from search_data
+            label: Product name used in logs
+            extract: Reads the values from a downloaded file path
+            
+        Returns:
+            Tuple of (file name, extracted values) or None
+        """
+        # Only the most recent granule is read, so only it is downloaded
+        files = self.download_granules([granule])
+        
+        if not files:
+            logger.warning(f"Failed to download {label} granules")
+            return None
+        
+        latest_file = files[-1]
+        latest_path = Path(latest_file)
+        logger.info(f"Processing {label} file: {latest_file}")
+        
+        # Verify file exists and has valid extension
+        if not latest_path.is_file():
+            logger.error(f"Downloaded file does not exist: {latest_file}")
+            return None
+        
+        if latest_path.suffix.lower() not in _NETCDF_SUFFIXES:
+            logger.warning(f"File may not be NetCDF/HDF5: {latest_file}")
+        
+        values = extract(latest_file)
+        if values is None:
+            return None
+        return latest_path.name, values
+    
+    def _extract_merra2_variables(
+        self,
+        file_path: str,
+        latitude: float,
+        longitude: float
+    ) -> Optional[Dict[str, Optional[float]]]:
+        """
+        Read the MERRA-2 product variables at a point from a MERRA-2 file.
+        
+        Args:
+            file_path: Path to the downloaded granule
+            latitude: Latitude in decimal degrees
+            longitude: Longitude in decimal degrees
+            
+        Returns:
+            Dictionary of variable name -> value, or None without temperature
+        """
+        # Extract all variables with a single open of the file
+        variables = self.netcdf_processor.extract_multiple_variables(
+            file_path,
+            PRODUCTS["merra2"].variables,
+            latitude,
+            longitude,
+            method="nearest"
+        )
+        
+        # If NetCDF didn't work, try HDF5
+        if all(v is None for v in variables.values()):
+            variables = self.hdf5_processor.extract_variables(
+                file_path,
+                list(PRODUCTS["merra2"].variables),
+                latitude,
+                longitude
+            )
+        
+        if variables["T2M"] is None:
+            return None
+        return variables
+    
+    def _fetch_product(
+        self,
+        spec: ProductSpec,
+        latitude: float,
+        longitude: float,
+        radius_km: float,
+        hours_back: int,
+        extract: Callable[[str], Any],
+        build: Callable[[Any], Dict[str, Any]]
     ) -> Optional[Dict[str, Any]]:
         """
-        Get IMERG precipitation data and process it.
+        Search, download and read one gridded product at a point.
         
         Args:
+            spec: Product to fetch (see PRODUCTS)
             latitude: Latitude in decimal degrees
             longitude: Longitude in decimal degrees
             radius_km: Search radius in kilometers
             hours_back: How many hours back to search
+            extract: Reads the product values from a downloaded file path,
+                returning None when they are unavailable
+            build: Turns the extracted values into the product-specific
+                result fields
             
         Returns:
-            Dictionary with precipitation data or None
+            Result dictionary or None
+            
+        Raises:
+            Exception: Upstream failures from the search or download (see
+                is_upstream_failure)
         """
         if not self.ensure_authenticated():
-            logger.warning("Not authenticated with NASA Earthdata (skipping IMERG)")
+            logger.warning(f"Not authenticated with NASA Earthdata (skipping {spec.label})")
             return None
         
+        # Cell of the product grid that nearest-neighbour extraction reads.
+        # Searches and granule values are keyed on the cell centre, so every
+        # point in the cell shares them; the response keeps the raw point.
+        row = math.floor((latitude - spec.grid_origin[0]) / spec.grid[0])
+        col = math.floor((longitude - spec.grid_origin[1]) / spec.grid[1])
+        cell_lat = round(min(max(spec.grid_origin[0] + (row + 0.5) * spec.grid[0], -90.0), 90.0), 4)
+        cell_lon = round(spec.grid_origin[1] + (col + 0.5) * spec.grid[1], 4)
+        cache_key = (spec.short_name, row, col, int(radius_km), hours_back)
+        cached = _get_cached_result(cache_key, latitude, longitude)
+        if cached is not None:
+            return cached
+        
         try:
-            # Spatial filter: use circle as recommended by earthaccess
-            radius_m = int(max(radius_km, 1.0) * 1000)
-            circle = (longitude, latitude, radius_m)
-            
-            # Calculate temporal range - search last 7 days for better coverage
-            end_time = datetime.utcnow()
-            start_time = end_time - timedelta(days=7)
-            temporal = (
-                start_time.strftime("%Y-%m-%d"),
-                end_time.strftime("%Y-%m-%d")
-            )
+            circle = _search_circle(cell_lat, cell_lon, radius_km)
+            temporal = _search_temporal(days_back=spec.days_back)
             
-            logger.info(f"Searching IMERG data for circle={circle}, temporal={temporal}")
+            logger.info(f"Searching {spec.label} data for circle={circle}, temporal={temporal}")
             
             # Search for data
             granules = self.search_data(
-                short_name="GPM_3IMERGHHE",
+                short_name=spec.short_name,
                 circle=circle,
                 temporal=temporal,
-                count=5,
+                count=spec.count,
                 downloadable=True
             )
             
             if not granules:
-                logger.warning("No IMERG granules found")
+                logger.warning(f"No {spec.label} granules found")
                 return None
             
-            # Download granules
-            files = self.download_granules(granules)
-            
-            if not files:
-                logger.warning("Failed to download IMERG granules")
-                return None
-            
-            # Process the most recent file
-            latest_file = files[-1]
-            logger.info(f"Processing IMERG file: {latest_file}")
-            
-            # Verify file exists and has valid extension
-            if not os.path.exists(latest_file):
-                logger.error(f"Downloaded file does not exist: {latest_file}")
-                return None
-            
-            if not latest_file.endswith(('.nc', '.nc4', '.hdf', '.h5', '.he5')):
-                logger.warning(f"File may not be NetCDF/HDF5: {latest_file}")
-            
-            # Extract precipitation rate
-            precip_rate = self.netcdf_processor.extract_point_value(
-                latest_file,
-                "precipitationCal",  # Calibrated precipitation
-                latitude,
-                longitude,
-                method="nearest"
-            )
+            extracted = self._extract_latest(granules, spec.label, cell_lat, cell_lon, extract)
             
-            if precip_rate is None:
-                # Try alternative variable names
-                for var_name in ["precipitation", "precip", "HQprecipitation"]:
-                    precip_rate = self.netcdf_processor.extract_point_value(
-                        latest_file,
-                        var_name,
-                        latitude,
-                        longitude,
-                        method="nearest"
-                    )
-                    if precip_rate is not None:
-                        break
-            
-            if precip_rate is None:
-                logger.warning("Could not extract precipitation value")
+            if extracted is None:
+                logger.warning(f"Could not extract {spec.label} values")
                 return None
             
-            # Get dataset info for timestamp
-            dataset_info = self.netcdf_processor.get_dataset_info(latest_file)
+            file_name, values = extracted
             
             result = {
-                "precipitation_rate_mm_hr": round(float(precip_rate), 2),
-                "source": "GPM IMERG",
-                "timestamp": datetime.utcnow().isoformat() + "Z",
+                **build(values),
+                "source": spec.source,
+                "timestamp": utc_now_iso(),
                 "latitude": latitude,
                 "longitude": longitude,
-                "file_processed": Path(latest_file).name
+                "file_processed": file_name
             }
             
-            logger.info(f"Successfully processed IMERG data: {result}")
+            logger.info(f"Successfully processed {spec.label} data: {result}")
+            _store_result(cache_key, result)
             return result
             
         except Exception as e:
-            logger.error(f"Error processing IMERG data: {e}", exc_info=True)
+            logger.error(f"Error processing {spec.label} data: {e}", exc_info=logger.isEnabledFor(logging.DEBUG))
+            if is_upstream_failure(e):
+                raise
             return None
     
+    def get_imerg_data(
+        self,
+        latitude: float,
+        longitude: float,
+        radius_km: float = 5.0,
+        hours_back: int = 24
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Get IMERG precipitation data and process it.
+        
+        Args:
+            latitude: Latitude in decimal degrees
+            longitude: Longitude in decimal degrees
+            radius_km: Search radius in kilometers
+            hours_back: How many hours back to search
+            
+        Returns:
+            Dictionary with precipitation data or None
+        """
+        return self._fetch_product(
+            PRODUCTS["imerg"],
+            latitude,
+            longitude,
+            radius_km,
+            hours_back,
+            # Precipitation rate, preferring the calibrated variable
+            lambda path: self.netcdf_processor.extract_first_available(
+                path,
+                PRODUCTS["imerg"].variables,
+                latitude,
+                longitude,
+                method="nearest"
+            ),
+            lambda precip_rate: {"precipitation_rate_mm_hr": round(float(precip_rate), 2)}
+        )
+    
     def get_merra2_data(
         self,
         latitude: float,
@@ -455,133 +1472,61 @@ class EarthdataService:
         Returns:
             Dictionary with weather data or None
         """
-        if not self.authenticated:
-            logger.warning("Not authenticated with NASA Earthdata")
-            return None
+        return self._fetch_product(
+            PRODUCTS["merra2"],
+            latitude,
+            longitude,
+            radius_km,
+            hours_back,
+            lambda path: self._extract_merra2_variables(path, latitude, longitude),
+            _merra2_weather
+        )
+    
+    def warm_up(
+        self,
+        locations: List[Tuple[float, float]],
+        stop: Optional[threading.Event] = None
+    ) -> int:
+        """
+        Fetch every product for a set of locations to prime the caches.
         
-        try:
-            # Spatial filter: use circle around point
-            radius_m = int(max(radius_km, 1.0) * 1000)
-            circle = (longitude, latitude, radius_m)
-            
-            # Calculate temporal range - search last 3 days
-            end_time = datetime.utcnow()
-            start_time = end_time - timedelta(days=3)
-            temporal = (
-                start_time.strftime("%Y-%m-%d"),
-                end_time.strftime("%Y-%m-%d")
-            )
-            
-            logger.info(f"Searching MERRA-2 data for circle={circle}, temporal={temporal}")
-            
-            # Search for data
-            granules = self.search_data(
-                short_name="M2I1NXASM",
-                circle=circle,
-                temporal=temporal,
-                count=3,
-                downloadable=True
-            )
-            
-            if not granules:
-                logger.warning("No MERRA-2 granules found")
-                return None
-            
-            # Download granules
-            files = self.download_granules(granules)
-            
-            if not files:
-                logger.warning("Failed to download MERRA-2 granules")
-                return None
-            
-            # Process the most recent file
-            latest_file = files[-1]
-            logger.info(f"Processing MERRA-2 file: {latest_file}")
-            
-            # Verify file exists
-            if not os.path.exists(latest_file):
-                logger.error(f"Downloaded file does not exist: {latest_file}")
-                return None
-            
-            # Extract multiple variables
-            variables = {
-                "T2M": None,      # Temperature at 2m
-                "U2M": None,      # U wind component at 2m
-                "V2M": None,      # V wind component at 2m
-                "QV2M": None,     # Specific humidity at 2m
-                "PS": None,       # Surface pressure
-            }
+        Uses the default request radius, so later requests for the same
+        locations hit the processed result cache.
+        
+        Args:
+            locations: (latitude, longitude) points to prefetch
+            stop: Event that skips the fetches not yet started once set
+                (fetches already in progress run to completion)
             
-            # Try NetCDF format first
-            for var_name in variables.keys():
-                value = self.netcdf_processor.extract_point_value(
-                    latest_file,
-                    var_name,
-                    latitude,
-                    longitude,
-                    method="nearest"
-                )
-                if value is not None:
-                    variables[var_name] = value
-            
-            # If NetCDF didn't work, try HDF5
-            if all(v is None for v in variables.values()):
-                for var_name in variables.keys():
-                    value = self.hdf5_processor.extract_variable(
-                        latest_file,
-                        var_name,
-                        latitude,
-                        longitude
-                    )
-                    if value is not None:
-                        variables[var_name] = value
-            
-            # Check if we got at least temperature
-            if variables["T2M"] is None:
-                logger.warning("Could not extract MERRA-2 temperature")
+        Returns:
+            Number of product results fetched
+        """
+        if not locations or not self.ensure_authenticated():
+            return 0
+        
+        radius_km = settings.default_radius_meters / 1000.0
+        
+        def fetch(fetcher: Callable[..., Optional[Dict[str, Any]]], latitude: float, longitude: float):
+            if stop is not None and stop.is_set():
                 return None
-            
-            # Calculate wind speed and direction if we have components
-            wind_speed_ms = None
-            wind_direction_deg = None
-            
-            if variables["U2M"] is not None and variables["V2M"] is not None:
-                import math
-                u = variables["U2M"]
-                v = variables["V2M"]
-                wind_speed_ms = math.sqrt(u**2 + v**2)
-                wind_direction_deg = (math.degrees(math.atan2(u, v)) + 180) % 360
-            
-            # Convert temperature from Kelvin to Celsius
-            temp_celsius = variables["T2M"] - 273.15 if variables["T2M"] else None
-            
-            # Calculate relative humidity if we have specific humidity and temperature
-            relative_humidity = None
-            if variables["QV2M"] is not None and variables["T2M"] is not None:
-                # Simplified calculation
-                relative_humidity = min(100, variables["QV2M"] * 1000)  # Rough approximation
-            
-            result = {
-                "temperature_celsius": round(temp_celsius, 2) if temp_celsius else None,
-                "temperature_kelvin": round(variables["T2M"], 2) if variables["T2M"] else None,
-                "wind_speed_ms": round(wind_speed_ms, 2) if wind_speed_ms else None,
-                "wind_speed_kmh": round(wind_speed_ms * 3.6, 2) if wind_speed_ms else None,
-                "wind_direction_deg": round(wind_direction_deg, 2) if wind_direction_deg else None,
-                "humidity_percent": round(relative_humidity, 2) if relative_humidity else None,
-                "pressure_pa": round(variables["PS"], 2) if variables["PS"] else None,
-                "source": "MERRA-2",
-                "timestamp": datetime.utcnow().isoformat() + "Z",
-                "latitude": latitude,
-                "longitude": longitude,
-                "file_processed": Path(latest_file).name
-            }
-            
-            logger.info(f"Successfully processed MERRA-2 data: {result}")
-            return result
-            
-        except Exception as e:
-            logger.error(f"Error processing MERRA-2 data: {e}", exc_info=True)
-            return None
+            return fetcher(latitude, longitude, radius_km, hours_back=24)
+        
+        fetchers = (self.get_imerg_data, self.get_merra2_data)
+        with ThreadPoolExecutor(max_workers=WARMUP_WORKERS) as pool:
+            futures = [
+                pool.submit(fetch, fetcher, latitude, longitude)
+                for latitude, longitude in locations
+                for fetcher in fetchers
+            ]
+            fetched = 0
+            for future in futures:
+                try:
+                    fetched += future.result() is not None
+                except Exception as e:
+                    logger.warning(f"Cache warm-up fetch failed: {e}")
+        
+        logger.info(f"Cache warm-up fetched {fetched}/{len(futures)} results for {len(locations)} locations")
+        return fetched
     
     def get_tropomi_data(
         self,
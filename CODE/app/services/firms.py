@@ -1,29 +1,56 @@
 """Service for interacting with NASA FIRMS API."""
 
+import asyncio
+import io
 import logging
+import math
 from typing import Optional, List, Dict, Any
 import httpx
+import numpy as np
+import pandas as pd
 from datetime import datetime, timedelta
+from scipy.sparse import coo_matrix
+from scipy.sparse.csgraph import connected_components
+from scipy.spatial import cKDTree
 
-from app.config import get_settings
+from app.config import HTTP_TIMEOUTS, get_settings
+from app.http_client import get_http_client
+from app.utils.geo_utils import EARTH_RADIUS_KM, calculate_bounding_box
+from app.utils.resilience import is_upstream_failure, retry_async
 
 logger = logging.getLogger(__name__)
 settings = get_settings()
 
+# Instrument reported for each FIRMS source id
+SATELLITE_BY_SOURCE = {
+    "VIIRS_SNPP_NRT": "VIIRS",
+    "VIIRS_SNPP_SP": "VIIRS",
+    "VIIRS_NOAA20_NRT": "VIIRS",
+    "VIIRS_NOAA20_SP": "VIIRS",
+    "VIIRS_NOAA21_NRT": "VIIRS",
+    "MODIS_NRT": "MODIS",
+    "MODIS_SP": "MODIS",
+}
+
+# Numeric FIRMS columns, converted to float. Rows where one of them is not a
+# number are dropped; a column missing from the source's CSV reads as 0.
+NUMERIC_COLUMNS = ("latitude", "longitude", "brightness", "frp")
+
 
 class FIRMSService:
     """Service for accessing NASA FIRMS fire detection data."""
     
     BASE_URL = "https://firms.modaps.eosdis.nasa.gov/api"
     
-    def __init__(self):
-        """Initialize the FIRMS service."""
+    def __init__(self, client: Optional[httpx.AsyncClient] = None):
+        """
+        Initialize the FIRMS service.
+        
+        Args:
+            client: Shared HTTP client (defaults to the process-wide client)
+        """
         self.api_key = settings.firms_api_key
-        self.client = httpx.AsyncClient(timeout=30.0)
-    
-    async def close(self):
-        """Close the HTTP client."""
-        await self.client.aclose()
+        self.client = client if client is not None else get_http_client()
     
     async def get_active_fires(
         self,
@@ -44,7 +71,7 @@ class FIRMSService:
             source: Data source (VIIRS_SNPP_NRT, MODIS_NRT, etc.)
             
         Returns:
-            List of fire detections
+            List of fire detections, each tagged with its satellite_source
         """
         if not self.api_key:
             logger.warning("FIRMS API key not configured")
@@ -55,14 +82,7 @@ class FIRMSService:
         
         try:
             # Calculate bounding box from center point and radius
-            # 1 degree latitude ≈ 111 km
-            lat_offset = radius_km / 111.0
-            lon_offset = radius_km / (111.0 * abs(max(abs(latitude), 0.1)))
-            
-            west = longitude - lon_offset
-            south = latitude - lat_offset
-            east = longitude + lon_offset
-            north = latitude + lat_offset
+            west, south, east, north = calculate_bounding_box(latitude, longitude, radius_km * 1000)
             
             # Calculate date range
             end_date = datetime.utcnow()
@@ -81,11 +101,7 @@ class FIRMSService:
             
             logger.info(f"FIRMS request: bbox=({west},{south},{east},{north}), days={days_back}")
             
-            response = await self.client.get(url)
-            response.raise_for_status()
-            
-            # Parse CSV response
-            fires = self._parse_csv_response(response.text)
+            fires = await retry_async(self._fetch_csv, url, source)
             
             logger.info(
                 f"Found {len(fires)} fire detections near "
@@ -95,51 +111,65 @@ class FIRMSService:
             
         except httpx.HTTPError as e:
             logger.error(f"HTTP error fetching FIRMS data: {e}")
+            if is_upstream_failure(e):
+                raise
             return []
         except Exception as e:
             logger.error(f"Error fetching FIRMS data: {e}")
             return []
     
-    def _parse_csv_response(self, csv_text: str) -> List[Dict[str, Any]]:
+    async def _fetch_csv(self, url: str, source: str) -> List[Dict[str, Any]]:
         """
-        Parse CSV response from FIRMS API.
+        Download and parse a FIRMS CSV response.
         
         Args:
-            csv_text: CSV text response
+            url: FIRMS area API URL
+            source: FIRMS source id the URL queries
             
         Returns:
             List of fire detection dictionaries
         """
-        fires = []
-        lines = csv_text.strip().split('\n')
-        
-        if len(lines) < 2:
-            return fires
+        response = await self.client.get(url, timeout=HTTP_TIMEOUTS["firms"])
+        response.raise_for_status()
+        return self._parse_csv(response.content, source)
+    
+    def _parse_csv(self, content: bytes, source: str) -> List[Dict[str, Any]]:
+        """
+        Parse a FIRMS CSV body into fire detection dictionaries.
         
-        # Parse header
-        header = lines[0].split(',')
+        The body is parsed by pandas' C reader. Columns are kept as the
+        strings FIRMS sent except NUMERIC_COLUMNS, which become floats, and
+        each fire is tagged with its source.
         
-        # Parse data rows
-        for line in lines[1:]:
-            values = line.split(',')
-            if len(values) != len(header):
-                continue
-            
-            fire = dict(zip(header, values))
-            
-            # Convert numeric fields
-            try:
-                fire['latitude'] = float(fire.get('latitude', 0))
-                fire['longitude'] = float(fire.get('longitude', 0))
-                fire['brightness'] = float(fire.get('brightness', 0))
-                fire['confidence'] = fire.get('confidence', 'unknown')
-                fire['frp'] = float(fire.get('frp', 0))  # Fire Radiative Power
-            except (ValueError, KeyError):
-                continue
+        Args:
+            content: Raw CSV response body
+            source: FIRMS source id stored as satellite_source
             
-            fires.append(fire)
+        Returns:
+            List of fire detection dictionaries, skipping malformed rows
+        """
+        try:
+            df = pd.read_csv(
+                io.BytesIO(content),
+                dtype=str,
+                keep_default_na=False,
+                on_bad_lines="skip",
+                engine="c"
+            )
+        except pd.errors.EmptyDataError:
+            return []
         
-        return fires
+        for column in NUMERIC_COLUMNS:
+            if column in df.columns:
+                df[column] = pd.to_numeric(df[column], errors="coerce")
+            else:
+                df[column] = 0.0
+        df = df.dropna(subset=list(NUMERIC_COLUMNS))
+        if "confidence" not in df.columns:
+            df["confidence"] = "unknown"
+        df["satellite_source"] = source
+        
+        return df.to_dict(orient="records")
     
     def categorize_confidence(self, confidence: Any) -> tuple:
         """
@@ -190,26 +220,40 @@ class FIRMSService:
             days_back: How many days back to search
             
         Returns:
-            Combined fire detection data
+            Combined fire detection data. Sources that fail are logged and
+            left out, so one feed's outage does not discard the others.
+            
+        Raises:
+            The first upstream failure when every source failed
         """
         sources = [
             "VIIRS_SNPP_NRT",  # VIIRS on Suomi NPP
             "MODIS_NRT"        # MODIS on Terra and Aqua
         ]
         
-        all_fires = []
+        # Sources are independent, so their requests run concurrently. Fires
+        # come back tagged with their satellite_source.
+        results = await asyncio.gather(
+            *(
+                self.get_active_fires(latitude, longitude, radius_km, days_back, source)
+                for source in sources
+            ),
+            return_exceptions=True
+        )
         
-        for source in sources:
-            fires = await self.get_active_fires(
-                latitude, longitude, radius_km, days_back, source
-            )
-            
-            # Add source information
-            for fire in fires:
-                fire['satellite_source'] = source
-            
+        all_fires = []
+        failures = []
+        for source, fires in zip(sources, results):
+            if isinstance(fires, BaseException):
+                logger.warning(f"FIRMS source {source} failed: {fires}")
+                failures.append(fires)
+                continue
             all_fires.extend(fires)
         
+        # Only a full outage reaches the circuit breaker
+        if len(failures) == len(sources):
+            raise failures[0]
+        
         # Remove duplicates (fires detected by multiple satellites)
         unique_fires = self._deduplicate_fires(all_fires)
         
@@ -228,38 +272,40 @@ class FIRMSService:
         """
         Remove duplicate fire detections.
         
+        Detections whose great-circle (haversine) distance is under the
+        threshold are grouped (transitively) with a KD-tree over points on
+        the sphere, and the brightest detection of each group is kept.
+        
         Args:
             fires: List of fire detections
             distance_threshold_km: Distance threshold for considering fires as duplicates
             
         Returns:
-            Deduplicated list of fires
+            Deduplicated list of fires, in their original order
         """
         if not fires:
             return []
         
-        unique_fires = []
+        count = len(fires)
+        lat = np.radians([fire['latitude'] for fire in fires])
+        lon = np.radians([fire['longitude'] for fire in fires])
+        coords = EARTH_RADIUS_KM * np.column_stack(
+            (np.cos(lat) * np.cos(lon), np.cos(lat) * np.sin(lon), np.sin(lat))
+        )
+        # Straight-line (chord) length of the threshold arc, so the tree's
+        # Euclidean search matches haversine distances at any latitude
+        chord_km = 2 * EARTH_RADIUS_KM * math.sin(distance_threshold_km / (2 * EARTH_RADIUS_KM))
+        pairs = cKDTree(coords).query_pairs(r=chord_km, output_type='ndarray')
+        adjacency = coo_matrix(
+            (np.ones(len(pairs), dtype=bool), (pairs[:, 0], pairs[:, 1])),
+            shape=(count, count)
+        )
+        _, groups = connected_components(adjacency, directed=False)
         
-        for fire in fires:
-            is_duplicate = False
-            
-            for unique_fire in unique_fires:
-                # Calculate approximate distance
-                lat_diff = abs(fire['latitude'] - unique_fire['latitude'])
-                lon_diff = abs(fire['longitude'] - unique_fire['longitude'])
-                
-                # Rough distance in km (1 degree ≈ 111 km)
-                distance = ((lat_diff ** 2 + lon_diff ** 2) ** 0.5) * 111
-                
-                if distance < distance_threshold_km:
-                    is_duplicate = True
-                    # Keep the one with higher confidence
-                    if fire.get('brightness', 0) > unique_fire.get('brightness', 0):
-                        unique_fires.remove(unique_fire)
-                        unique_fires.append(fire)
-                    break
-            
-            if not is_duplicate:
-                unique_fires.append(fire)
+        # Brightest first within each group; ties keep the earlier detection
+        brightness = np.array([fire.get('brightness', 0) for fire in fires], dtype=float)
+        order = np.lexsort((-brightness, groups))
+        first_in_group = np.ones(count, dtype=bool)
+        first_in_group[1:] = groups[order][1:] != groups[order][:-1]
         
-        return unique_fires
+        return [fires[i] for i in np.sort(order[first_in_group])]
@@ -5,11 +5,14 @@ Provides access to satellite imagery and visualization layers.
 
 import logging
 from datetime import datetime, timedelta
+from functools import cached_property
 from typing import Optional, Dict, Any, List
+from urllib.parse import urlencode
 from owslib.wms import WebMapService
 import requests
 
-from app.config import get_settings
+from app.config import HTTP_TIMEOUTS, get_settings
+from app.utils.geo_utils import calculate_bounding_box
 
 logger = logging.getLogger(__name__)
 settings = get_settings()
@@ -48,13 +51,36 @@ class GIBSService:
         """
         self.projection = projection
         self.wms_url = self.WMS_ENDPOINTS.get(projection, self.WMS_ENDPOINTS["epsg4326"])
-        self.wms = None
         
+        # GetMap parameters shared by every image URL, encoded once
+        self._getmap_prefix = self.wms_url + "?" + urlencode({
+            "SERVICE": "WMS",
+            "VERSION": "1.1.1",
+            "REQUEST": "GetMap",
+            "STYLES": "",
+            "SRS": self.projection.upper(),
+            "TRANSPARENT": "TRUE",
+        })
+    
+    @cached_property
+    def wms(self) -> Optional[WebMapService]:
+        """
+        WMS capabilities client, connected on first use.
+        
+        Only layer metadata needs it: fetching and parsing the capabilities
+        document is a blocking request of several seconds, while image URLs
+        are built locally.
+        
+        Returns:
+            WebMapService, or None if GIBS could not be reached
+        """
         try:
-            self.wms = WebMapService(self.wms_url, version='1.1.1')
+            wms = WebMapService(self.wms_url, version='1.1.1', timeout=HTTP_TIMEOUTS["gibs"])
             logger.info(f"Connected to GIBS WMS: {self.wms_url}")
+            return wms
         except Exception as e:
             logger.error(f"Failed to connect to GIBS WMS: {e}")
+            return None
     
     def get_available_layers(self) -> List[str]:
         """
@@ -122,31 +148,20 @@ class GIBSService:
         Returns:
             URL string or None
         """
-        if not self.wms:
-            return None
-        
         if date is None:
             date = datetime.utcnow().strftime("%Y-%m-%d")
         
         try:
-            # Build WMS GetMap request URL
-            params = {
-                "SERVICE": "WMS",
-                "VERSION": "1.1.1",
-                "REQUEST": "GetMap",
+            # Build WMS GetMap request URL, encoding the per-image parameters
+            params = urlencode({
                 "LAYERS": layer_name,
-                "STYLES": "",
-                "SRS": f"{self.projection.upper()}",
                 "BBOX": f"{bbox[0]},{bbox[1]},{bbox[2]},{bbox[3]}",
-                "WIDTH": str(width),
-                "HEIGHT": str(height),
+                "WIDTH": width,
+                "HEIGHT": height,
                 "FORMAT": format,
                 "TIME": date,
-                "TRANSPARENT": "TRUE"
-            }
-            
-            url = self.wms_url + "?" + "&".join([f"{k}={v}" for k, v in params.items()])
-            return url
+            })
+            return f"{self._getmap_prefix}&{params}"
             
         except Exception as e:
             logger.error(f"Error generating image URL: {e}")
@@ -175,15 +190,7 @@ class GIBSService:
             date = datetime.utcnow().strftime("%Y-%m-%d")
         
         # Calculate bounding box
-        lat_offset = radius_km / 111.0
-        lon_offset = radius_km / (111.0 * abs(max(abs(latitude), 0.1)))
-        
-        bbox = (
-            longitude - lon_offset,
-            latitude - lat_offset,
-            longitude + lon_offset,
-            latitude + lat_offset
-        )
+        bbox = calculate_bounding_box(latitude, longitude, radius_km * 1000)
         
         result = {
             "source": "NASA GIBS",
@@ -247,15 +254,7 @@ class GIBSService:
             List of dictionaries with fire imagery data
         """
         # Calculate bounding box
-        lat_offset = radius_km / 111.0
-        lon_offset = radius_km / (111.0 * abs(max(abs(latitude), 0.1)))
-        
-        bbox = (
-            longitude - lon_offset,
-            latitude - lat_offset,
-            longitude + lon_offset,
-            latitude + lat_offset
-        )
+        bbox = calculate_bounding_box(latitude, longitude, radius_km * 1000)
         
         results = []
         end_date = datetime.utcnow()
@@ -302,15 +301,7 @@ class GIBSService:
             List of dictionaries with precipitation imagery data
         """
         # Calculate bounding box
-        lat_offset = radius_km / 111.0
-        lon_offset = radius_km / (111.0 * abs(max(abs(latitude), 0.1)))
-        
-        bbox = (
-            longitude - lon_offset,
-            latitude - lat_offset,
-            longitude + lon_offset,
-            latitude + lat_offset
-        )
+        bbox = calculate_bounding_box(latitude, longitude, radius_km * 1000)
         
         results = []
         end_time = datetime.utcnow()
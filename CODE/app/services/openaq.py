@@ -1,35 +1,57 @@
 """Service for interacting with OpenAQ API."""
 
 import logging
+from bisect import bisect_left
 from typing import Optional, List, Dict, Any
 import httpx
+import orjson
 from datetime import datetime
 
-from app.config import get_settings
+from app.config import HTTP_TIMEOUTS, get_settings
+from app.http_client import get_http_client
+from app.utils.resilience import is_upstream_failure, retry_async
 
 logger = logging.getLogger(__name__)
 settings = get_settings()
 
+AQI_LABELS = (
+    "good",
+    "moderate",
+    "unhealthy_sensitive",
+    "unhealthy",
+    "very_unhealthy",
+    "hazardous",
+)
+
+# Upper bound (inclusive, µg/m³) of each AQI_LABELS category but the last
+AQI_BREAKPOINTS = {
+    "pm25": (12.0, 35.4, 55.4, 150.4, 250.4),
+    "pm10": (54.0, 154.0, 254.0, 354.0, 424.0),
+    "no2": (53.0, 100.0, 360.0, 649.0, 1249.0),
+    "o3": (54.0, 70.0, 85.0, 105.0, 200.0),
+}
+
 
 class OpenAQService:
     """Service for accessing OpenAQ air quality data."""
     
     BASE_URL = "https://api.openaq.org/v3"
     
-    def __init__(self):
-        """Initialize the OpenAQ service."""
+    def __init__(self, client: Optional[httpx.AsyncClient] = None):
+        """
+        Initialize the OpenAQ service.
+        
+        Args:
+            client: Shared HTTP client (defaults to the process-wide client)
+        """
         self.api_key = settings.openaq_api_key
         
-        # Set up headers with API key
-        headers = {}
+        # Set up headers with API key, sent per request since the client is shared
+        self.headers = {}
         if self.api_key:
-            headers["X-API-Key"] = self.api_key
+            self.headers["X-API-Key"] = self.api_key
         
-        self.client = httpx.AsyncClient(timeout=30.0, headers=headers)
-    
-    async def close(self):
-        """Close the HTTP client."""
-        await self.client.aclose()
+        self.client = client if client is not None else get_http_client()
     
     async def get_nearest_stations(
         self,
@@ -63,13 +85,16 @@ class OpenAQService:
             
             logger.info(f"OpenAQ request: coordinates={longitude},{latitude}, radius={params['radius']}m")
             
-            response = await self.client.get(
+            response = await retry_async(
+                self.client.get,
                 f"{self.BASE_URL}/locations",
-                params=params
+                params=params,
+                headers=self.headers,
+                timeout=HTTP_TIMEOUTS["openaq"]
             )
             response.raise_for_status()
             
-            data = response.json()
+            data = orjson.loads(response.content)
             results = data.get("results", [])
             
             logger.info(f"Found {len(results)} stations near ({latitude}, {longitude})")
@@ -77,6 +102,8 @@ class OpenAQService:
             
         except httpx.HTTPError as e:
             logger.error(f"HTTP error fetching OpenAQ stations: {e}")
+            if is_upstream_failure(e):
+                raise
             return []
         except Exception as e:
             logger.error(f"Error fetching OpenAQ stations: {e}")
@@ -118,13 +145,16 @@ class OpenAQService:
             logger.info(f"OpenAQ measurements request: coordinates={longitude},{latitude}, radius={params['radius']}m")
             
             # Use /locations endpoint to get stations with latest measurements
-            response = await self.client.get(
+            response = await retry_async(
+                self.client.get,
                 f"{self.BASE_URL}/locations",
-                params=params
+                params=params,
+                headers=self.headers,
+                timeout=HTTP_TIMEOUTS["openaq"]
             )
             response.raise_for_status()
             
-            data = response.json()
+            data = orjson.loads(response.content)
             results = data.get("results", [])
             
             logger.info(f"Found {len(results)} measurements near ({latitude}, {longitude})")
@@ -132,6 +162,8 @@ class OpenAQService:
             
         except httpx.HTTPError as e:
             logger.error(f"HTTP error fetching OpenAQ measurements: {e}")
+            if is_upstream_failure(e):
+                raise
             return []
         except Exception as e:
             logger.error(f"Error fetching OpenAQ measurements: {e}")
@@ -148,63 +180,10 @@ class OpenAQService:
         Returns:
             AQI category string
         """
-        if parameter == "pm25":
-            if value <= 12:
-                return "good"
-            elif value <= 35.4:
-                return "moderate"
-            elif value <= 55.4:
-                return "unhealthy_sensitive"
-            elif value <= 150.4:
-                return "unhealthy"
-            elif value <= 250.4:
-                return "very_unhealthy"
-            else:
-                return "hazardous"
-        
-        elif parameter == "pm10":
-            if value <= 54:
-                return "good"
-            elif value <= 154:
-                return "moderate"
-            elif value <= 254:
-                return "unhealthy_sensitive"
-            elif value <= 354:
-                return "unhealthy"
-            elif value <= 424:
-                return "very_unhealthy"
-            else:
-                return "hazardous"
-        
-        elif parameter == "no2":
-            if value <= 53:
-                return "good"
-            elif value <= 100:
-                return "moderate"
-            elif value <= 360:
-                return "unhealthy_sensitive"
-            elif value <= 649:
-                return "unhealthy"
-            elif value <= 1249:
-                return "very_unhealthy"
-            else:
-                return "hazardous"
-        
-        elif parameter == "o3":
-            if value <= 54:
-                return "good"
-            elif value <= 70:
-                return "moderate"
-            elif value <= 85:
-                return "unhealthy_sensitive"
-            elif value <= 105:
-                return "unhealthy"
-            elif value <= 200:
-                return "very_unhealthy"
-            else:
-                return "hazardous"
-        
-        return "unknown"
+        breakpoints = AQI_BREAKPOINTS.get(parameter)
+        if breakpoints is None:
+            return "unknown"
+        return AQI_LABELS[bisect_left(breakpoints, value)]
     
     async def get_aggregated_data(
         self,
@@ -1,8 +1,25 @@
 """Geospatial utility functions."""
 
 import math
+from math import asin, cos, sin, sqrt
 from typing import Tuple
 
+import numpy as np
+
+try:
+    import numba
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+# Mean Earth radius in kilometers
+EARTH_RADIUS_KM = 6371.0
+
+_EARTH_DIAMETER_KM = 2 * EARTH_RADIUS_KM
+_DEG_TO_RAD = math.pi / 180
+_HALF_DEG_TO_RAD = _DEG_TO_RAD / 2
+_EARTH_DIAMETER_KM_F32 = np.float32(_EARTH_DIAMETER_KM)
+
 
 def haversine_distance(
     lat1: float,
@@ -22,32 +39,100 @@ def haversine_distance(
     Returns:
         Distance in kilometers
     """
-    # Convert to radians
-    lat1_rad = math.radians(lat1)
-    lon1_rad = math.radians(lon1)
-    lat2_rad = math.radians(lat2)
-    lon2_rad = math.radians(lon2)
+    return _haversine_scalar(lat1, lon1, lat2, lon2)
+
+
+def _haversine_py(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    phi1 = lat1 * _DEG_TO_RAD
+    phi2 = lat2 * _DEG_TO_RAD
+    sin_dphi = sin((phi2 - phi1) * 0.5)
+    sin_dlam = sin((lon2 - lon1) * _HALF_DEG_TO_RAD)
+    a = sin_dphi * sin_dphi + cos(phi1) * cos(phi2) * sin_dlam * sin_dlam
+    return _EARTH_DIAMETER_KM * asin(sqrt(min(a, 1.0)))
+
+
+def haversine_distance_from_precomputed(
+    phi1: float,
+    lam1: float,
+    cos_phi1: float,
+    lat2: float,
+    lon2: float
+) -> float:
+    """
+    Calculate the great circle distance from a fixed origin to one point.
     
-    # Haversine formula
-    dlat = lat2_rad - lat1_rad
-    dlon = lon2_rad - lon1_rad
+    For loops that measure many points one at a time against the same
+    origin: convert the origin once (phi1 = radians(lat), lam1 =
+    radians(lon), cos_phi1 = cos(phi1)) and reuse it for every call.
     
-    a = (
-        math.sin(dlat / 2) ** 2 +
-        math.cos(lat1_rad) * math.cos(lat2_rad) * math.sin(dlon / 2) ** 2
-    )
-    c = 2 * math.asin(math.sqrt(a))
+    Args:
+        phi1: Latitude of the origin in radians
+        lam1: Longitude of the origin in radians
+        cos_phi1: Cosine of phi1
+        lat2: Latitude of the point in decimal degrees
+        lon2: Longitude of the point in decimal degrees
+        
+    Returns:
+        Distance in kilometers
+    """
+    phi2 = lat2 * _DEG_TO_RAD
+    sin_dphi = sin((phi2 - phi1) * 0.5)
+    sin_dlam = sin((lon2 * _DEG_TO_RAD - lam1) * 0.5)
+    a = sin_dphi * sin_dphi + cos_phi1 * cos(phi2) * sin_dlam * sin_dlam
+    return _EARTH_DIAMETER_KM * asin(sqrt(min(a, 1.0)))
+
+
+if HAS_NUMBA:
+    _haversine_scalar = numba.njit(cache=True, fastmath=True)(_haversine_py)
+    _haversine_scalar(0.0, 0.0, 0.0, 0.0)  # compile (or load from cache) at import
+else:
+    _haversine_scalar = _haversine_py
+
+
+def haversine_vector(
+    lat0: float,
+    lon0: float,
+    lats: np.ndarray,
+    lons: np.ndarray
+) -> np.ndarray:
+    """
+    Calculate great circle distances from one point to many points at once.
     
-    # Earth's radius in kilometers
-    earth_radius_km = 6371.0
+    Vectorized counterpart of haversine_distance for batches of fires or
+    stations, avoiding per-point Python trigonometry. Computed in float32,
+    which halves the bytes moved per point; for distances up to a few
+    thousand kilometers the error stays within a few meters, well below the
+    kilometer granularity of the search radius (precision degrades only for
+    near-antipodal points).
     
-    return earth_radius_km * c
+    Args:
+        lat0: Latitude of the origin in decimal degrees
+        lon0: Longitude of the origin in decimal degrees
+        lats: Latitudes of the destinations in decimal degrees
+        lons: Longitudes of the destinations in decimal degrees
+        
+    Returns:
+        Array of float32 distances in kilometers
+    """
+    lat0_rad = np.radians(np.float32(lat0))
+    lats_rad = np.radians(np.asarray(lats, dtype=np.float32))
+    dlat = lats_rad - lat0_rad
+    dlon = np.radians(np.asarray(lons, dtype=np.float32) - np.float32(lon0))
+    
+    sin_dlat = np.sin(dlat * np.float32(0.5))
+    sin_dlon = np.sin(dlon * np.float32(0.5))
+    a = sin_dlat * sin_dlat + np.cos(lat0_rad) * np.cos(lats_rad) * sin_dlon * sin_dlon
+    return _EARTH_DIAMETER_KM_F32 * np.arcsin(np.sqrt(np.minimum(a, np.float32(1.0))))
+
+
+# Smallest cos(latitude) used for longitude spans (~88.85°)
+_MIN_COS_LATITUDE = 0.02
 
 
 def calculate_bounding_box(
     latitude: float,
     longitude: float,
-    radius_meters: int
+    radius_meters: float
 ) -> Tuple[float, float, float, float]:
     """
     Calculate a bounding box around a point.
@@ -66,7 +151,8 @@ def calculate_bounding_box(
     # 1 degree latitude ≈ 111 km
     # 1 degree longitude ≈ 111 km * cos(latitude)
     lat_offset = radius_km / 111.0
-    lon_offset = radius_km / (111.0 * abs(math.cos(math.radians(latitude))))
+    # cos(latitude) is floored so boxes at the poles stay finite
+    lon_offset = radius_km / (111.0 * max(math.cos(math.radians(latitude)), _MIN_COS_LATITUDE))
     
     min_lat = latitude - lat_offset
     max_lat = latitude + lat_offset
@@ -1,25 +1,21 @@
 """Utility module for processing NetCDF and HDF5 files from NASA datasets."""
 
 import logging
-from typing import Optional, Dict, Any, List, Tuple
+import importlib.util
+from typing import Optional, Dict, Any, List, Sequence, Tuple
 from pathlib import Path
 import numpy as np
 
-try:
-    import xarray as xr
-    import netCDF4
-    HAS_NETCDF = True
-except ImportError:
-    HAS_NETCDF = False
-    xr = None
-    netCDF4 = None
-
-try:
-    import h5py
-    HAS_H5PY = True
-except ImportError:
-    HAS_H5PY = False
-    h5py = None
+# xarray/netCDF4 and h5py are slow to import, so availability is checked
+# here and the modules themselves are imported on first use.
+HAS_NETCDF = (
+    importlib.util.find_spec("xarray") is not None
+    and importlib.util.find_spec("netCDF4") is not None
+)
+HAS_H5PY = importlib.util.find_spec("h5py") is not None
+# Optional: lets xarray read file objects (e.g. remote granules from
+# earthaccess.open) as well as paths
+HAS_H5NETCDF = importlib.util.find_spec("h5netcdf") is not None
 
 logger = logging.getLogger(__name__)
 
@@ -59,6 +55,8 @@ class NetCDFProcessor:
             logger.error("xarray not available")
             return None
         
+        import xarray as xr
+        
         try:
             with xr.open_dataset(file_path) as ds:
                 # Check if variable exists
@@ -66,49 +64,161 @@ class NetCDFProcessor:
                     logger.error(f"Variable {variable_name} not found in dataset")
                     return None
                 
-                # Get the variable
-                var = ds[variable_name]
-                
-                # Find latitude and longitude dimension names
-                lat_names = ['lat', 'latitude', 'Latitude', 'y']
-                lon_names = ['lon', 'longitude', 'Longitude', 'x']
-                
-                lat_dim = None
-                lon_dim = None
-                
-                for name in lat_names:
-                    if name in ds.dims or name in ds.coords:
-                        lat_dim = name
-                        break
+                return self._point_value(ds, variable_name, latitude, longitude, method)
                 
-                for name in lon_names:
-                    if name in ds.dims or name in ds.coords:
-                        lon_dim = name
-                        break
-                
-                if not lat_dim or not lon_dim:
-                    logger.error("Could not find latitude/longitude dimensions")
-                    return None
-                
-                # Select the point
-                if method == "nearest":
-                    point = var.sel({lat_dim: latitude, lon_dim: longitude}, method="nearest")
-                else:
-                    point = var.interp({lat_dim: latitude, lon_dim: longitude}, method=method)
-                
-                # Extract the value
-                value = float(point.values)
-                
-                # Check for fill values or NaN
-                if np.isnan(value) or np.isinf(value):
-                    return None
+        except Exception as e:
+            logger.error(f"Error extracting point value from {file_path}: {e}")
+            return None
+    
+    def extract_first_available(
+        self,
+        file_path: str,
+        variable_names: Sequence[str],
+        latitude: float,
+        longitude: float,
+        method: str = "nearest"
+    ) -> Optional[float]:
+        """
+        Extract the point value of the first variable present in a NetCDF file.
+        
+        The file is opened once and the candidates are checked against its
+        variables, instead of reopening it for every alternative name.
+        
+        Args:
+            file_path: Path to the NetCDF file, or a file object when h5netcdf
+                is installed
+            variable_names: Candidate variable names, in order of preference
+            latitude: Target latitude
+            longitude: Target longitude
+            method: Interpolation method ('nearest', 'linear')
+            
+        Returns:
+            Value of the first candidate that yields one, or None
+        """
+        if not HAS_NETCDF:
+            logger.error("xarray not available")
+            return None
+        
+        import xarray as xr
+        
+        try:
+            with xr.open_dataset(file_path) as ds:
+                for variable_name in variable_names:
+                    if variable_name not in ds.variables:
+                        continue
+                    value = self._point_value(ds, variable_name, latitude, longitude, method)
+                    if value is not None:
+                        return value
                 
-                return value
+                logger.error(f"None of {list(variable_names)} found in dataset")
+                return None
                 
         except Exception as e:
             logger.error(f"Error extracting point value from {file_path}: {e}")
             return None
     
+    @staticmethod
+    def _point_value(
+        ds: Any,
+        variable_name: str,
+        latitude: float,
+        longitude: float,
+        method: str
+    ) -> Optional[float]:
+        """
+        Select one variable at a point in an open dataset.
+        
+        Args:
+            ds: Open xarray Dataset
+            variable_name: Name of a variable present in the dataset
+            latitude: Target latitude
+            longitude: Target longitude
+            method: Interpolation method ('nearest', 'linear')
+            
+        Returns:
+            Extracted value, or None for fill values or missing lat/lon dimensions
+        """
+        point = NetCDFProcessor._select_point(ds[variable_name], ds, latitude, longitude, method)
+        if point is None:
+            return None
+        return NetCDFProcessor._scalar(point)
+    
+    @staticmethod
+    def _select_point(
+        obj: Any,
+        ds: Any,
+        latitude: float,
+        longitude: float,
+        method: str
+    ) -> Optional[Any]:
+        """
+        Select a DataArray or Dataset at a point.
+        
+        Selecting a Dataset of several variables at once finds the nearest
+        grid indices a single time for all of them.
+        
+        Args:
+            obj: DataArray or Dataset to select from
+            ds: Open xarray Dataset obj belongs to (for dimension names)
+            latitude: Target latitude
+            longitude: Target longitude
+            method: Interpolation method ('nearest', 'linear')
+            
+        Returns:
+            Selection at the point, or None if lat/lon dimensions are missing
+        """
+        # Find latitude and longitude dimension names
+        lat_names = ['lat', 'latitude', 'Latitude', 'y']
+        lon_names = ['lon', 'longitude', 'Longitude', 'x']
+        
+        lat_dim = None
+        lon_dim = None
+        
+        for name in lat_names:
+            if name in ds.dims or name in ds.coords:
+                lat_dim = name
+                break
+        
+        for name in lon_names:
+            if name in ds.dims or name in ds.coords:
+                lon_dim = name
+                break
+        
+        if not lat_dim or not lon_dim:
+            logger.error("Could not find latitude/longitude dimensions")
+            return None
+        
+        # Select the point
+        if method == "nearest":
+            return obj.sel({lat_dim: latitude, lon_dim: longitude}, method="nearest")
+        return obj.interp({lat_dim: latitude, lon_dim: longitude}, method=method)
+    
+    @staticmethod
+    def _scalar(point: Any) -> Optional[float]:
+        """
+        Convert a DataArray selected at a point to a float.
+        
+        Args:
+            point: DataArray selected at a point (see _select_point)
+            
+        Returns:
+            Value of the most recent time step, or None for fill values
+        """
+        # Take the most recent step of multi-time files (e.g. hourly MERRA-2)
+        for name in ('time', 'Time', 't'):
+            if name in point.dims:
+                point = point.isel({name: -1})
+                break
+        
+        # Extract the value
+        value = float(point.values)
+        
+        # Check for fill values or NaN
+        if np.isnan(value) or np.isinf(value):
+            return None
+        
+        return value
+    
     def extract_area_average(
         self,
         file_path: str,
@@ -134,6 +244,8 @@ class NetCDFProcessor:
             logger.error("xarray not available")
             return None
         
+        import xarray as xr
+        
         try:
             with xr.open_dataset(file_path) as ds:
                 # Check if variable exists
@@ -203,23 +315,44 @@ class NetCDFProcessor:
         """
         Extract multiple variables at a point from a NetCDF file.
         
+        The file is opened once and the nearest grid point is looked up once
+        for all variables.
+        
         Args:
-            file_path: Path to the NetCDF file
+            file_path: Path to the NetCDF file, or a file object when h5netcdf
+                is installed
             variable_names: List of variable names to extract
             latitude: Target latitude
             longitude: Target longitude
             method: Interpolation method
             
         Returns:
-            Dictionary mapping variable names to values
+            Dictionary mapping variable names to values (None when missing)
         """
-        results = {}
+        results: Dict[str, Optional[float]] = dict.fromkeys(variable_names)
         
-        for var_name in variable_names:
-            value = self.extract_point_value(
-                file_path, var_name, latitude, longitude, method
-            )
-            results[var_name] = value
+        if not HAS_NETCDF:
+            logger.error("xarray not available")
+            return results
+        
+        import xarray as xr
+        
+        try:
+            with xr.open_dataset(file_path) as ds:
+                present = []
+                for var_name in variable_names:
+                    if var_name in ds.variables:
+                        present.append(var_name)
+                    else:
+                        logger.error(f"Variable {var_name} not found in dataset")
+                
+                # Select all variables together so the grid index is found once
+                point = self._select_point(ds[present], ds, latitude, longitude, method) if present else None
+                if point is not None:
+                    for var_name in present:
+                        results[var_name] = self._scalar(point[var_name])
+        except Exception as e:
+            logger.error(f"Error extracting variables from {file_path}: {e}")
         
         return results
     
@@ -237,6 +370,8 @@ class NetCDFProcessor:
             logger.error("xarray not available")
             return None
         
+        import xarray as xr
+        
         try:
             with xr.open_dataset(file_path) as ds:
                 info = {
@@ -273,6 +408,8 @@ class NetCDFProcessor:
             logger.error("xarray not available")
             return None
         
+        import xarray as xr
+        
         try:
             with xr.open_dataset(file_path) as ds:
                 # Check if variable exists
@@ -369,16 +506,50 @@ class HDF5Processor:
         Returns:
             Extracted value or None if error
         """
+        return self.extract_variables(
+            file_path, [variable_path], latitude, longitude, lat_array_path, lon_array_path
+        )[variable_path]
+    
+    def extract_variables(
+        self,
+        file_path: str,
+        variable_paths: List[str],
+        latitude: float,
+        longitude: float,
+        lat_array_path: str = "lat",
+        lon_array_path: str = "lon"
+    ) -> Dict[str, Optional[float]]:
+        """
+        Extract several variables at a point from an HDF5 file.
+        
+        The file is opened and the nearest grid indices are found once for
+        all variables.
+        
+        Args:
+            file_path: Path to the HDF5 file
+            variable_paths: Paths to the variables in HDF5 structure
+            latitude: Target latitude
+            longitude: Target longitude
+            lat_array_path: Path to latitude array
+            lon_array_path: Path to longitude array
+            
+        Returns:
+            Dictionary mapping variable paths to values (None when missing)
+        """
+        results: Dict[str, Optional[float]] = dict.fromkeys(variable_paths)
+        
         if not HAS_H5PY:
             logger.error("h5py not available")
-            return None
+            return results
+        
+        import h5py
         
         try:
             with h5py.File(file_path, 'r') as f:
                 # Get latitude and longitude arrays
                 if lat_array_path not in f or lon_array_path not in f:
                     logger.error("Latitude or longitude arrays not found")
-                    return None
+                    return results
                 
                 lats = f[lat_array_path][:]
                 lons = f[lon_array_path][:]
@@ -387,32 +558,32 @@ class HDF5Processor:
                 lat_idx = np.argmin(np.abs(lats - latitude))
                 lon_idx = np.argmin(np.abs(lons - longitude))
                 
-                # Get the variable
-                if variable_path not in f:
-                    logger.error(f"Variable {variable_path} not found")
-                    return None
-                
-                var = f[variable_path]
-                
-                # Extract value (handle different dimensions)
-                if len(var.shape) == 2:
-                    value = float(var[lat_idx, lon_idx])
-                elif len(var.shape) == 3:
-                    # Assume time is first dimension, take most recent
-                    value = float(var[-1, lat_idx, lon_idx])
-                else:
-                    logger.error(f"Unsupported variable shape: {var.shape}")
-                    return None
-                
-                # Check for fill values
-                if np.isnan(value) or np.isinf(value):
-                    return None
-                
-                return value
+                for variable_path in variable_paths:
+                    # Get the variable
+                    if variable_path not in f:
+                        logger.error(f"Variable {variable_path} not found")
+                        continue
+                    
+                    var = f[variable_path]
+                    
+                    # Extract value (handle different dimensions)
+                    if len(var.shape) == 2:
+                        value = float(var[lat_idx, lon_idx])
+                    elif len(var.shape) == 3:
+                        # Assume time is first dimension, take most recent
+                        value = float(var[-1, lat_idx, lon_idx])
+                    else:
+                        logger.error(f"Unsupported variable shape: {var.shape}")
+                        continue
+                    
+                    # Check for fill values
+                    if not (np.isnan(value) or np.isinf(value)):
+                        results[variable_path] = value
                 
         except Exception as e:
             logger.error(f"Error extracting from HDF5 {file_path}: {e}")
-            return None
+        
+        return results
     
     def list_variables(self, file_path: str) -> Optional[List[str]]:
         """
@@ -428,6 +599,8 @@ class HDF5Processor:
             logger.error("h5py not available")
             return None
         
+        import h5py
+        
         try:
             variables = []
             
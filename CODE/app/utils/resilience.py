@@ -0,0 +1,328 @@
+"""Fault-tolerance helpers for calls to upstream data sources."""
+
+import asyncio
+import logging
+import random
+import threading
+import time
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple, Type, TypeVar
+
+import httpx
+import requests
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class SourceUnavailableError(Exception):
+    """Raised when a call is rejected locally without contacting the upstream."""
+
+    reason = "unavailable"
+
+    def __init__(self, name: str):
+        super().__init__(f"{name} {self.reason}")
+        self.name = name
+
+
+class CircuitOpenError(SourceUnavailableError):
+    """Raised when a call is rejected because its circuit breaker is open."""
+
+    reason = "circuit open"
+
+
+class BulkheadFullError(SourceUnavailableError):
+    """Raised when a source's concurrency limit stays saturated too long."""
+
+    reason = "too many concurrent requests"
+
+
+def is_upstream_failure(exc: BaseException) -> bool:
+    """
+    Check whether an exception means the upstream service is unhealthy.
+
+    Transport errors (connection failures, timeouts) and 5xx responses count
+    as failures; 4xx responses are client errors and do not. Both httpx and
+    requests (used by earthaccess) errors are recognised, including when
+    wrapped in another exception, as earthaccess does for CMR responses.
+
+    Args:
+        exc: Exception raised by an upstream call
+
+    Returns:
+        True if the exception should count against the upstream
+    """
+    while exc is not None:
+        if isinstance(exc, (httpx.TransportError, requests.exceptions.ConnectionError, requests.exceptions.Timeout)):
+            return True
+        if isinstance(exc, httpx.HTTPStatusError):
+            return exc.response.status_code >= 500
+        if isinstance(exc, requests.exceptions.HTTPError):
+            return exc.response is not None and exc.response.status_code >= 500
+        exc = exc.__cause__
+    return False
+
+
+class CircuitBreaker:
+    """
+    Consecutive-failure circuit breaker for one upstream source.
+
+    After ``fail_max`` consecutive upstream failures the circuit opens and
+    calls fail immediately with CircuitOpenError. Once ``reset_timeout``
+    seconds have passed a single probe call is let through (half-open); its
+    outcome closes the circuit or reopens it for another timeout window.
+
+    Usable as ``async with breaker:`` (or ``with breaker:`` for code running
+    in worker threads).
+    """
+
+    def __init__(self, name: str, fail_max: int = 5, reset_timeout: float = 10.0):
+        """
+        Initialize the circuit breaker.
+
+        Args:
+            name: Source name used in errors and logs
+            fail_max: Consecutive failures before the circuit opens
+            reset_timeout: Seconds to stay open before allowing a probe
+        """
+        self.name = name
+        self.fail_max = fail_max
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self._probing = False
+
+    @property
+    def state(self) -> str:
+        """Current state: 'closed', 'open' or 'half_open'."""
+        if self.opened_at is None:
+            return "closed"
+        if self._probing or time.monotonic() - self.opened_at >= self.reset_timeout:
+            return "half_open"
+        return "open"
+
+    def _before_call(self) -> None:
+        if self.opened_at is None:
+            return
+        if self._probing or time.monotonic() - self.opened_at < self.reset_timeout:
+            raise CircuitOpenError(self.name)
+        self._probing = True
+
+    def _after_call(self, exc: Optional[BaseException]) -> None:
+        probing, self._probing = self._probing, False
+        if exc is not None and not isinstance(exc, Exception):
+            # Cancellation says nothing about the upstream's health
+            return
+        if exc is not None and is_upstream_failure(exc):
+            self.failures += 1
+            if probing or self.failures >= self.fail_max:
+                if self.opened_at is None or probing:
+                    logger.warning(f"Circuit for {self.name} opened after {self.failures} failures")
+                self.opened_at = time.monotonic()
+            return
+        if self.opened_at is not None:
+            logger.info(f"Circuit for {self.name} closed")
+        self.failures = 0
+        self.opened_at = None
+
+    def __enter__(self):
+        self._before_call()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self._after_call(exc)
+        return False
+
+    async def __aenter__(self):
+        self._before_call()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        self._after_call(exc)
+        return False
+
+
+class Bulkhead:
+    """
+    Cap concurrent in-flight calls to one upstream.
+
+    Callers over the limit wait up to ``max_wait`` seconds for a slot and
+    then fail with BulkheadFullError, so a slow upstream cannot take over
+    the shared connection pool and starve the other sources.
+
+    Usable as ``async with bulkhead:``.
+    """
+
+    def __init__(self, name: str, max_concurrent: int, max_wait: float = 1.0):
+        """
+        Initialize the bulkhead.
+
+        Args:
+            name: Upstream name used in errors
+            max_concurrent: Maximum concurrent calls
+            max_wait: Seconds to wait for a free slot before failing
+        """
+        self.name = name
+        self.max_wait = max_wait
+        self._semaphore = asyncio.Semaphore(max_concurrent)
+
+    async def __aenter__(self):
+        try:
+            await asyncio.wait_for(self._semaphore.acquire(), self.max_wait)
+        except asyncio.TimeoutError:
+            raise BulkheadFullError(self.name) from None
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        self._semaphore.release()
+        return False
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket shaping how often calls to an upstream start.
+    
+    Allows bursts of up to ``capacity`` calls, then ``rate`` calls per
+    second. ``acquire()`` blocks until the caller's turn, so use it from
+    blocking code running in worker threads, not on the event loop.
+    """
+    
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        """
+        Initialize a full bucket.
+        
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum burst size (defaults to one second's worth)
+        """
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(rate, 1.0)
+        self._tokens = self.capacity
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def acquire(self) -> None:
+        """Take one token, sleeping until it is available."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * self.rate)
+            self._updated_at = now
+            # Reserve the token even if it is not there yet; callers queue up
+            # behind each other through the negative balance
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        if wait > 0:
+            time.sleep(wait)
+    
+    def try_acquire(self) -> bool:
+        """
+        Take one token only if it is available now.
+        
+        Returns:
+            True if a token was taken, False if the caller should skip the call
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * self.rate)
+            self._updated_at = now
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+            return True
+
+
+class SingleFlight:
+    """
+    Coalesce concurrent identical calls into one in-flight call.
+
+    The first caller for a key runs the call; callers arriving with the same
+    key while it is in flight await its result instead of issuing a
+    duplicate upstream request. Nothing is kept once the call completes.
+    """
+
+    def __init__(self):
+        """Initialize with no calls in flight."""
+        self._inflight: Dict[Hashable, asyncio.Future] = {}
+
+    async def do(self, key: Hashable, func: Callable[..., Awaitable[T]], *args: Any, **kwargs: Any) -> T:
+        """
+        Await ``func(*args, **kwargs)``, sharing the call with concurrent callers.
+
+        Args:
+            key: Identity of the call; equal keys are coalesced
+            func: Coroutine function to call
+            *args: Positional arguments for func
+            **kwargs: Keyword arguments for func
+
+        Returns:
+            Result of the shared call (exceptions are shared as well)
+        """
+        future = self._inflight.get(key)
+        if future is not None:
+            try:
+                # Shielded so a follower's cancellation does not cancel the shared call
+                return await asyncio.shield(future)
+            except asyncio.CancelledError:
+                if not future.cancelled():
+                    raise
+                # The leading caller was cancelled; make the call ourselves
+                return await func(*args, **kwargs)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            result = await func(*args, **kwargs)
+        except Exception as e:
+            future.set_exception(e)
+            future.exception()  # mark retrieved when there are no followers
+            raise
+        except BaseException:
+            future.cancel()
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            self._inflight.pop(key, None)
+
+
+async def retry_async(
+    func: Callable[..., Awaitable[T]],
+    *args: Any,
+    attempts: int = 3,
+    initial_delay: float = 0.2,
+    max_delay: float = 2.0,
+    retry_on: Tuple[Type[BaseException], ...] = (httpx.TransportError,),
+    **kwargs: Any
+) -> T:
+    """
+    Await ``func(*args, **kwargs)``, retrying transient errors.
+
+    Waits between attempts grow exponentially from ``initial_delay`` up to
+    ``max_delay`` with full jitter, so concurrent callers retrying the same
+    outage do not synchronize. Only use for idempotent calls (GETs).
+
+    Args:
+        func: Coroutine function to call
+        *args: Positional arguments for func
+        attempts: Maximum number of attempts
+        initial_delay: Base delay in seconds before the second attempt
+        max_delay: Upper bound for any single delay in seconds
+        retry_on: Exception types that trigger a retry
+        **kwargs: Keyword arguments for func
+
+    Returns:
+        Result of the first successful call
+
+    Raises:
+        The last exception once all attempts are exhausted
+    """
+    for attempt in range(attempts):
+        try:
+            return await func(*args, **kwargs)
+        except retry_on as e:
+            if attempt == attempts - 1:
+                raise
+            delay = random.uniform(0, min(max_delay, initial_delay * 2 ** attempt))
+            logger.info(f"Retrying after {type(e).__name__} (attempt {attempt + 2}/{attempts}) in {delay:.2f}s")
+            await asyncio.sleep(delay)
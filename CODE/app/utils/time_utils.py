@@ -0,0 +1,34 @@
+"""Time utility functions."""
+
+import time
+from datetime import datetime
+
+# [epoch_second, formatted_timestamp]
+_ts_cache = [0, ""]
+
+
+def utc_now_iso() -> str:
+    """
+    Get the current UTC time as an ISO 8601 string with a trailing 'Z'.
+
+    The formatted value is cached with 1-second granularity, so repeated
+    calls within the same second reuse the same string.
+
+    Returns:
+        ISO 8601 timestamp (e.g., '2024-01-01T12:00:00Z')
+    """
+    now = int(time.time())
+    if now != _ts_cache[0]:
+        _ts_cache[1] = datetime.utcfromtimestamp(now).isoformat() + "Z"
+        _ts_cache[0] = now
+    return _ts_cache[1]
+
+
+def seconds_until_utc_midnight() -> float:
+    """
+    Get the time left in the current UTC day.
+
+    Returns:
+        Seconds until the next 00:00 UTC, in (0, 86400]
+    """
+    return 86400 - time.time() % 86400
@@ -0,0 +1,90 @@
+"""Shared fixtures for the test suite."""
+
+import asyncio
+
+import httpx
+import pytest
+
+from app.services.earthdata import EarthdataService
+from app.services.firms import FIRMSService
+
+
+@pytest.fixture
+def earthdata_service(monkeypatch):
+    """EarthdataService that skips the Earthdata Login handshake."""
+    service = EarthdataService()
+    monkeypatch.setattr(service, "ensure_authenticated", lambda: True)
+    return service
+
+
+@pytest.fixture
+def earthdata_session(earthdata_service):
+    """
+    Route an authenticated service's downloads through a fake session.
+
+    Returns:
+        Function taking a session object and returning the service
+    """
+    def use_session(session):
+        earthdata_service.auth = type("FakeAuth", (), {"get_session": lambda self: session})()
+        return earthdata_service
+
+    return use_session
+
+
+@pytest.fixture
+def granule_download(earthdata_service, tmp_path, monkeypatch):
+    """
+    Make download_granules return an empty local granule file.
+
+    Returns:
+        Function taking a file name and returning (path, downloads), where
+        downloads records the granules passed to each download_granules call
+    """
+    def fake_download(file_name):
+        path = tmp_path / file_name
+        path.write_bytes(b"")
+        downloads = []
+        monkeypatch.setattr(
+            earthdata_service,
+            "download_granules",
+            lambda granules: downloads.append(granules) or [str(path)]
+        )
+        return path, downloads
+
+    return fake_download
+
+
+@pytest.fixture
+def no_value_cache(monkeypatch):
+    """Disable the on-disk granule value cache."""
+    monkeypatch.setattr("app.services.earthdata.get_value_cache", lambda: None)
+
+
+@pytest.fixture
+def reset_earthdata_auth():
+    """Reset the class-wide Earthdata authentication state around a test."""
+    EarthdataService.reset_authentication()
+    yield
+    EarthdataService.reset_authentication()
+
+
+@pytest.fixture
+def fetch_fires():
+    """
+    Run get_fires_multiple_sources against a mocked FIRMS API.
+
+    Returns:
+        Function taking an httpx.MockTransport handler and returning the
+        combined fire data
+    """
+    def fetch(handler):
+        async def scenario():
+            async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+                service = FIRMSService(client)
+                service.api_key = "test"
+                return await service.get_fires_multiple_sources(-11.0, -50.0)
+
+        return asyncio.run(scenario())
+
+    return fetch
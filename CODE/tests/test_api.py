@@ -1,7 +1,9 @@
 """Tests for API endpoints."""
 
+import os
 import pytest
 from fastapi.testclient import TestClient
+import app.main as main
 from app.main import app
 
 client = TestClient(app)
@@ -25,6 +27,61 @@ def test_health_check():
     assert "timestamp" in data
 
 
+def test_health_check_caching(monkeypatch):
+    """Test health check cache headers and conditional requests."""
+    monkeypatch.setattr("app.main.time.time", lambda: 1_700_000_000.0)
+    
+    response = client.get("/health")
+    assert response.headers["cache-control"] == "public, max-age=1"
+    etag = response.headers["etag"]
+    
+    revalidated = client.get("/health", headers={"If-None-Match": etag})
+    assert revalidated.status_code == 304
+    assert revalidated.content == b""
+    assert revalidated.headers["etag"] == etag
+    
+    stale = client.get("/health", headers={"If-None-Match": '"stale"'})
+    assert stale.status_code == 200
+    assert stale.json()["status"] == "healthy"
+
+
+@pytest.mark.skipif(not main.HAS_FCNTL, reason="warm-up lock needs fcntl")
+def test_warmup_claimed_by_one_worker(tmp_path, monkeypatch):
+    """Test only the first worker claims the warm-up until it releases it."""
+    monkeypatch.setattr(main.settings, "cache_dir", str(tmp_path))
+    
+    lock = main._claim_warmup()
+    assert lock is not None
+    assert main._claim_warmup() is None
+    
+    os.close(lock)
+    lock = main._claim_warmup()
+    assert lock is not None
+    os.close(lock)
+
+
+def test_process_time_header():
+    """Test that responses carry the processing time header."""
+    response = client.get("/health")
+    assert response.headers["x-process-time-ms"].isdigit()
+
+
+def test_test_page():
+    """Test interactive test page endpoint."""
+    response = client.get("/test")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/html")
+    assert "NASA SafeOut API" in response.text
+
+
+def test_test_page_uncompressed():
+    """Test interactive test page without gzip support."""
+    response = client.get("/test", headers={"Accept-Encoding": "identity"})
+    assert response.status_code == 200
+    assert "content-encoding" not in response.headers
+    assert "NASA SafeOut API" in response.text
+
+
 def test_api_info():
     """Test API info endpoint."""
     response = client.get("/api/v1/info")
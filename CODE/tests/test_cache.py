@@ -0,0 +1,51 @@
+"""Tests for the in-process, on-disk and Redis caches."""
+
+from app.services.cache import DiskCache, TTLCache, cache_key, quantize_location
+
+
+def test_cache_key_quantization():
+    """Test nearby queries share a cache key."""
+    assert quantize_location(-27.59541, -48.54803, 5400) == (-27.6, -48.55, 5000)
+    assert cache_key("weather", -27.5954, -48.5480, 5000) == cache_key("weather", -27.5951, -48.5479, 5999)
+    assert cache_key("weather", -27.5954, -48.5480, 5000) != cache_key("uv_index", -27.5954, -48.5480, 5000)
+
+
+def test_ttl_cache():
+    """Test in-process cache expiry and size bound."""
+    cache = TTLCache(max_entries=2)
+    cache.set("a", 1, ttl=60)
+    cache.set("b", 2, ttl=0)
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+
+    cache.set("c", 3, ttl=60)
+    cache.set("d", 4, ttl=60)
+    assert cache.get("a") is None
+    assert cache.get("c") == 3 and cache.get("d") == 4
+
+
+def test_ttl_cache_evicts_least_recently_used():
+    """Test reads keep a hot entry cached while newer keys arrive."""
+    cache = TTLCache(max_entries=2)
+    cache.set("hot", 1, ttl=60)
+    cache.set("b", 2, ttl=60)
+    assert cache.get("hot") == 1
+
+    cache.set("c", 3, ttl=60)
+    assert cache.get("hot") == 1
+    assert cache.get("b") is None
+
+
+def test_disk_cache(tmp_path):
+    """Test on-disk cache round trip, expiry and persistence."""
+    path = str(tmp_path / "cache.sqlite")
+    cache = DiskCache(path)
+
+    cache.set("granules", [{"id": "G1"}], ttl=60)
+    cache.set("stale", [1], ttl=-1)
+    assert cache.get("granules") == [{"id": "G1"}]
+    assert cache.get("stale") is None
+    assert cache.get("missing") is None
+    cache.close()
+
+    assert DiskCache(path).get("granules") == [{"id": "G1"}]
@@ -0,0 +1,77 @@
+"""Tests for the DataProcessor that aggregates the data sources."""
+
+import asyncio
+import threading
+
+import httpx
+import pytest
+import requests
+
+import app.services.earthdata as earthdata
+from app.http_client import HTTP_LIMITS, get_http_client
+from app.services.data_processor import DataProcessor
+from app.utils.resilience import SourceUnavailableError
+
+
+def test_services_share_http_client():
+    """Test HTTP services reuse one pooled client."""
+    client = httpx.AsyncClient(limits=HTTP_LIMITS)
+    processor = DataProcessor(http_client=client)
+    assert processor.openaq_service.client is client
+    assert processor.firms_service.client is client
+
+    # Without an explicit client, the process-wide pooled client is used
+    processor = DataProcessor()
+    assert processor.openaq_service.client is get_http_client()
+    assert processor.firms_service.client is processor.http
+
+
+def test_earthdata_products_fetched_concurrently(monkeypatch):
+    """Test precipitation and weather are fetched in parallel, not in sequence."""
+    # Neither fetch can pass the barrier until the other has reached it, so
+    # a sequential get_all breaks the barrier instead of recording arrivals
+    barrier = threading.Barrier(2, timeout=2)
+    arrivals = []
+
+    def fetch(*args, **kwargs):
+        arrivals.append(barrier.wait())
+        return None
+
+    processor = DataProcessor()
+    monkeypatch.setattr(processor.earthdata_service, "get_imerg_data", fetch)
+    monkeypatch.setattr(processor.earthdata_service, "get_merra2_data", fetch)
+
+    results = asyncio.run(processor.get_all(
+        12.34, 56.78, 5000, methods=["get_precipitation_data", "get_weather_data"]
+    ))
+
+    assert results == [None, None]
+    assert sorted(arrivals) == [0, 1]
+
+
+def test_earthdata_outage_opens_weather_breaker(earthdata_service, monkeypatch):
+    """Test CMR connection failures open the weather breaker, which then fails fast."""
+    searches = []
+
+    class DownEarthaccess:
+        @staticmethod
+        def search_data(**kwargs):
+            searches.append(kwargs)
+            # earthaccess wraps request errors in RuntimeError
+            raise RuntimeError("CMR unreachable") from requests.exceptions.ConnectionError("refused")
+
+    monkeypatch.setattr(earthdata, "_earthaccess", lambda: DownEarthaccess)
+    monkeypatch.setattr(earthdata, "get_search_cache", lambda: None)
+    processor = DataProcessor()
+    processor.earthdata_service = earthdata_service
+
+    async def scenario():
+        for _ in range(5):
+            with pytest.raises(RuntimeError):
+                await processor.get_weather_data(-33.87, 151.21, 5000)
+        with pytest.raises(SourceUnavailableError):
+            await processor.get_weather_data(-33.87, 151.21, 5000)
+
+    asyncio.run(scenario())
+    assert len(searches) == 5
+    assert processor._breakers["weather"].state == "open"
@@ -0,0 +1,442 @@
+"""Tests for the NASA Earthdata service."""
+
+import hashlib
+import io
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+import pytest
+import requests
+
+import app.services.earthdata as earthdata
+from app.services.cache import DiskCache
+from app.services.earthdata import (
+    AUTH_BACKOFF_SECONDS,
+    AUTH_LOCKED_BACKOFF_SECONDS,
+    EarthdataService,
+    _merra2_weather,
+    _opendap_url,
+    _prune_download_dir,
+    _s3_direct_access,
+    _search_cache_key,
+    _search_temporal
+)
+
+
+class _FakeResponse:
+    def __init__(self, body, url="", headers=None, accept_ranges=False):
+        self.body = body
+        self.url = url
+        self.status_code = 200
+        self.headers = {}
+        if body is not None:
+            self.headers["Content-Length"] = str(len(body))
+        if accept_ranges:
+            self.headers["Accept-Ranges"] = "bytes"
+        range_header = (headers or {}).get("Range")
+        if range_header and accept_ranges:
+            lo, hi = range_header[len("bytes="):].split("-")
+            self.body = body[int(lo):int(hi) + 1 if hi else None]
+            self.status_code = 206
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def raise_for_status(self):
+        if self.body is None:
+            raise IOError("404 Not Found")
+
+    def iter_content(self, chunk_size):
+        for i in range(0, len(self.body), chunk_size):
+            yield self.body[i:i + chunk_size]
+
+
+class _FakeSession:
+    def __init__(self, bodies, accept_ranges=False):
+        self.bodies = bodies
+        self.accept_ranges = accept_ranges
+        self.requested = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def get(self, url, headers=None, **kwargs):
+        self.requested.append(url)
+        return _FakeResponse(self.bodies[url], url, headers, self.accept_ranges)
+
+    def mount(self, prefix, adapter):
+        pass
+
+
+class _FakeGranule:
+    def __init__(self, *urls):
+        self.urls = list(urls)
+
+    def data_links(self, access=None):
+        return self.urls
+
+
+def test_search_cache_key():
+    """Test nearby searches share a cache key and different ones do not."""
+    temporal = ("2024-08-01", "2024-08-08")
+    key = _search_cache_key(5, {"short_name": "M2I1NXASM", "circle": (-46.63, -23.55, 5000), "temporal": temporal})
+    nearby = _search_cache_key(5, {"temporal": temporal, "circle": (-46.66, -23.52, 5000), "short_name": "M2I1NXASM"})
+
+    assert key == nearby
+    assert key != _search_cache_key(5, {"short_name": "M2I1NXASM", "circle": (-43.2, -22.9, 5000), "temporal": temporal})
+    assert key != _search_cache_key(3, {"short_name": "M2I1NXASM", "circle": (-46.63, -23.55, 5000), "temporal": temporal})
+
+
+def test_concurrent_authentication(monkeypatch, reset_earthdata_auth):
+    """Test concurrent callers share a single login attempt."""
+    attempts = []
+
+    def authenticate_once(self, method):
+        attempts.append(method)
+        time.sleep(0.05)
+        self.authenticated = EarthdataService._auth_successful = True
+
+    monkeypatch.setattr(EarthdataService, "_choose_next_auth_method", lambda self: "token")
+    monkeypatch.setattr(EarthdataService, "_authenticate_once", authenticate_once)
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        results = list(pool.map(lambda _: EarthdataService().ensure_authenticated(), range(4)))
+
+    assert results == [True] * 4
+    assert attempts == ["token"]
+
+
+def test_auth_backoff_doubles(reset_earthdata_auth):
+    """Test the login backoff doubles per failure, with a floor for locked accounts."""
+    def backoff_seconds():
+        return (EarthdataService._backoff_until - datetime.utcnow()).total_seconds()
+
+    EarthdataService._record_auth_failure(locked=False)
+    assert backoff_seconds() == pytest.approx(AUTH_BACKOFF_SECONDS, abs=5)
+    EarthdataService._record_auth_failure(locked=False)
+    assert backoff_seconds() == pytest.approx(2 * AUTH_BACKOFF_SECONDS, abs=5)
+
+    EarthdataService.reset_authentication()
+    EarthdataService._record_auth_failure(locked=True)
+    assert backoff_seconds() == pytest.approx(AUTH_LOCKED_BACKOFF_SECONDS, abs=5)
+
+
+def test_search_temporal():
+    """Test the CMR temporal filter is formatted once per day."""
+    start, end = _search_temporal(7)
+
+    assert end == datetime.utcnow().strftime("%Y-%m-%d")
+    assert (datetime.fromisoformat(end) - datetime.fromisoformat(start)).days == 7
+    assert _search_temporal(7) is _search_temporal(7)
+
+
+def test_merra2_weather_keeps_zero_values():
+    """Test zero MERRA-2 values are rounded rather than dropped as missing."""
+    weather = _merra2_weather({"T2M": 273.15, "U2M": 0.0, "V2M": 0.0, "QV2M": 0.0, "PS": 101325.0})
+
+    assert weather["temperature_celsius"] == 0.0
+    assert weather["wind_speed_ms"] == weather["wind_speed_kmh"] == 0.0
+    assert weather["humidity_percent"] == 0.0
+
+    weather = _merra2_weather({"T2M": 300.0, "U2M": None, "V2M": 1.0, "QV2M": None, "PS": None})
+    assert weather["wind_speed_ms"] is None and weather["pressure_pa"] is None
+
+
+def test_search_data_memory_cache(earthdata_service, monkeypatch):
+    """Test repeated searches are served from memory without calling CMR."""
+    calls = []
+
+    class FakeEarthaccess:
+        @staticmethod
+        def search_data(**kwargs):
+            calls.append(kwargs)
+            return ["granule"]
+
+    monkeypatch.setattr(earthdata, "_earthaccess", lambda: FakeEarthaccess)
+    monkeypatch.setattr(earthdata, "get_search_cache", lambda: None)
+
+    circle = (-46.63, -23.55, 5000)
+    temporal = ("2024-08-01", "2024-08-08")
+    first = earthdata_service.search_data(short_name="TEST_MEMORY_CACHE", circle=circle, temporal=temporal, count=3)
+    second = earthdata_service.search_data(short_name="TEST_MEMORY_CACHE", circle=circle, temporal=temporal, count=3)
+
+    assert first == second == ["granule"]
+    assert len(calls) == 1
+
+
+def test_product_search_snapped_to_grid(earthdata_service, monkeypatch):
+    """Test product searches use the centre of the grid cell, not the raw point."""
+    circles = []
+    monkeypatch.setattr(earthdata_service, "search_data", lambda **kwargs: circles.append(kwargs["circle"]) or [])
+
+    earthdata_service.get_imerg_data(-23.551, -46.633, radius_km=5.0, hours_back=13)
+    earthdata_service.get_merra2_data(-23.551, -46.633, radius_km=5.0, hours_back=13)
+
+    assert circles[0] == (-46.65, -23.55, 5000)
+    assert circles[1] == (-46.875, -23.5, 5000)
+
+
+def test_imerg_result_cache(earthdata_service, granule_download, monkeypatch):
+    """Test points in the same IMERG cell reuse the processed result."""
+    _, downloads = granule_download("3B-HHR-E.MS.MRG.3IMERG.nc4")
+    monkeypatch.setattr(earthdata_service, "search_data", lambda **kwargs: ["granule"])
+    monkeypatch.setattr(earthdata_service.netcdf_processor, "extract_first_available", lambda *args, **kwargs: 1.5)
+
+    first = earthdata_service.get_imerg_data(-23.551, -46.633, radius_km=5.0, hours_back=17)
+    second = earthdata_service.get_imerg_data(-23.559, -46.631, radius_km=5.0, hours_back=17)
+
+    assert len(downloads) == 1
+    assert second["precipitation_rate_mm_hr"] == first["precipitation_rate_mm_hr"] == 1.5
+    assert (second["latitude"], second["longitude"]) == (-23.559, -46.631)
+
+
+def test_merra2_result_cache(earthdata_service, granule_download, monkeypatch):
+    """Test points nearest the same MERRA-2 grid point share one result."""
+    granule_file, downloads = granule_download("MERRA2_400.inst1_2d_asm_Nx.nc4")
+    variables = {"T2M": 300.0, "U2M": 3.0, "V2M": 4.0, "QV2M": 0.01, "PS": 101325.0}
+    monkeypatch.setattr(earthdata_service, "search_data", lambda **kwargs: ["granule"])
+    monkeypatch.setattr(earthdata_service, "_extract_merra2_variables", lambda *args: variables)
+
+    # Both points are nearest the (-23.5, -46.875) grid point
+    first = earthdata_service.get_merra2_data(-23.3, -46.7, radius_km=5.0, hours_back=19)
+    second = earthdata_service.get_merra2_data(-23.7, -47.1, radius_km=5.0, hours_back=19)
+
+    assert len(downloads) == 1
+    assert first["wind_speed_ms"] == second["wind_speed_ms"] == 5.0
+    assert first["temperature_celsius"] == 26.85
+    assert first["file_processed"] == granule_file.name
+
+
+def test_warm_up(earthdata_service, monkeypatch):
+    """Test warm-up fetches every product for every configured location."""
+    calls = []
+    monkeypatch.setattr(earthdata_service, "get_imerg_data", lambda *args, **kwargs: calls.append(("imerg", args)) or {})
+    monkeypatch.setattr(earthdata_service, "get_merra2_data", lambda *args, **kwargs: calls.append(("merra2", args)) or None)
+
+    assert earthdata_service.warm_up([(-23.55, -46.63), (40.71, -74.01)]) == 2
+    assert sorted(calls) == [
+        ("imerg", (-23.55, -46.63, 5.0)), ("imerg", (40.71, -74.01, 5.0)),
+        ("merra2", (-23.55, -46.63, 5.0)), ("merra2", (40.71, -74.01, 5.0)),
+    ]
+    assert earthdata_service.warm_up([]) == 0
+
+
+def test_warm_up_stops(earthdata_service, monkeypatch):
+    """Test warm-up skips the fetches not yet started once stopped."""
+    stop = threading.Event()
+    calls = []
+
+    def fetch(*args, **kwargs):
+        calls.append(args)
+        stop.set()
+        return {}
+
+    monkeypatch.setattr(earthdata, "WARMUP_WORKERS", 1)
+    monkeypatch.setattr(earthdata_service, "get_imerg_data", fetch)
+    monkeypatch.setattr(earthdata_service, "get_merra2_data", fetch)
+
+    assert earthdata_service.warm_up([(-23.55, -46.63), (40.71, -74.01)], stop) == 1
+    assert len(calls) == 1
+
+
+def test_granule_value_cache(earthdata_service, granule_download, tmp_path, monkeypatch):
+    """Test values already extracted from a granule skip the download."""
+    granule_file, downloads = granule_download("3B-HHR-E.MS.MRG.3IMERG.nc4")
+    value_cache = DiskCache(str(tmp_path / "values.sqlite"))
+    monkeypatch.setattr(earthdata, "get_value_cache", lambda: value_cache)
+    monkeypatch.setattr(earthdata_service, "search_data", lambda **kwargs: [{"umm": {"GranuleUR": "3B-HHR-E.G1"}}])
+    monkeypatch.setattr(earthdata_service.netcdf_processor, "extract_first_available", lambda *args, **kwargs: 2.25)
+
+    # Different hours_back values miss the processed result cache
+    first = earthdata_service.get_imerg_data(12.5, 45.5, radius_km=5.0, hours_back=11)
+    second = earthdata_service.get_imerg_data(12.5, 45.5, radius_km=5.0, hours_back=13)
+    value_cache.close()
+
+    assert len(downloads) == 1
+    assert first["precipitation_rate_mm_hr"] == second["precipitation_rate_mm_hr"] == 2.25
+    assert second["file_processed"] == granule_file.name
+
+
+def test_opendap_extraction(earthdata_service, granule_download, no_value_cache, monkeypatch):
+    """Test OPeNDAP reads skip the download, falling back when they fail."""
+    url = "https://opendap.earthdata.nasa.gov/collections/C1/granules/3B-HHR-E.G2.HDF5"
+    granule = {"umm": {"GranuleUR": "3B-HHR-E.G2", "RelatedUrls": [
+        {"URL": "https://data.gesdisc.earthdata.nasa.gov/3B-HHR-E.G2.HDF5", "Type": "GET DATA"},
+        {"URL": url + ".html", "Type": "USE SERVICE API", "Subtype": "OPENDAP DATA"},
+    ]}}
+    granule_file, downloads = granule_download("3B-HHR-E.G2.HDF5")
+    monkeypatch.setattr(earthdata.settings, "earthdata_opendap", True)
+
+    assert _opendap_url(granule) == url
+    assert earthdata_service._extract_latest(["older", granule], "IMERG", 0.0, 0.0, lambda path: 1.0) == ("3B-HHR-E.G2.HDF5", 1.0)
+    assert downloads == []
+
+    def extract(path):
+        return None if path == url else 2.0
+
+    assert earthdata_service._extract_latest(["older", granule], "IMERG", 0.0, 0.0, extract) == (granule_file.name, 2.0)
+    assert downloads == [[granule]]
+
+
+def test_streamed_extraction(earthdata_service, no_value_cache, monkeypatch):
+    """Test granules opened with earthaccess.open are read without a download."""
+    class _RemoteFile(io.BytesIO):
+        path = "data.gesdisc.earthdata.nasa.gov/MERRA2_400.inst1_2d_asm_Nx.20240101.nc4"
+
+    opened = []
+    fake_earthaccess = type("fake_earthaccess", (), {
+        "open": staticmethod(lambda granules: opened.append(_RemoteFile()) or opened[-1:])
+    })
+    granule = {"umm": {"GranuleUR": "MERRA2_400.inst1_2d_asm_Nx.20240101.nc4"}}
+    downloads = []
+
+    monkeypatch.setattr(earthdata.settings, "earthdata_stream", True)
+    monkeypatch.setattr(earthdata, "HAS_H5NETCDF", True)
+    monkeypatch.setattr(earthdata, "_earthaccess", lambda: fake_earthaccess)
+    monkeypatch.setattr(earthdata_service, "download_granules", lambda granules: downloads.append(granules) or [])
+
+    extracted = earthdata_service._extract_latest([granule], "MERRA-2", 0.0, 0.0, lambda f: {"T2M": 300.0})
+    assert extracted == ("MERRA2_400.inst1_2d_asm_Nx.20240101.nc4", {"T2M": 300.0})
+    assert downloads == [] and opened[0].closed
+
+
+def test_s3_direct_access(monkeypatch):
+    """Test only cloud-hosted granules are read from S3, and only in region."""
+    class _Granule(dict):
+        cloud_hosted = True
+
+    store = type("store", (), {"in_region": True})()
+    monkeypatch.setattr(earthdata, "_earthaccess", lambda: type("fake_earthaccess", (), {"__store__": store}))
+
+    assert _s3_direct_access(_Granule())
+    assert not _s3_direct_access({"umm": {}})
+    store.in_region = False
+    assert not _s3_direct_access(_Granule())
+
+
+def test_download_granules_parallel(earthdata_session, tmp_path):
+    """Test granules and plain URLs download over one session, skipping failures."""
+    (tmp_path / "cached.nc4").write_bytes(b"cached")
+    session = _FakeSession({
+        "https://daac.test/a.nc4": b"aaa",
+        "https://daac.test/missing.nc4": None,
+        "https://daac.test/b.nc4": b"bbb",
+    })
+
+    files = earthdata_session(session).download_granules(
+        [
+            _FakeGranule("https://daac.test/a.nc4"),
+            _FakeGranule("https://daac.test/missing.nc4", "https://daac.test/cached.nc4"),
+            "https://daac.test/b.nc4",
+        ],
+        download_dir=str(tmp_path)
+    )
+
+    assert [os.path.basename(f) for f in files] == ["a.nc4", "cached.nc4", "b.nc4"]
+    assert (tmp_path / "b.nc4").read_bytes() == b"bbb"
+    assert "https://daac.test/cached.nc4" not in session.requested
+    assert not list(tmp_path.glob("*.partial*"))
+
+
+def test_prune_download_dir(tmp_path):
+    """Test the least recently used granules are evicted beyond the budget."""
+    for age, name in enumerate(["new.nc4", "used.nc4", "old.nc4"]):
+        path = tmp_path / name
+        path.write_bytes(b"x" * 100)
+        os.utime(path, (time.time() - age * 60, time.time() - age * 60))
+    (tmp_path / "cmr_search.sqlite").write_bytes(b"x" * 500)
+    (tmp_path / "big.nc4.partial").write_bytes(b"x" * 500)
+
+    _prune_download_dir(str(tmp_path), 200)
+
+    assert sorted(p.name for p in tmp_path.iterdir()) == [
+        "big.nc4.partial", "cmr_search.sqlite", "new.nc4", "used.nc4"
+    ]
+
+
+@pytest.mark.parametrize("accept_ranges", [True, False])
+def test_download_granules_multipart(earthdata_session, tmp_path, monkeypatch, accept_ranges):
+    """Test large files are fetched as byte ranges when the server allows it."""
+    monkeypatch.setattr(earthdata, "MULTIPART_MIN_BYTES", 100)
+    monkeypatch.setattr(earthdata, "MULTIPART_PART_BYTES", 64)
+    body = bytes(range(256)) * 2
+    session = _FakeSession({"https://daac.test/big.nc4": body}, accept_ranges=accept_ranges)
+
+    files = earthdata_session(session).download_granules(
+        [_FakeGranule("https://daac.test/big.nc4")], download_dir=str(tmp_path)
+    )
+
+    assert (tmp_path / "big.nc4").read_bytes() == body
+    assert len(files) == 1
+    assert len(session.requested) == (1 + len(body) // 64 if accept_ranges else 1)
+
+
+def test_download_granules_resume(earthdata_session, tmp_path):
+    """Test an interrupted download resumes with Range and If-Range."""
+    body = b"0123456789" * 10
+    requests_seen = []
+
+    class FlakyResponse(_FakeResponse):
+        def iter_content(self, chunk_size):
+            yield self.body[:40]
+            raise requests.exceptions.ChunkedEncodingError("connection reset")
+
+    class FlakySession(_FakeSession):
+        def get(self, url, headers=None, **kwargs):
+            requests_seen.append(dict(headers or {}))
+            if len(requests_seen) == 1:
+                response = FlakyResponse(body, url)
+            else:
+                response = _FakeResponse(body, url, headers, accept_ranges=True)
+            response.headers["ETag"] = '"v1"'
+            return response
+
+    files = earthdata_session(FlakySession({})).download_granules(
+        [_FakeGranule("https://daac.test/flaky.nc4")], download_dir=str(tmp_path)
+    )
+
+    assert len(files) == 1
+    assert (tmp_path / "flaky.nc4").read_bytes() == body
+    assert requests_seen[1] == {"Range": "bytes=40-", "If-Range": '"v1"'}
+    assert not list(tmp_path.glob("*.partial*"))
+
+
+def test_download_granules_checksum(earthdata_session, tmp_path):
+    """Test downloads are checked against the granule's UMM checksums."""
+    class DictGranule(dict):
+        def data_links(self, access=None):
+            return [item["url"] for item in self["files"]]
+
+    def granule(name, body):
+        return DictGranule(
+            files=[{"url": f"https://daac.test/{name}"}],
+            umm={"DataGranule": {"ArchiveAndDistributionInformation": [{
+                "Name": name,
+                "SizeInBytes": len(body),
+                "Checksum": {"Value": hashlib.md5(body).hexdigest(), "Algorithm": "MD5"},
+            }]}}
+        )
+
+    session = _FakeSession({
+        "https://daac.test/good.nc4": b"good data",
+        "https://daac.test/corrupt.nc4": b"bad! data",
+    })
+
+    files = earthdata_session(session).download_granules(
+        [granule("good.nc4", b"good data"), granule("corrupt.nc4", b"good data")],
+        download_dir=str(tmp_path)
+    )
+
+    assert [os.path.basename(f) for f in files] == ["good.nc4"]
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["good.nc4"]
@@ -0,0 +1,91 @@
+"""Tests for the NASA FIRMS service."""
+
+import asyncio
+
+import httpx
+import pytest
+
+from app.services.firms import FIRMSService
+
+FIRE_CSV_HEADER = "latitude,longitude,brightness,confidence,frp\n"
+
+
+def test_firms_csv_parsing():
+    """Test FIRMS CSV rows are parsed and tagged with their source."""
+    body = (
+        "latitude,longitude,brightness,confidence,acq_date,frp\n"
+        "-10.5,-50.25,330.1,h,2024-08-01,12.5\n"
+        "bad,row\n"
+        "\n"
+        "-10.6,-50.30,310.0,n,2024-08-02,3.0\n"
+    )
+    transport = httpx.MockTransport(lambda request: httpx.Response(200, text=body))
+
+    async def fetch():
+        async with httpx.AsyncClient(transport=transport) as client:
+            return await FIRMSService(client)._fetch_csv("https://firms.test/area", "MODIS_NRT")
+
+    fires = asyncio.run(fetch())
+
+    assert [fire["latitude"] for fire in fires] == [-10.5, -10.6]
+    assert fires[0]["brightness"] == 330.1
+    assert all(fire["satellite_source"] == "MODIS_NRT" for fire in fires)
+
+
+def test_firms_sources_fetched_concurrently(fetch_fires):
+    """Test FIRMS sources are requested at the same time and combined."""
+    in_flight = []
+    peak = []
+
+    async def handler(request):
+        in_flight.append(request)
+        peak.append(len(in_flight))
+        await asyncio.sleep(0.05)
+        in_flight.remove(request)
+        latitude = "-10.5" if "MODIS" in request.url.path else "-12.5"
+        return httpx.Response(200, text=f"{FIRE_CSV_HEADER}{latitude},-50.25,330.1,h,12.5\n")
+
+    result = fetch_fires(handler)
+
+    assert max(peak) == 2
+    assert result["count"] == 2
+    assert {fire["satellite_source"] for fire in result["fires"]} == {"VIIRS_SNPP_NRT", "MODIS_NRT"}
+
+
+def test_firms_partial_source_failure(fetch_fires):
+    """Test one failing FIRMS source keeps the other's fires; all failing raises."""
+    def handler(request):
+        if "VIIRS" in request.url.path:
+            return httpx.Response(503)
+        return httpx.Response(200, text=f"{FIRE_CSV_HEADER}-10.5,-50.25,330.1,h,12.5\n")
+
+    result = fetch_fires(handler)
+    assert result["count"] == 1
+    assert result["fires"][0]["satellite_source"] == "MODIS_NRT"
+
+    with pytest.raises(httpx.HTTPStatusError):
+        fetch_fires(lambda request: httpx.Response(503))
+
+
+def test_firms_deduplicate_fires():
+    """Test nearby detections collapse to the brightest one of each group."""
+    service = FIRMSService(client=object())
+    fires = [
+        {"latitude": -10.0, "longitude": -50.0, "brightness": 310.0, "id": "a"},
+        {"latitude": -10.005, "longitude": -50.0, "brightness": 340.0, "id": "b"},
+        {"latitude": -10.01, "longitude": -50.0, "brightness": 300.0, "id": "c"},
+        {"latitude": -11.0, "longitude": -50.0, "brightness": 320.0, "id": "d"},
+        {"latitude": -11.0, "longitude": -50.0, "brightness": 320.0, "id": "e"},
+    ]
+
+    unique = service._deduplicate_fires(fires)
+
+    assert [fire["id"] for fire in unique] == ["b", "d"]
+    assert service._deduplicate_fires([]) == []
+
+    # 0.02 degrees of longitude is ~0.76 km at 70 degrees north
+    arctic = [
+        {"latitude": 70.0, "longitude": 20.0, "brightness": 300.0},
+        {"latitude": 70.0, "longitude": 20.02, "brightness": 305.0},
+    ]
+    assert service._deduplicate_fires(arctic) == arctic[1:]
@@ -0,0 +1,22 @@
+"""Tests for the NASA GIBS service."""
+
+from app.services.gibs import GIBSService
+
+
+def test_gibs_image_url_without_capabilities(monkeypatch):
+    """Test image URLs are built without fetching the WMS capabilities."""
+    connects = []
+    monkeypatch.setattr("app.services.gibs.WebMapService", lambda *args, **kwargs: connects.append(args))
+
+    service = GIBSService()
+    url = service.get_image_url("MODIS_Terra_CorrectedReflectance_TrueColor", (-47.0, -24.0, -46.0, -23.0), date="2024-08-01")
+
+    assert url.startswith(GIBSService.WMS_ENDPOINTS["epsg4326"] + "?")
+    assert "LAYERS=MODIS_Terra_CorrectedReflectance_TrueColor" in url
+    assert "BBOX=-47.0%2C-24.0%2C-46.0%2C-23.0" in url and "FORMAT=image%2Fpng" in url
+    assert "SRS=EPSG4326" in url and "TIME=2024-08-01" in url
+    assert connects == []
+
+    service.get_available_layers()
+    service.get_available_layers()
+    assert len(connects) == 1
@@ -0,0 +1,54 @@
+"""Tests for the NetCDF and HDF5 processors."""
+
+import numpy as np
+
+from app.utils.netcdf_processor import HDF5Processor, NetCDFProcessor
+
+
+def test_extract_first_available(tmp_path):
+    """Test the first candidate variable present in the file is extracted."""
+    import xarray as xr
+
+    path = str(tmp_path / "imerg.nc4")
+    xr.Dataset(
+        {"precipitation": (("lat", "lon"), np.array([[1.0, 2.0], [3.0, 4.0]]))},
+        coords={"lat": [-23.6, -23.5], "lon": [-46.7, -46.6]},
+    ).to_netcdf(path)
+
+    processor = NetCDFProcessor()
+    assert processor.extract_first_available(
+        path, ["precipitationCal", "precipitation"], -23.51, -46.61
+    ) == 4.0
+    assert processor.extract_first_available(path, ["precipitationCal"], -23.51, -46.61) is None
+
+
+def test_extract_multiple_variables(tmp_path):
+    """Test several variables are read in one pass, taking the latest time step."""
+    import xarray as xr
+
+    path = str(tmp_path / "merra2.nc4")
+    t2m = np.array([[[280.0]], [[290.0]]])
+    xr.Dataset(
+        {"T2M": (("time", "lat", "lon"), t2m), "PS": (("time", "lat", "lon"), t2m * 350)},
+        coords={"time": [0, 1], "lat": [-23.5], "lon": [-46.875]},
+    ).to_netcdf(path)
+
+    values = NetCDFProcessor().extract_multiple_variables(path, ["T2M", "PS", "U2M"], -23.55, -46.63)
+    assert values == {"T2M": 290.0, "PS": 101500.0, "U2M": None}
+
+
+def test_hdf5_extract_variables(tmp_path):
+    """Test HDF5 variables are read at the nearest point in one pass."""
+    import h5py
+
+    path = str(tmp_path / "merra2.h5")
+    with h5py.File(path, "w") as f:
+        f["lat"] = np.array([-24.0, -23.5])
+        f["lon"] = np.array([-47.5, -46.875])
+        f["T2M"] = np.array([[[280.0, 281.0], [282.0, 283.0]], [[290.0, 291.0], [292.0, 293.0]]])
+        f["PS"] = np.array([[100000.0, 100100.0], [100200.0, np.nan]])
+
+    processor = HDF5Processor()
+    values = processor.extract_variables(path, ["T2M", "PS", "U2M"], -23.55, -46.63)
+    assert values == {"T2M": 293.0, "PS": None, "U2M": None}
+    assert processor.extract_variable(path, "T2M", -24.0, -47.5) == 290.0
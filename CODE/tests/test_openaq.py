@@ -0,0 +1,16 @@
+"""Tests for the OpenAQ service."""
+
+from app.services.openaq import OpenAQService
+
+
+def test_calculate_aqi():
+    """Test AQI categories at the inclusive breakpoints."""
+    service = OpenAQService()
+
+    assert service.calculate_aqi("pm25", 0) == "good"
+    assert service.calculate_aqi("pm25", 12) == "good"
+    assert service.calculate_aqi("pm25", 12.1) == "moderate"
+    assert service.calculate_aqi("pm25", 35.4) == "moderate"
+    assert service.calculate_aqi("pm25", 300) == "hazardous"
+    assert service.calculate_aqi("no2", 100) == "moderate"
+    assert service.calculate_aqi("co", 1.0) == "unknown"
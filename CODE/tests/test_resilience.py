@@ -0,0 +1,147 @@
+"""Tests for the upstream resilience helpers."""
+
+import asyncio
+import time
+
+import httpx
+import pytest
+import requests
+
+from app.utils.resilience import (
+    Bulkhead,
+    BulkheadFullError,
+    CircuitBreaker,
+    CircuitOpenError,
+    SingleFlight,
+    TokenBucket,
+    is_upstream_failure,
+    retry_async
+)
+
+
+def test_circuit_breaker():
+    """Test circuit breaker opens on upstream failures and recovers."""
+    breaker = CircuitBreaker("test", fail_max=2, reset_timeout=0.05)
+
+    for _ in range(2):
+        with pytest.raises(httpx.ConnectError):
+            with breaker:
+                raise httpx.ConnectError("down")
+    assert breaker.state == "open"
+
+    with pytest.raises(CircuitOpenError):
+        with breaker:
+            pass
+
+    time.sleep(0.06)
+    with breaker:
+        pass
+    assert breaker.state == "closed"
+
+    # Client errors do not count against the upstream
+    request = httpx.Request("GET", "https://example.com")
+    for _ in range(3):
+        with pytest.raises(httpx.HTTPStatusError):
+            with breaker:
+                raise httpx.HTTPStatusError(
+                    "not found", request=request, response=httpx.Response(404, request=request)
+                )
+    assert breaker.state == "closed"
+
+
+def test_is_upstream_failure():
+    """Test requests errors are classified like httpx ones, even when wrapped."""
+    def http_error(status):
+        response = requests.Response()
+        response.status_code = status
+        return requests.exceptions.HTTPError(response=response)
+
+    assert is_upstream_failure(requests.exceptions.ConnectionError("refused"))
+    assert is_upstream_failure(requests.exceptions.ReadTimeout("slow"))
+    assert is_upstream_failure(http_error(503))
+    assert not is_upstream_failure(http_error(404))
+    assert not is_upstream_failure(ValueError("bad value"))
+
+    try:
+        raise RuntimeError("CMR error") from http_error(502)
+    except RuntimeError as e:
+        assert is_upstream_failure(e)
+
+
+def test_retry_async():
+    """Test transient errors are retried up to the attempt limit."""
+    calls = []
+
+    async def flaky():
+        calls.append(1)
+        if len(calls) < 3:
+            raise httpx.ConnectError("transient")
+        return "ok"
+
+    assert asyncio.run(retry_async(flaky, initial_delay=0.001)) == "ok"
+    assert len(calls) == 3
+
+    calls.clear()
+    with pytest.raises(httpx.ConnectError):
+        asyncio.run(retry_async(flaky, attempts=2, initial_delay=0.001))
+    assert len(calls) == 2
+
+
+def test_bulkhead():
+    """Test bulkhead rejects callers once its slots stay taken."""
+    async def scenario():
+        bulkhead = Bulkhead("test", 1, max_wait=0.01)
+        async with bulkhead:
+            with pytest.raises(BulkheadFullError):
+                async with bulkhead:
+                    pass
+        async with bulkhead:
+            pass
+
+    asyncio.run(scenario())
+
+
+def test_single_flight():
+    """Test concurrent identical calls share one execution."""
+    calls = []
+
+    async def fetch(value):
+        calls.append(value)
+        await asyncio.sleep(0.01)
+        return value * 2
+
+    async def scenario():
+        flight = SingleFlight()
+        results = await asyncio.gather(*(flight.do("key", fetch, 21) for _ in range(5)))
+        assert results == [42] * 5
+        assert await flight.do("key", fetch, 1) == 2
+
+    asyncio.run(scenario())
+    assert calls == [21, 1]
+
+
+def test_token_bucket(monkeypatch):
+    """Test the token bucket allows a burst, then paces callers."""
+    now = [1000.0]
+    sleeps = []
+
+    def fake_sleep(seconds):
+        sleeps.append(seconds)
+        now[0] += seconds
+
+    monkeypatch.setattr(time, "monotonic", lambda: now[0])
+    monkeypatch.setattr(time, "sleep", fake_sleep)
+
+    bucket = TokenBucket(rate=50, capacity=2)
+    for _ in range(4):
+        bucket.acquire()
+
+    # Two tokens from the burst, two more at 50/s
+    assert sleeps == [pytest.approx(0.02), pytest.approx(0.02)]
+
+    # Non-blocking callers are turned away until a token refills
+    bucket = TokenBucket(rate=0.1, capacity=1)
+    assert bucket.try_acquire()
+    assert not bucket.try_acquire()
+    now[0] += 10
+    assert bucket.try_acquire()
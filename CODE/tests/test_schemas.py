@@ -0,0 +1,15 @@
+"""Tests for the API schemas."""
+
+from app.models.schemas import WeatherData, WindData
+
+
+def test_weather_derived_fields():
+    """Test derived units are computed on serialization."""
+    weather = WeatherData(
+        temperature_celsius=20,
+        wind=WindData(speed_m_s=10, direction_degrees=90, direction_cardinal="E")
+    )
+    data = weather.model_dump()
+    assert data["temperature_fahrenheit"] == 68
+    assert data["wind"]["speed_km_h"] == 36
+    assert WeatherData().model_dump()["temperature_fahrenheit"] is None
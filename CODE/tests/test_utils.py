@@ -2,8 +2,12 @@
 
 import pytest
 import math
+import time
+import numpy as np
 from app.utils.geo_utils import (
     haversine_distance,
+    haversine_vector,
+    haversine_distance_from_precomputed,
     calculate_bounding_box,
     wind_components_to_speed_direction,
     direction_to_cardinal,
@@ -12,6 +16,7 @@ from app.utils.geo_utils import (
     meters_per_second_to_kmh,
     categorize_uv_index
 )
+from app.utils.time_utils import seconds_until_utc_midnight, utc_now_iso
 
 
 def test_haversine_distance():
@@ -32,6 +37,40 @@ def test_haversine_distance_same_point():
     assert distance == 0
 
 
+def test_haversine_vector():
+    """Test vectorized haversine matches the scalar version."""
+    lats = np.array([51.5074, 40.7128, -27.5954])
+    lons = np.array([-0.1278, -74.0060, -48.5480])
+    distances = haversine_vector(40.7128, -74.0060, lats, lons)
+    
+    assert distances.dtype == np.float32
+    for lat, lon, distance in zip(lats, lons, distances):
+        assert abs(distance - haversine_distance(40.7128, -74.0060, lat, lon)) < 0.01
+    assert distances[1] == 0
+
+
+def test_haversine_distance_from_precomputed():
+    """Test the precomputed-origin haversine matches the plain version."""
+    phi1 = math.radians(40.7128)
+    lam1 = math.radians(-74.0060)
+    cos_phi1 = math.cos(phi1)
+    
+    for lat, lon in [(51.5074, -0.1278), (-27.5954, -48.5480), (40.7128, -74.0060)]:
+        distance = haversine_distance_from_precomputed(phi1, lam1, cos_phi1, lat, lon)
+        assert abs(distance - haversine_distance(40.7128, -74.0060, lat, lon)) < 1e-6
+
+
+def test_haversine_vector_float32_error():
+    """Test float32 distances stay within 10 m of float64 at search scales."""
+    rng = np.random.default_rng(0)
+    lats = (-23.55 + rng.uniform(-5, 5, 1000)).astype(np.float32)
+    lons = (-46.63 + rng.uniform(-5, 5, 1000)).astype(np.float32)
+    distances = haversine_vector(-23.55, -46.63, lats, lons)
+    
+    expected = [haversine_distance(-23.55, -46.63, float(lat), float(lon)) for lat, lon in zip(lats, lons)]
+    assert np.max(np.abs(distances - expected)) < 0.01
+
+
 def test_calculate_bounding_box():
     """Test bounding box calculation."""
     lat, lon = 0, 0
@@ -41,6 +80,11 @@ def test_calculate_bounding_box():
     
     assert min_lat < lat < max_lat
     assert min_lon < lon < max_lon
+    
+    # Longitude spans widen with 1/cos(latitude) and stay finite at the poles
+    min_lon_60, _, max_lon_60, _ = calculate_bounding_box(60, 0, radius)
+    assert (max_lon_60 - min_lon_60) == pytest.approx(2 * (max_lon - min_lon))
+    assert all(math.isfinite(v) for v in calculate_bounding_box(90, 0, radius))
 
 
 def test_wind_components_to_speed_direction():
@@ -104,3 +148,27 @@ def test_categorize_uv_index():
     
     category, _ = categorize_uv_index(12)
     assert category == "extreme"
+
+
+def test_utc_now_iso(monkeypatch):
+    """Test cached ISO timestamp formatting."""
+    now = [1_700_000_000.25]
+    monkeypatch.setattr(time, "time", lambda: now[0])
+    
+    timestamp = utc_now_iso()
+    assert timestamp == "2023-11-14T22:13:20Z"
+    
+    now[0] += 0.5
+    assert utc_now_iso() is timestamp
+    
+    now[0] += 1
+    assert utc_now_iso() == "2023-11-14T22:13:21Z"
+
+
+def test_seconds_until_utc_midnight(monkeypatch):
+    """Test the time left in the UTC day."""
+    monkeypatch.setattr(time, "time", lambda: 86400 * 19000 + 3600.5)
+    assert seconds_until_utc_midnight() == 86400 - 3600.5
+    
+    monkeypatch.setattr(time, "time", lambda: 86400 * 19000)
+    assert seconds_until_utc_midnight() == 86400